@@ -1,3 +1,5 @@
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from typing import Optional
 
@@ -7,15 +9,13 @@ def create_app(testing: bool = False) -> FastAPI:
     Application factory pattern - creates and configures the FastAPI app
 
     Args:
-        testing: If True, skips database initialization for tests
-    """
-    # Create FastAPI instance
-    app = FastAPI(
-        title="TMHCC Underwriting Policy Management API",
-        description="API for managing insurance policies with web interface",
-        version="1.0.0",
-    )
+        testing: If True, skips database initialization and background tasks for tests
 
+    Startup never seeds or deletes data: init_db() only brings the schema up to
+    date, and costs two queries once it is. Modules with heavy imports (NumPy)
+    are loaded on first use. The time taken is kept in app.state.startup_seconds.
+    """
+    started = time.perf_counter()
     from .config import get_settings
     from .middleware import setup_middleware
     from .static_files import setup_static_files
@@ -23,6 +23,28 @@ def create_app(testing: bool = False) -> FastAPI:
     # Setup configuration
     settings = get_settings()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Start the expiry sweeper with the server and stop it on shutdown
+        sweeper = None
+        if settings.sweeper_enabled and not testing:
+            from .dependencies import get_expiry_sweeper
+            from ..infrastructure.db import SessionLocal
+
+            sweeper = get_expiry_sweeper()
+            sweeper.start(SessionLocal)
+        yield
+        if sweeper is not None:
+            await sweeper.stop()
+
+    # Create FastAPI instance
+    app = FastAPI(
+        title="TMHCC Underwriting Policy Management API",
+        description="API for managing insurance policies with web interface",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+
     # Setup middleware (CORS, etc.)
     setup_middleware(app)
 
@@ -39,10 +61,19 @@ def create_app(testing: bool = False) -> FastAPI:
     from .routes.health import router as health_router
     from .routes.frontend import router as frontend_router
     from .routes.policies import router as policies_router
+    from .routes.analytics import router as analytics_router
 
     # Register all routes
     app.include_router(health_router, tags=["health"])
     app.include_router(frontend_router)  # /policies
     app.include_router(policies_router)  # /api/v1/policies
+    app.include_router(analytics_router)  # /api/v1/analytics
+
+    # Serve the policy routes from AsyncSession when configured
+    if settings.async_db:
+        from .dependencies import get_policy_service, get_async_policy_service
+
+        app.dependency_overrides[get_policy_service] = get_async_policy_service
 
+    app.state.startup_seconds = time.perf_counter() - started
     return app
@@ -7,6 +7,99 @@ class Settings:
     debug: bool = os.getenv("DEBUG", "False").lower() == "true"
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./policies.db")
 
+    # Connection pool (ignored for in-memory SQLite)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    db_connect_timeout: int = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+
+    # SQLite pragmas applied to every new connection
+    sqlite_journal_mode: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    sqlite_synchronous: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    sqlite_busy_timeout_ms: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    sqlite_cache_size_kib: int = int(os.getenv("SQLITE_CACHE_SIZE_KIB", "65536"))
+    sqlite_mmap_size: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+    # Read-through cache for single-policy lookups (per process, opt-in)
+    policy_cache_enabled: bool = (
+        os.getenv("POLICY_CACHE_ENABLED", "False").lower() == "true"
+    )
+    policy_cache_max_entries: int = int(os.getenv("POLICY_CACHE_MAX_ENTRIES", "10000"))
+    policy_cache_ttl: float = float(os.getenv("POLICY_CACHE_TTL", "60"))
+    policy_cache_negative_ttl: float = float(
+        os.getenv("POLICY_CACHE_NEGATIVE_TTL", "5")
+    )
+
+    # List ETags always follow the book version; the response cache that also
+    # replays list bodies is opt-in. The book version only sees writes made
+    # through this process, so list ETags and cached bodies also expire after
+    # the TTL (other workers, bulk loads, seeding)
+    response_cache_enabled: bool = (
+        os.getenv("RESPONSE_CACHE_ENABLED", "False").lower() == "true"
+    )
+    response_cache_max_entries: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256")
+    )
+    response_cache_ttl: float = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+
+    # Serve policy routes from AsyncSession instead of the threadpool-bound sync Session
+    async_db: bool = os.getenv("ASYNC_DB", "False").lower() == "true"
+
+    # Policy listing pagination
+    default_page_size: int = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+    max_page_size: int = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+    # Background sweeper moving lapsed policies to inactive. Its lock is per
+    # process, so enable it in one worker only (or call /sweep-expired from cron)
+    sweeper_enabled: bool = os.getenv("SWEEPER_ENABLED", "False").lower() == "true"
+    sweeper_interval_seconds: float = float(
+        os.getenv("SWEEPER_INTERVAL_SECONDS", "300")
+    )
+    sweeper_batch_size: int = int(os.getenv("SWEEPER_BATCH_SIZE", "1000"))
+    sweeper_lapse_pending: bool = (
+        os.getenv("SWEEPER_LAPSE_PENDING", "False").lower() == "true"
+    )
+
+    # Columnar snapshot behind the analytics endpoints; reloaded when the book
+    # version changes, or after this many seconds to pick up other processes' writes
+    analytics_snapshot_max_age: float = float(
+        os.getenv("ANALYTICS_SNAPSHOT_MAX_AGE", "300")
+    )
+
+    # Gzip for responses of at least COMPRESSION_MIN_SIZE bytes when the client
+    # accepts it; responses that already carry a Content-Encoding are left alone
+    compression_enabled: bool = (
+        os.getenv("COMPRESSION_ENABLED", "True").lower() == "true"
+    )
+    compression_min_size: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    compression_level: int = int(os.getenv("COMPRESSION_LEVEL", "6"))
+
+    # Request latency/size/SQL metrics served at /metrics in Prometheus text format
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+
+    # Opt-in SQL profiler: logs statements slower than QUERY_SLOW_MS and statement
+    # shapes repeated QUERY_REPEAT_THRESHOLD times within one request (N+1)
+    query_profiler_enabled: bool = (
+        os.getenv("QUERY_PROFILER_ENABLED", "False").lower() == "true"
+    )
+    query_slow_ms: float = float(os.getenv("QUERY_SLOW_MS", "100"))
+    query_repeat_threshold: int = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+    query_log_parameters: bool = (
+        os.getenv("QUERY_LOG_PARAMETERS", "True").lower() == "true"
+    )
+
+    # /health/ready reuses its last probe for this long, so frequent probes cost
+    # one DB ping per interval; a sweeper overdue by more than the lag is degraded
+    readiness_cache_seconds: float = float(os.getenv("READINESS_CACHE_SECONDS", "2"))
+    readiness_max_sweeper_lag_seconds: float = float(
+        os.getenv("READINESS_MAX_SWEEPER_LAG_SECONDS", "900")
+    )
+
+    # Largest number of items accepted by a batch endpoint
+    max_batch_size: int = int(os.getenv("MAX_BATCH_SIZE", "5000"))
+
     current_dir: Path = Path(__file__).parent
     static_dir: Path = current_dir / "static"
     templates_dir: Path = current_dir / "templates"
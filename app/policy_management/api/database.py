@@ -1,8 +1,11 @@
-from ..infrastructure.db import seed_initial_data
+from ..infrastructure.db import initialize_database
 
 
 def init_db():
-    """Initialize database tables and seed data on startup"""
-    print("Starting up application...")
-    seed_initial_data()
-    print("Database initialized with sample data!")
+    """Bring the database schema and lookup tables up to date on startup
+
+    Existing data is never removed; sample policies are seeded separately
+    with scripts/seed_sample_data.py.
+    """
+    if initialize_database():
+        print("Database initialized")
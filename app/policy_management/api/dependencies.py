@@ -1,19 +1,159 @@
+import inspect
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from ..infrastructure import db
 from sqlalchemy.orm import Session
 from ..infrastructure.policy_repository import SQLPolicyRepository
-from ..application.policy_services import PolicyService
+from ..infrastructure.expiry_sweeper import ExpirySweeper
+from ..infrastructure.query_profiler import QueryProfiler
+from ..infrastructure.policy_cache import (
+    AsyncCachedPolicyRepository,
+    CachedPolicyRepository,
+    PolicyCache,
+)
+from ..application.analytics import PolicyAnalyticsService
+from ..application.policy_services import AsyncPolicyService, PolicyService
+from .config import get_settings
+from .http_cache import ResponseCache
+from .readiness import ReadinessProbe
 
 """Dependency injection functions for FastAPI routes"""
 
+if TYPE_CHECKING:
+    from ..infrastructure.policy_snapshot import PolicySnapshotStore
+
+
+@lru_cache(maxsize=None)
+def get_policy_cache() -> PolicyCache | None:
+    """Process-wide policy cache, or None when caching is disabled"""
+    settings = get_settings()
+    if not settings.policy_cache_enabled:
+        return None
+    return PolicyCache(
+        max_entries=settings.policy_cache_max_entries,
+        ttl=settings.policy_cache_ttl,
+        negative_ttl=settings.policy_cache_negative_ttl,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide response cache, or None when disabled"""
+    settings = get_settings()
+    if not settings.response_cache_enabled:
+        return None
+    return ResponseCache(
+        max_entries=settings.response_cache_max_entries, ttl=settings.response_cache_ttl
+    )
+
+
+@lru_cache(maxsize=None)
+def get_expiry_sweeper() -> ExpirySweeper:
+    """Process-wide expiry sweeper; its set-based updates bypass the policy cache,
+    so the cache is cleared whenever a batch moves any rows"""
+    settings = get_settings()
+    cache = get_policy_cache()
+    return ExpirySweeper(
+        batch_size=settings.sweeper_batch_size,
+        interval=settings.sweeper_interval_seconds,
+        lapse_pending=settings.sweeper_lapse_pending,
+        on_change=cache.clear if cache is not None else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_query_profiler() -> QueryProfiler | None:
+    """Process-wide SQL profiler, or None when profiling is disabled"""
+    settings = get_settings()
+    if not settings.query_profiler_enabled:
+        return None
+    return QueryProfiler(
+        slow_threshold=settings.query_slow_ms / 1000,
+        repeat_threshold=settings.query_repeat_threshold,
+        log_parameters=settings.query_log_parameters,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_readiness_probe() -> ReadinessProbe:
+    """Process-wide readiness probe over the application engines"""
+    settings = get_settings()
+    caches = {
+        name: cache.snapshot
+        for name, cache in (
+            ("policy_cache", get_policy_cache()),
+            ("response_cache", get_response_cache()),
+        )
+        if cache is not None
+    }
+    return ReadinessProbe(
+        db.engine,
+        async_bind=db.get_async_engine() if settings.async_db else None,
+        ttl=settings.readiness_cache_seconds,
+        sweeper=get_expiry_sweeper() if settings.sweeper_enabled else None,
+        max_sweeper_lag=settings.readiness_max_sweeper_lag_seconds,
+        caches=caches,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_snapshot_store() -> "PolicySnapshotStore":
+    """Process-wide holder of the columnar policy book snapshot"""
+    # Imported on first use so NumPy stays out of application startup
+    from ..infrastructure.policy_snapshot import PolicySnapshotStore
+
+    return PolicySnapshotStore(max_age=get_settings().analytics_snapshot_max_age)
+
+
+def get_analytics_service(
+    db_session: Session = Depends(db.get_db),
+    store: "PolicySnapshotStore" = Depends(get_snapshot_store),
+) -> PolicyAnalyticsService:
+    return PolicyAnalyticsService(lambda: store.get(db_session))
+
 
 def get_policy_repository(
     db_session: Session = Depends(db.get_db),
-) -> SQLPolicyRepository:
-    return SQLPolicyRepository(db_session)
+    cache: PolicyCache | None = Depends(get_policy_cache),
+):
+    repository = SQLPolicyRepository(db_session)
+    if cache is not None:
+        return CachedPolicyRepository(repository, cache)
+    return repository
 
 
 def get_policy_service(
-    policy_repository: SQLPolicyRepository = Depends(get_policy_repository),
+    policy_repository=Depends(get_policy_repository),
 ) -> PolicyService:
     return PolicyService(policy_repository)
+
+
+async def get_async_policy_repository(
+    db_session=Depends(db.get_async_db),
+    cache: PolicyCache | None = Depends(get_policy_cache),
+):
+    from ..infrastructure.async_policy_repository import AsyncSQLPolicyRepository
+
+    repository = AsyncSQLPolicyRepository(db_session)
+    if cache is not None:
+        return AsyncCachedPolicyRepository(repository, cache)
+    return repository
+
+
+async def get_async_policy_service(
+    policy_repository=Depends(get_async_policy_repository),
+) -> AsyncPolicyService:
+    return AsyncPolicyService(policy_repository)
+
+
+async def run_service(method, *args, **kwargs):
+    """Call a policy service method from an async route
+
+    Async service methods are awaited on the event loop; sync ones run in the
+    threadpool exactly as a sync route would.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
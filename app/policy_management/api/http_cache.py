@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from fastapi import Request, Response
+from ..domain.entities import Policy
+from ..infrastructure.book_version import book_version
+from .config import get_settings
+from .responses import dump_json
+
+"""Conditional GET (ETag / If-None-Match) and version-keyed response caching
+
+Single-policy ETags are derived from the policy's updated_at. List ETags are
+derived from the in-process book version, so a conditional list request can
+be answered with 304 before any query runs, whether or not the (opt-in)
+response cache is enabled. Writes the version never sees (another worker, a
+bulk load) are picked up once the TTL window rolls over, which changes both
+the list ETags and the cache keys.
+"""
+
+
+def policy_etag(policy: Policy) -> str | None:
+    """Strong ETag for one policy, or None when its modification time is unknown"""
+    return policy_version_etag(policy.id, policy.updated_at)
+
+
+def policy_version_etag(policy_id: int, updated_at: datetime | None) -> str | None:
+    """policy_etag from just the ID and updated_at, as read by get_policy_version"""
+    if updated_at is None:
+        return None
+    digest = hashlib.sha1(f"{policy_id}:{updated_at.isoformat()}".encode()).hexdigest()
+    return f'"{digest[:16]}"'
+
+
+def current_version(ttl: float) -> tuple[int, int]:
+    """Book version and ttl-long time window that list ETags and cache keys are built from"""
+    window = int(time.time() // ttl) if ttl > 0 else 0
+    return book_version.value, window
+
+
+def version_etag(request: Request, version_tag: str, variant: str = "") -> str:
+    """Strong ETag for a response that only changes when the book version does"""
+    query = sorted(request.query_params.multi_items())
+    digest = hashlib.sha1(f"{request.url.path}?{query}#{variant}".encode()).hexdigest()
+    return f'"{version_tag}-{digest[:12]}"'
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """Whether the request's If-None-Match header matches etag"""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized body with its headers, ready to be replayed"""
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    media_type: str = "application/json"
+
+    @classmethod
+    def from_content(
+        cls, content, etag: str | None = None, headers: dict | None = None
+    ):
+        """Serialize content once with orjson; replays reuse the bytes"""
+        headers = dict(headers or {})
+        if etag is not None:
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"
+        return cls(dump_json(content), headers)
+
+    @classmethod
+    def from_html(cls, html: str, etag: str | None = None, headers: dict | None = None):
+        """Keep a rendered template; replays skip rendering"""
+        return cls.from_body(html.encode(), "text/html", etag, headers)
+
+    @classmethod
+    def from_body(
+        cls,
+        body: bytes,
+        media_type: str,
+        etag: str | None = None,
+        headers: dict | None = None,
+    ):
+        """Keep an already serialized body"""
+        headers = dict(headers or {})
+        if etag is not None:
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"
+        return cls(body, headers, media_type)
+
+    def to_response(self, request: Request) -> Response:
+        """304 when the client already holds this representation, else the body"""
+        etag = self.headers.get("ETag")
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(self.body, media_type=self.media_type, headers=self.headers)
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized responses keyed by route, query and book version
+
+    Any write through this process bumps the book version, so entries never
+    need explicit invalidation; superseded versions simply age out of the LRU.
+    Keys also carry the current ttl-long time window, bounding how long an
+    entry outlives a write made elsewhere.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self) -> tuple[int, int]:
+        """current_version() for this cache's TTL"""
+        return current_version(self.ttl)
+
+    @staticmethod
+    def key(request: Request, version: tuple, variant: str = "") -> tuple:
+        """Route, query and version(), plus the negotiated representation if any"""
+        query = tuple(sorted(request.query_params.multi_items()))
+        return (request.url.path, query, version, variant)
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(self, key: tuple, cached: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def versioned_lookup(
+    request: Request, response_cache: ResponseCache | None, variant: str = ""
+):
+    """ETag and cache key for a response that only changes with the book version,
+    plus the response to send straight away when no query is needed
+
+    variant names the negotiated representation (e.g. the media type), which
+    gets its own ETag and cache entry. Without a response cache only the ETag
+    is handled and the cache key is None.
+    """
+    # Read the version before querying so a concurrent write can only make
+    # the cached body newer than its key, never older
+    if response_cache is None:
+        version = current_version(get_settings().response_cache_ttl)
+    else:
+        version = response_cache.version()
+    etag = version_etag(
+        request, "-".join(map(str, (book_version.epoch, *version))), variant
+    )
+    if etag_matches(request, etag):
+        return etag, None, not_modified(etag)
+    if response_cache is None:
+        return etag, None, None
+    cache_key = response_cache.key(request, version, variant)
+    cached = response_cache.get(cache_key)
+    return etag, cache_key, cached.to_response(request) if cached else None
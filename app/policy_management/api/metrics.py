@@ -0,0 +1,293 @@
+import threading
+import time
+from bisect import bisect_left
+from ..infrastructure.query_metrics import query_totals, stop_tracking, track_queries
+
+"""Request metrics in the Prometheus text exposition format
+
+A small in-process registry (counters, gauges and histograms with labels) and
+an ASGI middleware recording per-route latency, status codes, response sizes,
+in-flight requests and the SQL statements each request ran. Served at
+/metrics; no client library or external service is needed.
+"""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Most time MetricsMiddleware may add to a request, including SQL tracking
+# (about 6µs measured; see scripts/benchmarks/bench_metrics.py)
+REQUEST_OVERHEAD_BUDGET_SECONDS = 50e-6
+
+# Route label for requests no API route matched (static files, 404s)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonic total per label set"""
+
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, labels: tuple, value: float) -> None:
+        """Overwrite a total maintained elsewhere, e.g. at scrape time"""
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, labels: tuple = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down"""
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set, with their sum and count"""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple = (), buckets=()
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels: tuple, value: float) -> None:
+        # Bucket counts are stored non-cumulatively and summed when rendered
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, labels: tuple = ()) -> int:
+        series = self._values.get(labels)
+        return series[2] if series else 0
+
+    def sum(self, labels: tuple = ()) -> float:
+        series = self._values.get(labels)
+        return series[1] if series else 0.0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), total, count))
+                for labels, (counts, total, count) in self._values.items()
+            )
+        lines = self.header()
+        for labels, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_text = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_number(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics of one application, rendered together"""
+
+    def __init__(self):
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return (
+            "\n".join(line for metric in self.metrics for line in metric.render())
+            + "\n"
+        )
+
+
+class HttpMetrics:
+    """The request and SQL metrics recorded by MetricsMiddleware"""
+
+    def __init__(self):
+        self.registry = registry = MetricsRegistry()
+        self.requests = registry.register(
+            Counter(
+                "http_requests_total",
+                "Requests completed, by method, route and status code",
+                ("method", "route", "status"),
+            )
+        )
+        self.latency = registry.register(
+            Histogram(
+                "http_request_duration_seconds",
+                "Time from receiving a request to sending the last body byte",
+                ("method", "route"),
+                LATENCY_BUCKETS,
+            )
+        )
+        self.response_size = registry.register(
+            Histogram(
+                "http_response_size_bytes",
+                "Response body size",
+                ("method", "route"),
+                SIZE_BUCKETS,
+            )
+        )
+        self.in_progress = registry.register(
+            Gauge(
+                "http_requests_in_progress",
+                "Requests currently being served",
+                ("method",),
+            )
+        )
+        self.request_queries = registry.register(
+            Histogram(
+                "http_request_db_queries",
+                "SQL statements executed while serving a request",
+                ("method", "route"),
+                QUERY_BUCKETS,
+            )
+        )
+        self.request_db_seconds = registry.register(
+            Histogram(
+                "http_request_db_seconds",
+                "Time spent executing SQL statements while serving a request",
+                ("method", "route"),
+                LATENCY_BUCKETS,
+            )
+        )
+        self.queries = registry.register(
+            Counter("db_queries_total", "SQL statements executed by this process")
+        )
+        self.query_seconds = registry.register(
+            Counter(
+                "db_query_seconds_total",
+                "Time spent executing SQL statements in this process",
+            )
+        )
+
+    def render(self) -> str:
+        """Exposition text, with the process-wide SQL totals brought up to date"""
+        totals = query_totals()
+        self.queries.set((), totals.queries)
+        self.query_seconds.set((), totals.seconds)
+        return self.registry.render()
+
+
+def route_label(scope) -> str:
+    """The matched route's path template, so /policies/{policy_number} is one series"""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording HttpMetrics for every HTTP request"""
+
+    def __init__(self, app, metrics: HttpMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        metrics.in_progress.inc((method,))
+        stats, token = track_queries()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            stop_tracking(token)
+            metrics.in_progress.dec((method,))
+            labels = (method, route_label(scope))
+            metrics.requests.inc((method, labels[1], str(status)))
+            metrics.latency.observe(labels, elapsed)
+            metrics.response_size.observe(labels, size)
+            metrics.request_queries.observe(labels, stats.queries)
+            metrics.request_db_seconds.observe(labels, stats.seconds)
@@ -1,5 +1,127 @@
+import zlib
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
+from .config import get_settings
+from .negotiation import accepts_encoding
+
+# Content types worth compressing; images, archives and the like already are
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/vnd.tmhcc.columnar+json",
+    "application/msgpack",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware gzipping responses of at least min_size bytes
+
+    A single-message body shorter than min_size is sent as is. Streamed bodies
+    are compressed chunk by chunk, each flushed so streaming still works.
+    Responses that already have a Content-Encoding (precompressed static
+    assets, the gzipped export) or an uncompressible content type pass
+    through untouched. A strong ETag becomes weak, since the compressed bytes
+    differ; If-None-Match matching accepts weak ETags.
+    """
+
+    def __init__(self, app, min_size: int = 1024, level: int = 6):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not accepts_encoding(
+            ", ".join(Headers(scope=scope).getlist("accept-encoding")), "gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = {name.lower(): value for name, value in message["headers"]}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in headers
+                    or message["status"] in (204, 304)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(start)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.min_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+                await send(self._compressed_start(start, more_body))
+
+            if more_body:
+                chunk = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            else:
+                chunk = compressor.compress(body) + compressor.flush()
+            if chunk or not more_body:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": more_body,
+                    }
+                )
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _compressed_start(start, more_body: bool) -> dict:
+        headers = []
+        vary = None
+        for name, value in start["headers"]:
+            lowered = name.lower()
+            if lowered == b"content-length":
+                continue
+            if lowered == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            if lowered == b"vary":
+                vary = value
+                continue
+            headers.append((name, value))
+        headers.append((b"content-encoding", b"gzip"))
+        headers.append(
+            (b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding")
+        )
+        return {**start, "headers": headers}
+
+
+class QueryProfileMiddleware:
+    """Pure ASGI middleware profiling the SQL of each HTTP request as one scope"""
+
+    def __init__(self, app, profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with self.profiler.profile(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
 
 
 def setup_middleware(app: FastAPI):
@@ -10,4 +132,30 @@ def setup_middleware(app: FastAPI):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "X-Next-Offset", "Link", "ETag"],
     )
+
+    from .dependencies import get_query_profiler
+
+    profiler = get_query_profiler()
+    if profiler is not None:
+        profiler.install()
+        app.add_middleware(QueryProfileMiddleware, profiler=profiler)
+
+    settings = get_settings()
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            min_size=settings.compression_min_size,
+            level=settings.compression_level,
+        )
+
+    # Added last so it wraps everything else and times the whole request
+    app.state.metrics = None
+    if settings.metrics_enabled:
+        from .metrics import HttpMetrics, MetricsMiddleware
+        from ..infrastructure.query_metrics import instrument_engines
+
+        instrument_engines()
+        app.state.metrics = HttpMetrics()
+        app.add_middleware(MetricsMiddleware, metrics=app.state.metrics)
@@ -0,0 +1,37 @@
+"""Quality values of Accept and Accept-Encoding headers
+
+Both headers are comma-separated tokens with optional parameters, of which q
+(default 1) ranks them; q=0 refuses a token and a malformed q counts as 0.
+"""
+
+
+def quality_values(header: str) -> dict[str, float]:
+    """Lowercased token -> q-value, keeping the highest when a token repeats"""
+    qualities = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        qualities[token] = max(quality, qualities.get(token, 0.0))
+    return qualities
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Whether an Accept-Encoding header allows a content coding
+
+    A coding named in the header is decided by its own q-value; otherwise a
+    * entry decides.
+    """
+    qualities = quality_values(accept_encoding)
+    if coding in qualities:
+        return qualities[coding] > 0
+    return qualities.get("*", 0.0) > 0
@@ -0,0 +1,183 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+from anyio import from_thread
+from sqlalchemy import text
+from ..infrastructure.db import get_pool_status
+from ..infrastructure.expiry_sweeper import ExpirySweeper
+from ..infrastructure.models import utc_now
+
+"""Readiness probe behind /health/ready
+
+One probe pings the database, reads the connection pool's checked-out and
+overflow counts, the cache hit ratios and the expiry sweeper's lag. With
+ASYNC_DB the async engine that serves the policy routes is pinged and its
+pool reported too. Its
+result is reused for `ttl` seconds and only one probe runs at a time, so an
+orchestrator probing every instance frequently costs one ping per interval.
+"""
+
+OK = "ok"
+DEGRADED = "degraded"
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of one probe; ready only when every check is ok"""
+
+    ready: bool
+    checks: dict
+    checked_at: str
+    started: float
+
+
+def pool_capacity(pool) -> int | None:
+    """Connections the pool can hand out at once, or None when unbounded/unknown"""
+    size = getattr(pool, "size", None)
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if not callable(size) or max_overflow is None or max_overflow < 0:
+        return None
+    return size() + max_overflow
+
+
+class ReadinessProbe:
+    """Checks the instance's dependencies, caching the result for ttl seconds"""
+
+    def __init__(
+        self,
+        bind,
+        async_bind=None,
+        ttl: float = 2.0,
+        sweeper: ExpirySweeper | None = None,
+        max_sweeper_lag: float = 900.0,
+        caches: dict[str, Callable[[], dict]] | None = None,
+    ):
+        self.bind = bind
+        self.async_bind = async_bind
+        self.ttl = ttl
+        self.sweeper = sweeper
+        self.max_sweeper_lag = max_sweeper_lag
+        self.caches = caches or {}
+        self.probes = 0
+        self._result: ProbeResult | None = None
+        self._lock = threading.Lock()
+
+    def fresh(self) -> ProbeResult | None:
+        """The cached result if it is younger than ttl, without blocking"""
+        result = self._result
+        if result is not None and time.monotonic() - result.started < self.ttl:
+            return result
+        return None
+
+    def check(self) -> ProbeResult:
+        """The cached result, or a new probe once it has expired
+
+        Callers arriving while a probe runs wait for it instead of starting
+        their own. With an async_bind this must run in a worker thread of the
+        event loop that owns the async engine (run_in_threadpool).
+        """
+        result = self.fresh()
+        if result is not None:
+            return result
+        with self._lock:
+            result = self.fresh()
+            if result is None:
+                result = self._result = self.probe()
+            return result
+
+    def probe(self) -> ProbeResult:
+        """Run every check now"""
+        started = time.monotonic()
+        checks = {"pool": self._pool(self.bind)}
+        checks["database"] = self._database(
+            self._ping, exhausted=checks["pool"].get("exhausted", False)
+        )
+        if self.async_bind is not None:
+            checks["async_pool"] = self._pool(self.async_bind)
+            checks["async_database"] = self._database(
+                self._ping_async, exhausted=checks["async_pool"].get("exhausted", False)
+            )
+        checks["sweeper"] = self._sweeper()
+        checks["caches"] = self._caches()
+        self.probes += 1
+        return ProbeResult(
+            ready=all(check["status"] == OK for check in checks.values()),
+            checks=checks,
+            checked_at=utc_now().isoformat(),
+            started=started,
+        )
+
+    def _pool(self, bind) -> dict:
+        status = get_pool_status(bind)
+        capacity = pool_capacity(bind.pool)
+        if capacity is None or "checkedout" not in status:
+            return {"status": OK, **status}
+        exhausted = status["checkedout"] >= capacity
+        return {
+            "status": DEGRADED if exhausted else OK,
+            **status,
+            "capacity": capacity,
+            "exhausted": exhausted,
+        }
+
+    def _ping(self) -> None:
+        with self.bind.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def _ping_async(self) -> None:
+        # Async connections belong to the event loop, so ping from there
+        async def ping():
+            async with self.async_bind.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        from_thread.run(ping)
+
+    def _database(self, ping: Callable[[], None], exhausted: bool) -> dict:
+        # Checking out a connection from an exhausted pool would block the probe
+        # for the pool timeout; the pool check has already reported it
+        if exhausted:
+            return {"status": DEGRADED, "error": "Connection pool exhausted"}
+        started = time.perf_counter()
+        try:
+            ping()
+        except Exception as e:
+            return {"status": DEGRADED, "error": str(e)}
+        return {
+            "status": OK,
+            "ping_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _sweeper(self) -> dict:
+        if self.sweeper is None or not self.sweeper.running:
+            return {"status": OK, "running": False}
+        lag = self.sweeper.lag_seconds()
+        last_run_at = self.sweeper.stats.last_run_at
+        return {
+            "status": DEGRADED if lag > self.max_sweeper_lag else OK,
+            "running": True,
+            "lag_seconds": lag,
+            "max_lag_seconds": self.max_sweeper_lag,
+            "last_run_at": last_run_at.isoformat() if last_run_at else None,
+            "last_error": self.sweeper.stats.last_error,
+        }
+
+    def _caches(self) -> dict:
+        ratios = {}
+        for name, snapshot in self.caches.items():
+            stats = snapshot()
+            ratios[name] = {
+                "hit_ratio": stats["hit_ratio"],
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+            }
+        return {"status": OK, **ratios}
+
+    def report(self, result: ProbeResult) -> dict:
+        """Response body for a probe result"""
+        return {
+            "status": "ready" if result.ready else DEGRADED,
+            "checked_at": result.checked_at,
+            "age_seconds": round(time.monotonic() - result.started, 3),
+            "checks": result.checks,
+        }
@@ -0,0 +1,67 @@
+from fastapi import HTTPException, Request
+from ..application.serializers import policies_to_columns, policies_to_dicts
+from ..domain.entities import Policy
+from .negotiation import quality_values
+from .responses import dump_json
+
+try:
+    import msgpack
+except ImportError:  # optional: application/msgpack is only offered when installed
+    msgpack = None
+
+"""Content negotiation for policy listings
+
+Besides JSON, internal consumers can ask (through Accept) for MessagePack or
+for a columnar JSON form that sends the field names once followed by one
+array of values per policy. All three carry exactly the fields and values of
+policy_to_dict, in its field order.
+"""
+
+JSON = "application/json"
+COLUMNAR = "application/vnd.tmhcc.columnar+json"
+MSGPACK = "application/msgpack"
+
+# Offered media types in server preference order for equal client quality
+OFFERED = (JSON, COLUMNAR, MSGPACK) if msgpack is not None else (JSON, COLUMNAR)
+
+ALIASES = {"application/x-msgpack": MSGPACK}
+
+
+def negotiate(accept: str | None) -> str | None:
+    """Offered media type best matching an Accept header, or None if none is acceptable
+
+    A missing header, */* and application/* all select JSON.
+    """
+    if not accept:
+        return JSON
+    qualities = {}
+    for media_range, quality in quality_values(accept).items():
+        media_range = ALIASES.get(media_range, media_range)
+        qualities[media_range] = max(quality, qualities.get(media_range, 0.0))
+    best, best_quality = None, 0.0
+    for offered in OFFERED:
+        # The most specific matching range decides: exact, then type/*, then */*
+        candidates = (offered, f"{offered.split('/')[0]}/*", "*/*")
+        quality = next((qualities[c] for c in candidates if c in qualities), 0.0)
+        if quality > best_quality:
+            best, best_quality = offered, quality
+    return best
+
+
+def negotiate_policies(request: Request) -> str:
+    """Media type for a policy listing, or 406 when no offered type is acceptable"""
+    media_type = negotiate(request.headers.get("accept"))
+    if media_type is None:
+        raise HTTPException(
+            status_code=406, detail=f"Acceptable media types: {', '.join(OFFERED)}"
+        )
+    return media_type
+
+
+def encode_policies(policies: list[Policy], media_type: str) -> bytes:
+    """Serialize policies in the negotiated representation"""
+    if media_type == COLUMNAR:
+        return dump_json(policies_to_columns(policies))
+    if media_type == MSGPACK:
+        return msgpack.packb(policies_to_dicts(policies))
+    return dump_json(policies_to_dicts(policies))
@@ -0,0 +1,21 @@
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+"""orjson-backed JSON responses for the policy routes"""
+
+
+def dump_json(content) -> bytes:
+    """Serialize with orjson, deferring to FastAPI's encoder for types it lacks (Decimal)"""
+    return orjson.dumps(content, default=jsonable_encoder)
+
+
+class PolicyJSONResponse(ORJSONResponse):
+    """JSON response rendered by orjson
+
+    Returning one directly from a route skips FastAPI's response-model
+    validation and jsonable_encoder pass, which dominate on large bodies.
+    """
+
+    def render(self, content) -> bytes:
+        return dump_json(content)
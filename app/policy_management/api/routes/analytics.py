@@ -0,0 +1,63 @@
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict, List, Optional
+
+from ...application.analytics import PolicyAnalyticsService
+from .. import schemas
+from ..dependencies import get_analytics_service, run_service
+from ..responses import PolicyJSONResponse
+
+router = APIRouter(
+    prefix="/api/v1/analytics",
+    tags=["analytics"],
+    default_response_class=PolicyJSONResponse,
+)
+
+
+@router.get("/groups", response_model=Dict[str, Any])
+async def group_totals(
+    filters: schemas.PolicyFilterDTO = Depends(),
+    by: List[str] = Query(["policy_type", "status"]),
+    analytics: PolicyAnalyticsService = Depends(get_analytics_service),
+):
+    """This endpoint returns policy counts and premium of the filtered book grouped by
+    status and/or policy_type, always split by currency"""
+    try:
+        return await run_service(analytics.group_totals, filters, by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/premium-histogram", response_model=Dict[str, Any])
+async def premium_histogram(
+    filters: schemas.PolicyFilterDTO = Depends(),
+    bins: int = Query(20, ge=1, le=1000),
+    analytics: PolicyAnalyticsService = Depends(get_analytics_service),
+):
+    """This endpoint returns the premium distribution of the filtered book per currency"""
+    try:
+        return await run_service(analytics.premium_histogram, filters, bins)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/expiry-ladder", response_model=Dict[str, Any])
+async def expiry_ladder(
+    filters: schemas.PolicyFilterDTO = Depends(),
+    as_of: Optional[date] = None,
+    bucket_days: int = Query(30, ge=1, le=366),
+    buckets: int = Query(12, ge=1, le=120),
+    analytics: PolicyAnalyticsService = Depends(get_analytics_service),
+):
+    """This endpoint returns how many policies, and how much premium, expire in each
+    bucket_days window after as_of (default today)"""
+    try:
+        return await run_service(
+            analytics.expiry_ladder,
+            filters,
+            as_of or date.today(),
+            bucket_days,
+            buckets,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,17 +1,66 @@
-from fastapi import APIRouter, Request
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-import os
-
-# Set up Jinja2 templates directory
-current_dir = os.path.dirname(__file__)
-templates_dir = os.path.join(current_dir, "..", "templates")
-templates = Jinja2Templates(directory=templates_dir)
+from ...application.policy_services import PolicyService
+from ...application.serializers import policies_to_dicts
+from .. import schemas
+from ..config import get_settings
+from ..dependencies import get_policy_service, get_response_cache, run_service
+from ..http_cache import CachedResponse, ResponseCache, versioned_lookup
+from ..static_files import templates
 
 router = APIRouter(prefix="", tags=["frontend"])
 
+settings = get_settings()
+
+# Rows per infinite-scroll page of the policies table
+FRAGMENT_PAGE_SIZE = 50
+
 
 @router.get("/", response_class=HTMLResponse)
 async def serve_frontend(request: Request):
     """Serve the main frontend dashboard"""
     return templates.TemplateResponse("index.html", {"request": request})
+
+
+@router.get("/fragments/policies", response_class=HTMLResponse)
+async def policy_rows(
+    request: Request,
+    filters: schemas.PolicyFilterDTO = Depends(),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    sort: str = "created_at",
+    policy_service: PolicyService = Depends(get_policy_service),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
+):
+    """This endpoint returns one page of the policies table as rendered <tr> rows.
+    When more policies match, the last row fetches the next page once it is
+    revealed. Rendered pages are cached per book version"""
+    etag, cache_key, early = versioned_lookup(request, response_cache)
+    if early is not None:
+        return early
+    try:
+        page_size = min(limit or FRAGMENT_PAGE_SIZE, settings.max_page_size)
+        policies, next_cursor = await run_service(
+            policy_service.list_policies_page,
+            filters,
+            page_size,
+            cursor=cursor,
+            sort=sort,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    next_url = None
+    if next_cursor:
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        next_url = f"{next_url.path}?{next_url.query}"
+    html = templates.get_template("fragments/policy_rows.html").render(
+        policies=policies_to_dicts(policies),
+        next_url=next_url,
+        first_page=cursor is None,
+    )
+    cached = CachedResponse.from_html(html, etag)
+    if cache_key is not None:
+        response_cache.put(cache_key, cached)
+    return cached.to_response(request)
@@ -1,4 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from ..dependencies import get_readiness_probe
+from ..readiness import ReadinessProbe
 
 router = APIRouter()
 
@@ -6,3 +10,84 @@ router = APIRouter()
 @router.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "TMHCC Policy Management"}
+
+
+@router.get("/health/live")
+async def liveness():
+    """Liveness: answers while the process serves requests, checking no dependencies"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness(probe: ReadinessProbe = Depends(get_readiness_probe)):
+    """Readiness from a cached dependency probe; 503 when anything is degraded"""
+    result = probe.fresh() or await run_in_threadpool(probe.check)
+    return JSONResponse(
+        probe.report(result),
+        status_code=200 if result.ready else 503,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@router.get("/health/pool")
+async def pool_status():
+    """Database connection pool statistics"""
+    from ...infrastructure.db import get_pool_status
+
+    return get_pool_status()
+
+
+@router.get("/health/sweeper")
+async def sweeper_status():
+    """Expiry sweeper configuration and counters"""
+    from ..dependencies import get_expiry_sweeper
+
+    return get_expiry_sweeper().snapshot()
+
+
+@router.get("/health/snapshot")
+async def snapshot_status():
+    """Analytics snapshot store counters and the loaded snapshot"""
+    from ..dependencies import get_snapshot_store
+
+    return get_snapshot_store().snapshot()
+
+
+@router.get("/health/cache")
+async def cache_status():
+    """Policy cache and response cache counters"""
+    from ..dependencies import get_policy_cache, get_response_cache
+    from ...infrastructure.book_version import book_version
+
+    def describe(cache):
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.snapshot()}
+
+    return {
+        "book_version": book_version.tag,
+        "policy_cache": describe(get_policy_cache()),
+        "response_cache": describe(get_response_cache()),
+    }
+
+
+@router.get("/health/queries")
+async def query_profiler_status():
+    """SQL profiler counters with recent slow queries and repeated statements"""
+    from ..dependencies import get_query_profiler
+
+    profiler = get_query_profiler()
+    if profiler is None:
+        return {"enabled": False}
+    return {"enabled": True, **profiler.snapshot()}
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Request, response and SQL metrics in Prometheus text format"""
+    from ..metrics import CONTENT_TYPE
+
+    http_metrics = request.app.state.metrics
+    if http_metrics is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(http_metrics.render(), media_type=CONTENT_TYPE)
@@ -1,58 +1,320 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 
-from ...application.policy_services import PolicyService
+from ...application.policy_services import BatchItemResult, PolicyService
 from .. import schemas
 from ...application.mappers import PolicyDtoMapper
-from ..dependencies import get_policy_service
+from ...application.exporters import ExportFormat, iter_export, gzip_chunks
+from ..config import get_settings
+from ...infrastructure.db import get_db
+from ...infrastructure.expiry_sweeper import ExpirySweeper
+from ..dependencies import (
+    get_expiry_sweeper,
+    get_policy_service,
+    get_response_cache,
+    run_service,
+)
+from ..http_cache import (
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+    not_modified,
+    policy_etag,
+    policy_version_etag,
+    versioned_lookup,
+)
+from ..negotiation import accepts_encoding
+from ..representations import encode_policies, negotiate_policies
+from ..responses import PolicyJSONResponse
 
-router = APIRouter(prefix="/api/v1/policies", tags=["policies"])
+router = APIRouter(
+    prefix="/api/v1/policies",
+    tags=["policies"],
+    default_response_class=PolicyJSONResponse,
+)
+
+settings = get_settings()
+
+
+def _check_batch_size(size: int) -> None:
+    if size > settings.max_batch_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch size exceeds the maximum of {settings.max_batch_size}",
+        )
+
+
+def _batch_response(results: List[BatchItemResult]) -> PolicyJSONResponse:
+    """Counts plus a result per item, in input order; returned as a response so
+    thousands of items are not revalidated against the response model"""
+    succeeded = sum(1 for result in results if result.success)
+    return PolicyJSONResponse(
+        {
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": [
+                {
+                    "index": result.index,
+                    "policy_number": result.policy_number,
+                    "success": result.success,
+                    "error": result.error,
+                    "policy": (
+                        PolicyDtoMapper.to_dict(result.policy)
+                        if result.policy
+                        else None
+                    ),
+                }
+                for result in results
+            ],
+        }
+    )
 
 
 @router.post("/", response_model=Dict[str, Any])
-def create_policy(
+async def create_policy(
     policy_dto: schemas.CreatePolicyDTO,
     policy_service: PolicyService = Depends(get_policy_service),
 ):
     """This endpoint Create a new policy and returns the newly created policy"""
     try:
-        new_policy = policy_service.create_policy(policy_dto)
+        new_policy = await run_service(policy_service.create_policy, policy_dto)
         return PolicyDtoMapper.to_dict(new_policy)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/batch", response_model=schemas.BatchResultDTO)
+async def create_policies(
+    batch_dto: schemas.BatchCreatePoliciesDTO,
+    policy_service: PolicyService = Depends(get_policy_service),
+):
+    """This endpoint creates many policies in one transaction and returns a result per item"""
+    _check_batch_size(len(batch_dto.policies))
+    try:
+        results = await run_service(policy_service.create_policies, batch_dto.policies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _batch_response(results)
+
+
+@router.post("/activate-batch", response_model=schemas.BatchResultDTO)
+async def activate_policies(
+    batch_dto: schemas.BatchTransitionDTO,
+    policy_service: PolicyService = Depends(get_policy_service),
+):
+    """This endpoint activates many policies with one UPDATE and returns a result per policy number"""
+    _check_batch_size(len(batch_dto.policy_numbers))
+    try:
+        results = await run_service(
+            policy_service.activate_policies, batch_dto.policy_numbers
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _batch_response(results)
+
+
+@router.post("/cancel-batch", response_model=schemas.BatchResultDTO)
+async def cancel_policies(
+    batch_dto: schemas.BatchTransitionDTO,
+    policy_service: PolicyService = Depends(get_policy_service),
+):
+    """This endpoint cancels many policies with one UPDATE and returns a result per policy number"""
+    _check_batch_size(len(batch_dto.policy_numbers))
+    try:
+        results = await run_service(
+            policy_service.cancel_policies, batch_dto.policy_numbers, batch_dto.reason
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _batch_response(results)
+
+
+@router.post("/sweep-expired", response_model=Dict[str, int])
+async def sweep_expired_policies(
+    db_session=Depends(get_db),
+    sweeper: ExpirySweeper = Depends(get_expiry_sweeper),
+):
+    """This endpoint runs the expiry sweeper now and returns how many policies it moved to inactive"""
+    result = await run_service(sweeper.sweep, db_session)
+    return {
+        "expired": result.expired,
+        "lapsed": result.lapsed,
+        "batches": result.batches,
+    }
+
+
 @router.post("/{policy_number}/activate", response_model=Dict[str, Any])
-def activate_policy(
+async def activate_policy(
     policy_number: str, policy_service: PolicyService = Depends(get_policy_service)
 ):
     """This endpoint activates an existing policy using the policy number and returns the updated policy"""
     try:
-        policy = policy_service.activate_policy(policy_number)
+        policy = await run_service(policy_service.activate_policy, policy_number)
         return PolicyDtoMapper.to_dict(policy)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_policies(
+    request: Request,
+    filters: schemas.PolicyFilterDTO = Depends(),
+    format: ExportFormat = ExportFormat.NDJSON,
+    policy_service: PolicyService = Depends(get_policy_service),
+):
+    """This endpoint streams every policy matching the filters as NDJSON or CSV.
+    The body is gzipped on the fly when the client accepts gzip"""
+    try:
+        policies = await run_service(policy_service.export_policies, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    body = iter_export(policies, format)
+    headers = {
+        "Content-Disposition": f'attachment; filename="policies.{format.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_encoding(request.headers.get("accept-encoding", ""), "gzip"):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=format.media_type, headers=headers)
+
+
+@router.get("/summary", response_model=Dict[str, Any])
+async def premium_summary(
+    request: Request,
+    policy_service: PolicyService = Depends(get_policy_service),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
+):
+    """This endpoint returns gross written premium by policy type, status and currency.
+    Totals are read from the incrementally maintained summary table"""
+    etag, cache_key, early = versioned_lookup(request, response_cache)
+    if early is not None:
+        return early
+    totals = await run_service(policy_service.get_premium_summary)
+    cached = CachedResponse.from_content(PolicyDtoMapper.summary_to_dict(totals), etag)
+    if cache_key is not None:
+        response_cache.put(cache_key, cached)
+    return cached.to_response(request)
+
+
+@router.get("/search", response_model=List[Dict[str, Any]])
+async def search_policies(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    fuzzy: bool = False,
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    policy_service: PolicyService = Depends(get_policy_service),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
+):
+    """This endpoint searches policies by insured name, best matches first.
+    Substrings and prefixes match; fuzzy=true also tolerates typos.
+    The offset of the next page is returned in the X-Next-Offset and Link headers.
+    Accept selects JSON, columnar JSON or MessagePack"""
+    media_type = negotiate_policies(request)
+    etag, cache_key, early = versioned_lookup(request, response_cache, media_type)
+    if early is not None:
+        return early
+    try:
+        page_size = min(limit or settings.default_page_size, settings.max_page_size)
+        policies, next_offset = await run_service(
+            policy_service.search_policies, q, page_size, offset=offset, fuzzy=fuzzy
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {}
+    if next_offset is not None:
+        next_url = request.url.include_query_params(offset=next_offset)
+        headers["X-Next-Offset"] = str(next_offset)
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    headers["Vary"] = "Accept"
+    cached = CachedResponse.from_body(
+        encode_policies(policies, media_type), media_type, etag, headers
+    )
+    if cache_key is not None:
+        response_cache.put(cache_key, cached)
+    return cached.to_response(request)
+
+
 @router.get("/{policy_number}", response_model=Dict[str, Any])
-def get_policy(
-    policy_number: str, policy_service: PolicyService = Depends(get_policy_service)
+async def get_policy(
+    request: Request,
+    policy_number: str,
+    policy_service: PolicyService = Depends(get_policy_service),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
 ):
-    """This endpoint returns a  single policy by policy number"""
+    """This endpoint returns a  single policy by policy number.
+    The ETag follows the policy's updated_at; If-None-Match yields 304, checked
+    against the policy's ID and updated_at alone before the policy is loaded"""
+    cache_key = None
+    if response_cache is not None:
+        cache_key = response_cache.key(request, response_cache.version())
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
     try:
-        policy = policy_service.get_policy(policy_number)
+        if "if-none-match" in request.headers:
+            version = await run_service(
+                policy_service.get_policy_version, policy_number
+            )
+            etag = policy_version_etag(*version) if version else None
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        policy = await run_service(policy_service.get_policy, policy_number)
         if not policy:
             raise HTTPException(status_code=404, detail="Policy not found")
-        return PolicyDtoMapper.to_dict(policy)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    cached = CachedResponse.from_content(
+        PolicyDtoMapper.to_dict(policy), etag=policy_etag(policy)
+    )
+    if cache_key is not None:
+        response_cache.put(cache_key, cached)
+    return cached.to_response(request)
+
 
 @router.get("/", response_model=List[Dict[str, Any]])
-def list_policies(policy_service: PolicyService = Depends(get_policy_service)):
-    """This endpoint returns all policies as a list"""
+async def list_policies(
+    request: Request,
+    filters: schemas.PolicyFilterDTO = Depends(),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    sort: str = "created_at",
+    policy_service: PolicyService = Depends(get_policy_service),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
+):
+    """This endpoint returns one page of policies matching the filters.
+    The cursor for the next page is returned in the X-Next-Cursor and Link headers.
+    Accept selects JSON, columnar JSON or MessagePack"""
+    media_type = negotiate_policies(request)
+    etag, cache_key, early = versioned_lookup(request, response_cache, media_type)
+    if early is not None:
+        return early
     try:
-        policies = policy_service.list_policies()
-        return [PolicyDtoMapper.to_dict(policy) for policy in policies]
+        page_size = min(limit or settings.default_page_size, settings.max_page_size)
+        policies, next_cursor = await run_service(
+            policy_service.list_policies_page,
+            filters,
+            page_size,
+            cursor=cursor,
+            sort=sort,
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {}
+    if next_cursor:
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    headers["Vary"] = "Accept"
+    cached = CachedResponse.from_body(
+        encode_policies(policies, media_type), media_type, etag, headers
+    )
+    if cache_key is not None:
+        response_cache.put(cache_key, cached)
+    return cached.to_response(request)
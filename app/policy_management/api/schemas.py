@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional
 from datetime import date
 from decimal import Decimal
 
@@ -42,6 +42,29 @@ class CreatePolicyDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BatchCreatePoliciesDTO(BaseModel):
+    policies: List[CreatePolicyDTO] = Field(..., min_length=1)
+
+
+class BatchTransitionDTO(BaseModel):
+    policy_numbers: List[str] = Field(..., min_length=1)
+    reason: Optional[str] = None
+
+
+class BatchItemResultDTO(BaseModel):
+    index: int
+    policy_number: str
+    success: bool
+    error: Optional[str] = None
+    policy: Optional[Dict[str, Any]] = None
+
+
+class BatchResultDTO(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BatchItemResultDTO]
+
+
 class FlatPolicyDTO(BaseModel):
     policy_number: str
     insured_name: str
@@ -53,3 +76,13 @@ class FlatPolicyDTO(BaseModel):
     id: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PolicyFilterDTO(BaseModel):
+    status: Optional[str] = None
+    policy_type: Optional[str] = None
+    currency: Optional[str] = None
+    min_premium: Optional[Decimal] = None
+    max_premium: Optional[Decimal] = None
+    active_from: Optional[date] = None
+    active_to: Optional[date] = None
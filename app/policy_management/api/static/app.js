@@ -36,7 +36,7 @@ function handleHtmxBeforeRequest(event) {
     // Show loading state for the target element
     const target = event.detail.target;
     if (target && target.id === 'policiesTable') {
-        target.innerHTML = '<tr><td colspan="6" class="loading">Loading policies...</td></tr>';
+        target.innerHTML = '<tr><td colspan="7" class="loading">Loading policies...</td></tr>';
     } else if (target && target.id === 'singlePolicyResult') {
         target.innerHTML = '<div class="loading">Searching for policy...</div>';
     } else if (target && target.id === 'policyDetails') {
@@ -49,7 +49,7 @@ function handleHtmxResponseError(event) {
     const target = event.detail.target;
     
     if (target && target.id === 'policiesTable') {
-        target.innerHTML = '<tr><td colspan="6" class="error">Error loading policies. Please try again.</td></tr>';
+        target.innerHTML = '<tr><td colspan="7" class="error">Error loading policies. Please try again.</td></tr>';
     } else if (target && target.id === 'singlePolicyResult') {
         // Show friendly error message for search
         const policyNumber = extractPolicyNumberFromUrl(event.detail.pathInfo.requestPath);
@@ -69,18 +69,10 @@ function handleHtmxBeforeOnLoad(event) {
     const target = event.detail.target;
     const xhr = event.detail.xhr;
     
-    // Handle policies table response
-    if (target.id === 'policiesTable') {
-        try {
-            const response = JSON.parse(xhr.responseText);
-            target.innerHTML = generatePoliciesTable(response);
-            event.detail.shouldSwap = false;
-        } catch (error) {
-            console.error('Error processing policies response:', error);
-        }
-    }
+    // Policy table rows arrive as server-rendered HTML and are swapped in by HTMX
+
     // Handle single policy search response
-    else if (target.id === 'singlePolicyResult') {
+    if (target.id === 'singlePolicyResult') {
         try {
             // Check if response is successful
             if (xhr.status === 200) {
@@ -149,33 +141,6 @@ function generatePolicyNotFoundMessage(policyNumber) {
     `;
 }
 
-// Generate HTML table from policies data
-function generatePoliciesTable(policies) {
-    if (!policies || policies.length === 0) {
-        return '<tr><td colspan="6" class="loading">No policies found</td></tr>';
-    }
-
-    return policies.map(policy => `
-        <tr>
-            <td><strong>${escapeHtml(policy.policy_number)}</strong></td>
-            <td>${escapeHtml(policy.insured_name)}</td>
-            <td>${escapeHtml(policy.policy_type)}</td>
-            <td class="premium">${escapeHtml(policy.premium)}</td>
-            <td>
-                <span class="status-badge status-${getStatusClass(policy.status)}">
-                    ${escapeHtml(policy.status)}
-                </span>
-            </td>
-            <td>${escapeHtml(policy.start_date)} to ${escapeHtml(policy.end_date)}</td>
-            <td>
-                <button class="view-btn" onclick="viewPolicyDetails('${escapeHtml(policy.policy_number)}')">
-                    View Details
-                </button>
-            </td>
-        </tr>
-    `).join('');
-}
-
 // Generate single policy view for search results
 function generateSinglePolicyView(policy) {
     if (!policy) {
@@ -306,10 +271,11 @@ function loadAllPolicies() {
     // Clear search input
     document.getElementById('searchInput').value = '';
     
-    // Use HTMX to reload the policies table
-    htmx.ajax('GET', '/api/v1/policies/', {
+    // Reload the first page of rendered rows, keeping the current filters and sort
+    const filters = new URLSearchParams(new FormData(document.getElementById('policyFilters')));
+    htmx.ajax('GET', `/fragments/policies?${filters}`, {
         target: '#policiesTable',
-        swap: 'none'
+        swap: 'innerHTML'
     }).then(() => {
         showNotification('Policies refreshed successfully', 'success');
     });
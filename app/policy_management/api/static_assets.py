@@ -0,0 +1,154 @@
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from .negotiation import accepts_encoding
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are produced
+    brotli = None
+
+"""Build-free static asset pipeline
+
+At startup every file under the static directory is read once, fingerprinted
+with a hash of its content and compressed with gzip (and brotli when the
+package is installed). Fingerprinted URLs such as /static/app.3f2a9c01d4.js
+never change content, so they are served with an immutable one-year
+Cache-Control; the plain names stay available for anything not yet using the
+asset_url() template helper, and are revalidated through their ETag.
+"""
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+HASH_LENGTH = 10
+
+# Variants smaller than this fraction of the original are not worth serving
+MIN_COMPRESSION_RATIO = 0.9
+
+# Content-Encoding tokens in server preference order
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _compress(encoding: str, content: bytes) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=11)
+    # mtime=0 keeps the output, and so its ETag, identical across restarts
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """app.js -> app.<digest>.js, keeping any directory"""
+    path = PurePosixPath(name)
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+@dataclass(frozen=True)
+class Asset:
+    """One static file with its fingerprint and precompressed variants"""
+
+    name: str
+    url_name: str
+    digest: str
+    media_type: str
+    content: bytes
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+    def select(self, accept_encoding: str) -> tuple[str | None, bytes]:
+        """The preferred variant the client accepts, or the identity content"""
+        for encoding in ENCODINGS:
+            if encoding in self.variants and accepts_encoding(
+                accept_encoding, encoding
+            ):
+                return encoding, self.variants[encoding]
+        return None, self.content
+
+
+class AssetManifest:
+    """Every static asset, addressable by its plain and its fingerprinted name"""
+
+    def __init__(self, assets: list[Asset], prefix: str = "/static"):
+        self.prefix = prefix
+        self.assets = {asset.name: asset for asset in assets}
+        self._by_url = {}
+        for asset in assets:
+            self._by_url[asset.url_name] = (asset, IMMUTABLE)
+            self._by_url[asset.name] = (asset, REVALIDATE)
+
+    @classmethod
+    def build(cls, directory: Path, prefix: str = "/static") -> "AssetManifest":
+        """Read, hash and compress every file under directory"""
+        assets = []
+        for path in sorted(directory.rglob("*")):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            name = path.relative_to(directory).as_posix()
+            content = path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            variants = {}
+            for encoding in ENCODINGS:
+                compressed = _compress(encoding, content)
+                if len(compressed) < len(content) * MIN_COMPRESSION_RATIO:
+                    variants[encoding] = compressed
+            assets.append(
+                Asset(
+                    name,
+                    fingerprinted_name(name, digest),
+                    digest,
+                    media_type,
+                    content,
+                    variants,
+                )
+            )
+        return cls(assets, prefix)
+
+    def url(self, name: str) -> str:
+        """Fingerprinted URL of an asset, for templates"""
+        asset = self.assets.get(name)
+        if asset is None:
+            raise KeyError(f"Unknown static asset: {name}")
+        return f"{self.prefix}/{asset.url_name}"
+
+    def lookup(self, url_name: str) -> tuple[Asset, str] | None:
+        """The asset served at a path below the prefix, with its Cache-Control"""
+        return self._by_url.get(url_name)
+
+
+class StaticAssets:
+    """ASGI app serving an AssetManifest from memory"""
+
+    def __init__(self, manifest: AssetManifest):
+        self.manifest = manifest
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope)
+        response = self.respond(request, scope["path"].lstrip("/"))
+        await response(scope, receive, send)
+
+    def respond(self, request: Request, url_name: str) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405)
+        found = self.manifest.lookup(url_name)
+        if found is None:
+            return PlainTextResponse("Not Found", status_code=404)
+        asset, cache_control = found
+
+        encoding, body = asset.select(request.headers.get("accept-encoding", ""))
+        etag = f'"{asset.digest}-{encoding}"' if encoding else f'"{asset.digest}"'
+        headers = {
+            "Cache-Control": cache_control,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in {candidate.strip() for candidate in if_none_match.split(",")}:
+            return Response(status_code=304, headers=headers)
+        return Response(body, headers=headers, media_type=asset.media_type)
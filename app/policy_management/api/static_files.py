@@ -1,18 +1,22 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from .config import get_settings
+from .static_assets import AssetManifest, StaticAssets
 
 settings = get_settings()
 
-# Check that the directories exist
-settings.static_dir.mkdir(exist_ok=True)
-settings.templates_dir.mkdir(exist_ok=True)
-
-# Create templates instance
+# The one Jinja2 environment shared by every HTML route
 templates = Jinja2Templates(directory=str(settings.templates_dir))
 
 
 def setup_static_files(app: FastAPI):
     """Setup static files and templates"""
-    app.mount("/static", StaticFiles(directory=str(settings.static_dir)), name="static")
+    # Check that the directories exist
+    settings.static_dir.mkdir(exist_ok=True)
+    settings.templates_dir.mkdir(exist_ok=True)
+    # Fingerprint and precompress the assets once; templates link them through
+    # {{ asset_url("app.js") }}
+    manifest = AssetManifest.build(settings.static_dir)
+    app.state.assets = manifest
+    templates.env.globals["asset_url"] = manifest.url
+    app.mount("/static", StaticAssets(manifest), name="static")
@@ -0,0 +1,66 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from ..api.schemas import PolicyFilterDTO
+from .mappers import PolicyDtoMapper
+
+if TYPE_CHECKING:
+    from ..infrastructure.policy_snapshot import PolicyBookSnapshot
+
+"""Portfolio analytics served from the columnar policy book snapshot"""
+
+
+def format_minor(minor: int) -> str:
+    return f"{Decimal(minor).scaleb(-2):.2f}"
+
+
+class PolicyAnalyticsService:
+    """Aggregations over the filtered book, computed on a PolicyBookSnapshot"""
+
+    def __init__(self, snapshot_loader: Callable[[], "PolicyBookSnapshot"]):
+        self.snapshot_loader = snapshot_loader
+
+    def group_totals(self, filter_dto: PolicyFilterDTO, by: list[str]) -> dict:
+        """Policy counts and premium per status/type, always split by currency"""
+        from ..infrastructure.policy_snapshot import DIMENSIONS
+
+        for dimension in by:
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Cannot group by '{dimension}'")
+        snapshot, mask = self._select(filter_dto)
+        groups = snapshot.group_totals(list(dict.fromkeys(by)), mask)
+        for group in groups:
+            group["total_premium"] = format_minor(group.pop("premium_minor"))
+        groups.sort(key=lambda group: tuple(str(value) for value in group.values()))
+        return {"snapshot": snapshot.describe(), "groups": groups}
+
+    def premium_histogram(self, filter_dto: PolicyFilterDTO, bins: int) -> dict:
+        """Premium distribution per currency"""
+        snapshot, mask = self._select(filter_dto)
+        histograms = {
+            currency: {
+                "edges": [format_minor(round(edge)) for edge in histogram["edges"]],
+                "counts": histogram["counts"],
+            }
+            for currency, histogram in snapshot.premium_histogram(bins, mask).items()
+        }
+        return {"snapshot": snapshot.describe(), "histograms": histograms}
+
+    def expiry_ladder(
+        self, filter_dto: PolicyFilterDTO, as_of: date, bucket_days: int, buckets: int
+    ) -> dict:
+        """Counts and premium of policies expiring in consecutive windows after as_of"""
+        snapshot, mask = self._select(filter_dto)
+        ladder = snapshot.expiry_ladder(as_of, bucket_days, buckets, mask)
+        for rung in ladder:
+            rung["total_premium"] = {
+                currency: format_minor(minor)
+                for currency, minor in sorted(rung.pop("premium_minor").items())
+            }
+        return {"snapshot": snapshot.describe(), "as_of": as_of, "buckets": ladder}
+
+    def _select(self, filter_dto: PolicyFilterDTO):
+        policy_filter = PolicyDtoMapper.filter_from_dto(filter_dto)
+        snapshot = self.snapshot_loader()
+        return snapshot, snapshot.filter_mask(policy_filter)
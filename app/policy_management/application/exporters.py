@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from enum import Enum
+from ..domain.entities import Policy
+from .mappers import PolicyDtoMapper
+
+"""Chunked serializers for streaming bulk exports of the policy book
+
+Each exporter accepts either a plain or an async iterable of policies and
+returns an iterator of the same kind, so the sync and async services share
+one serialization path.
+"""
+
+EXPORT_FIELDS = [
+    "id",
+    "policy_number",
+    "insured_name",
+    "premium_amount",
+    "premium_currency",
+    "start_date",
+    "end_date",
+    "status",
+    "policy_type",
+]
+
+
+class ExportFormat(str, Enum):
+    """Supported bulk export formats"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        if self == ExportFormat.CSV:
+            return "text/csv"
+        return "application/x-ndjson"
+
+
+def encode_ndjson(policies: list[Policy]) -> bytes:
+    """Serialize a chunk of policies as newline-delimited JSON"""
+    return "".join(
+        json.dumps(PolicyDtoMapper.to_record(policy)) + "\n" for policy in policies
+    ).encode()
+
+
+def encode_csv(policies: list[Policy], header: bool = False) -> bytes:
+    """Serialize a chunk of policies as CSV rows, optionally preceded by the header"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    if header:
+        writer.writeheader()
+    writer.writerows(PolicyDtoMapper.to_record(policy) for policy in policies)
+    return buffer.getvalue().encode()
+
+
+def _encode(policies: list[Policy], export_format: ExportFormat, first: bool) -> bytes:
+    if export_format == ExportFormat.CSV:
+        return encode_csv(policies, header=first)
+    return encode_ndjson(policies)
+
+
+def _iter_export(
+    policies: Iterable[Policy], export_format: ExportFormat, rows_per_chunk: int
+) -> Iterator[bytes]:
+    chunk, first = [], True
+    for policy in policies:
+        chunk.append(policy)
+        if len(chunk) >= rows_per_chunk:
+            yield _encode(chunk, export_format, first)
+            chunk, first = [], False
+    if chunk or (first and export_format == ExportFormat.CSV):
+        yield _encode(chunk, export_format, first)
+
+
+async def _aiter_export(
+    policies: AsyncIterable[Policy], export_format: ExportFormat, rows_per_chunk: int
+) -> AsyncIterator[bytes]:
+    chunk, first = [], True
+    async for policy in policies:
+        chunk.append(policy)
+        if len(chunk) >= rows_per_chunk:
+            yield _encode(chunk, export_format, first)
+            chunk, first = [], False
+    if chunk or (first and export_format == ExportFormat.CSV):
+        yield _encode(chunk, export_format, first)
+
+
+def iter_export(policies, export_format: ExportFormat, rows_per_chunk: int = 500):
+    """Serialize policies in the requested format, rows_per_chunk rows per chunk"""
+    if isinstance(policies, AsyncIterable):
+        return _aiter_export(policies, export_format, rows_per_chunk)
+    return _iter_export(policies, export_format, rows_per_chunk)
+
+
+def _gzip_chunks(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def _agzip_chunks(
+    chunks: AsyncIterable[bytes], level: int
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def gzip_chunks(chunks, level: int = 6):
+    """Gzip a byte stream on the fly without buffering the whole payload"""
+    if isinstance(chunks, AsyncIterable):
+        return _agzip_chunks(chunks, level)
+    return _gzip_chunks(chunks, level)
@@ -1,7 +1,15 @@
 from ..domain.entities import Policy, PolicyStatus, PolicyType
 from ..domain.value_objects import PolicyNumber, Money, Period
-from ..api.schemas import CreatePolicyDTO, PolicyDTO, MoneyDTO, PeriodDTO, FlatPolicyDTO
-from datetime import date
+from ..domain.repository import PolicyFilter, PremiumTotal
+from ..api.schemas import (
+    CreatePolicyDTO,
+    PolicyDTO,
+    MoneyDTO,
+    PeriodDTO,
+    FlatPolicyDTO,
+    PolicyFilterDTO,
+)
+from .serializers import policy_to_dict
 from decimal import Decimal
 
 
@@ -55,36 +63,84 @@ class PolicyDtoMapper:
         )
 
     @staticmethod
-    def to_dict(policy: Policy) -> dict:
-        """Convert Policy domain entity to flat dictionary for JSON response"""
-        # Currency formatting
-        currency_map = {"USD": "$", "GBP": "£", "EUR": "€", "JPY": "¥"}
+    def filter_from_dto(filter_dto: PolicyFilterDTO) -> PolicyFilter:
+        """Convert PolicyFilterDTO query parameters to a domain PolicyFilter"""
+        currency = filter_dto.currency.upper() if filter_dto.currency else None
+        if currency is not None and (not currency.isalpha() or len(currency) != 3):
+            raise ValueError("Currency must be a 3-letter ISO code")
 
-        symbol = currency_map.get(policy.premium.currency, policy.premium.currency)
-        premium_amount = policy.premium.amount
+        min_premium = filter_dto.min_premium
+        max_premium = filter_dto.max_premium
+        if min_premium is not None and max_premium is not None:
+            if min_premium > max_premium:
+                raise ValueError("min_premium cannot be greater than max_premium")
 
-        if isinstance(premium_amount, float) or (
-            isinstance(premium_amount, Decimal)
-            and premium_amount == int(premium_amount)
-        ):
-            formatted_amount = f"{int(premium_amount):,}"
-        else:
-            formatted_amount = f"{premium_amount:,.2f}"
+        if filter_dto.active_from and filter_dto.active_to:
+            if filter_dto.active_from > filter_dto.active_to:
+                raise ValueError("active_from cannot be after active_to")
 
-        formatted_premium = f"{symbol}{formatted_amount}"
-
-        # Date formatting
-        def format_date(d: date) -> str:
-            return d.strftime("%d/%m/%Y")
+        return PolicyFilter(
+            status=(
+                PolicyStatus(filter_dto.status.lower()) if filter_dto.status else None
+            ),
+            policy_type=(
+                PolicyType(filter_dto.policy_type.capitalize())
+                if filter_dto.policy_type
+                else None
+            ),
+            currency=currency,
+            min_premium=float(min_premium) if min_premium is not None else None,
+            max_premium=float(max_premium) if max_premium is not None else None,
+            active_from=filter_dto.active_from,
+            active_to=filter_dto.active_to,
+        )
 
-        policy_dict = {
+    @staticmethod
+    def to_record(policy: Policy) -> dict:
+        """Convert Policy domain entity to an unformatted record for bulk export"""
+        return {
             "id": policy.id,
             "policy_number": policy.policy_number.value,
             "insured_name": policy.insured_name,
-            "premium": formatted_premium,
-            "status": policy.status.value.capitalize(),
+            "premium_amount": f"{policy.premium.amount:.2f}",
+            "premium_currency": policy.premium.currency,
+            "start_date": policy.period.start_date.isoformat(),
+            "end_date": policy.period.end_date.isoformat(),
+            "status": policy.status.value,
             "policy_type": policy.policy_type.value,
-            "start_date": format_date(policy.period.start_date),
-            "end_date": format_date(policy.period.end_date),
         }
-        return policy_dict
+
+    @staticmethod
+    def summary_to_dict(totals: list[PremiumTotal]) -> dict:
+        """Convert premium totals to per-group rows plus per-currency grand totals"""
+        by_currency = {}
+        for total in totals:
+            currency = by_currency.setdefault(
+                total.currency, {"policy_count": 0, "total_premium": Decimal(0)}
+            )
+            currency["policy_count"] += total.policy_count
+            currency["total_premium"] += total.total_premium
+        return {
+            "groups": [
+                {
+                    "policy_type": total.policy_type.value,
+                    "status": total.status.value,
+                    "currency": total.currency,
+                    "policy_count": total.policy_count,
+                    "total_premium": f"{total.total_premium:.2f}",
+                }
+                for total in totals
+            ],
+            "totals_by_currency": {
+                currency: {
+                    "policy_count": values["policy_count"],
+                    "total_premium": f"{values['total_premium']:.2f}",
+                }
+                for currency, values in sorted(by_currency.items())
+            },
+        }
+
+    @staticmethod
+    def to_dict(policy: Policy) -> dict:
+        """Convert Policy domain entity to flat dictionary for JSON response"""
+        return policy_to_dict(policy)
@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from ..domain.repository import PolicySortKey
+
+"""Opaque cursor encoding for keyset-paginated policy listings"""
+
+
+def encode_cursor(sort: PolicySortKey, key: tuple) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor"""
+    payload = json.dumps({"s": sort.value, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: PolicySortKey) -> tuple:
+    """Decode a cursor produced by encode_cursor for the same sort key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort.value or not isinstance(payload["k"], list):
+            raise ValueError("Cursor does not match the requested sort order")
+        return tuple(payload["k"])
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
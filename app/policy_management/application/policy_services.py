@@ -1,7 +1,150 @@
-from ..domain.entities import Policy
-from ..domain.repository import PolicyRepository
-from ..api.schemas import CreatePolicyDTO
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import datetime
+from dataclasses import dataclass
+from ..domain.entities import Policy, PolicyStatus
+from ..domain.repository import PolicyRepository, PolicySortKey, PremiumTotal
+from ..api.schemas import CreatePolicyDTO, PolicyFilterDTO
 from .mappers import PolicyDtoMapper
+from .pagination import encode_cursor, decode_cursor
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one item in a batch operation"""
+
+    index: int
+    policy_number: str
+    policy: Policy | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def _validate_batch(
+    policy_dtos: list[CreatePolicyDTO],
+) -> tuple[list[BatchItemResult], list[tuple[int, Policy]]]:
+    """Build entities for a batch, reporting invalid items and in-batch duplicates"""
+    results = []
+    candidates = []
+    seen = set()
+    for index, policy_dto in enumerate(policy_dtos):
+        try:
+            policy = PolicyDtoMapper.create_entity_from_dto(policy_dto)
+        except ValueError as e:
+            results.append(
+                BatchItemResult(index, policy_dto.policy_number, error=str(e))
+            )
+            continue
+        policy_number = policy.policy_number.value
+        if policy_number in seen:
+            results.append(
+                BatchItemResult(
+                    index, policy_number, error="Duplicate policy number in batch"
+                )
+            )
+            continue
+        seen.add(policy_number)
+        candidates.append((index, policy))
+    return results, candidates
+
+
+def _exclude_existing(
+    candidates: list[tuple[int, Policy]], existing: set[str]
+) -> tuple[list[BatchItemResult], list[tuple[int, Policy]]]:
+    """Report candidates whose policy numbers already exist"""
+    results = []
+    to_insert = []
+    for index, policy in candidates:
+        if policy.policy_number.value in existing:
+            results.append(
+                BatchItemResult(
+                    index,
+                    policy.policy_number.value,
+                    error="Policy number already exists",
+                )
+            )
+        else:
+            to_insert.append((index, policy))
+    return results, to_insert
+
+
+def _apply_transitions(
+    policy_numbers: list[str],
+    policies: list[Policy],
+    transition: Callable[[Policy], None],
+) -> tuple[list[BatchItemResult], list[tuple[int, Policy]], dict[int, PolicyStatus]]:
+    """Run a domain transition on each fetched policy in memory
+
+    Returns the per-item failures, the (index, policy) pairs to persist and the
+    status each of those policies was read with.
+    """
+    by_number = {policy.policy_number.value: policy for policy in policies}
+    results = []
+    to_update = []
+    read_statuses = {}
+    seen = set()
+    for index, policy_number in enumerate(policy_numbers):
+        if policy_number in seen:
+            results.append(
+                BatchItemResult(
+                    index, policy_number, error="Duplicate policy number in batch"
+                )
+            )
+            continue
+        seen.add(policy_number)
+        policy = by_number.get(policy_number)
+        if policy is None:
+            results.append(
+                BatchItemResult(index, policy_number, error="Policy not found")
+            )
+            continue
+        read_status = policy.status
+        try:
+            transition(policy)
+        except ValueError as e:
+            results.append(BatchItemResult(index, policy_number, error=str(e)))
+            continue
+        read_statuses[policy.id] = read_status
+        to_update.append((index, policy))
+    return results, to_update, read_statuses
+
+
+def _transition_results(
+    to_update: list[tuple[int, Policy]], updated: set[int]
+) -> list[BatchItemResult]:
+    """Report each persisted transition, flagging rows another writer changed first"""
+    return [
+        (
+            BatchItemResult(index, policy.policy_number.value, policy)
+            if policy.id in updated
+            else BatchItemResult(
+                index,
+                policy.policy_number.value,
+                error="Policy was modified concurrently",
+            )
+        )
+        for index, policy in to_update
+    ]
+
+
+def _page_arguments(
+    filter_dto: PolicyFilterDTO, cursor: str | None, sort: str
+) -> tuple:
+    """Validate listing arguments into a sort key, domain filter and keyset position"""
+    sort_key = PolicySortKey(sort)
+    policy_filter = PolicyDtoMapper.filter_from_dto(filter_dto)
+    after = decode_cursor(cursor, sort_key) if cursor else None
+    return sort_key, policy_filter, after
+
+
+def _search_query(query: str) -> str:
+    """Normalise a search query, rejecting blank ones"""
+    query = " ".join(query.split())
+    if not query:
+        raise ValueError("Search query must not be empty")
+    return query
 
 
 class PolicyService:
@@ -11,15 +154,43 @@ class PolicyService:
         self.repository = repository
 
     def create_policy(self, policy_dto: CreatePolicyDTO) -> Policy:
-        """Create a new policy from CreatePolicyDTO"""
+        """Create a new policy from CreatePolicyDTO
+
+        Duplicate policy numbers are rejected by the repository's unique constraint.
+        """
         try:
-            if self.repository.get_policy_by_policy_number(policy_dto.policy_number):
-                raise ValueError("Policy number already exists")
             policy = PolicyDtoMapper.create_entity_from_dto(policy_dto)
             return self.repository.add_policy(policy)
         except Exception as e:
             raise e
 
+    def create_policies(
+        self, policy_dtos: list[CreatePolicyDTO]
+    ) -> list[BatchItemResult]:
+        """Create many policies at once, returning a result per input item
+
+        Items failing validation or duplicating an existing (or earlier) policy
+        number are reported individually; the rest are checked for duplicates
+        with one query and inserted in one transaction.
+        """
+        try:
+            results, candidates = _validate_batch(policy_dtos)
+            existing = self.repository.find_existing_policy_numbers(
+                [policy.policy_number.value for _, policy in candidates]
+            )
+            rejected, to_insert = _exclude_existing(candidates, existing)
+            results.extend(rejected)
+
+            created = self.repository.add_policies([policy for _, policy in to_insert])
+            for (index, _), policy in zip(to_insert, created):
+                results.append(
+                    BatchItemResult(index, policy.policy_number.value, policy)
+                )
+
+            return sorted(results, key=lambda result: result.index)
+        except Exception as e:
+            raise e
+
     def activate_policy(self, policy_number: str) -> Policy:
         """Activate an existing policy by policy number"""
         try:
@@ -42,6 +213,40 @@ class PolicyService:
         except Exception as e:
             raise e
 
+    def activate_policies(self, policy_numbers: list[str]) -> list[BatchItemResult]:
+        """Activate many policies, returning a result per input policy number"""
+        try:
+            return self._transition_policies(policy_numbers, Policy.activate)
+        except Exception as e:
+            raise e
+
+    def cancel_policies(
+        self, policy_numbers: list[str], reason: str | None = None
+    ) -> list[BatchItemResult]:
+        """Cancel many policies with an optional reason, returning a result per input"""
+        try:
+            return self._transition_policies(
+                policy_numbers, lambda policy: policy.cancel(reason)
+            )
+        except Exception as e:
+            raise e
+
+    def _transition_policies(
+        self, policy_numbers: list[str], transition: Callable[[Policy], None]
+    ) -> list[BatchItemResult]:
+        """Fetch with one query, transition in memory, persist one UPDATE per status"""
+        policies = self.repository.get_policies_by_policy_numbers(
+            list(set(policy_numbers))
+        )
+        results, to_update, read_statuses = _apply_transitions(
+            policy_numbers, policies, transition
+        )
+        updated = self.repository.update_policy_statuses(
+            [policy for _, policy in to_update], read_statuses
+        )
+        results.extend(_transition_results(to_update, updated))
+        return sorted(results, key=lambda result: result.index)
+
     def get_policy(self, policy_number: str) -> Policy | None:
         """Retrieve a policy by policy number"""
         try:
@@ -49,9 +254,192 @@ class PolicyService:
         except Exception as e:
             raise e
 
+    def get_policy_version(self, policy_number: str) -> tuple[int, datetime] | None:
+        """ID and updated_at of a policy, without loading it"""
+        try:
+            return self.repository.get_policy_version(policy_number)
+        except Exception as e:
+            raise e
+
     def list_policies(self) -> list[Policy]:
         """List all policies"""
         try:
             return self.repository.list_all_policies()
         except Exception as e:
             raise e
+
+    def list_policies_page(
+        self,
+        filter_dto: PolicyFilterDTO,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = PolicySortKey.CREATED_AT.value,
+    ) -> tuple[list[Policy], str | None]:
+        """List one page of filtered policies and the cursor of the next page"""
+        try:
+            sort_key, policy_filter, after = _page_arguments(filter_dto, cursor, sort)
+            page = self.repository.list_policies_page(
+                policy_filter, limit, after=after, sort=sort_key
+            )
+            next_cursor = (
+                encode_cursor(sort_key, page.next_key) if page.next_key else None
+            )
+            return page.items, next_cursor
+        except Exception as e:
+            raise e
+
+    def get_premium_summary(self) -> list[PremiumTotal]:
+        """Gross written premium by policy type, status and currency"""
+        try:
+            return self.repository.get_premium_summary()
+        except Exception as e:
+            raise e
+
+    def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> tuple[list[Policy], int | None]:
+        """Search policies by insured name, returning matches and the next offset"""
+        try:
+            page = self.repository.search_policies(
+                _search_query(query), limit, offset, fuzzy
+            )
+            return page.items, page.next_key[0] if page.next_key else None
+        except Exception as e:
+            raise e
+
+    def export_policies(self, filter_dto: PolicyFilterDTO) -> Iterator[Policy]:
+        """Stream every policy matching the filters
+
+        The filters are validated eagerly so errors surface before streaming starts.
+        """
+        try:
+            policy_filter = PolicyDtoMapper.filter_from_dto(filter_dto)
+            return self.repository.iter_policies(policy_filter)
+        except Exception as e:
+            raise e
+
+
+class AsyncPolicyService:
+    """Async variant of PolicyService for repositories built on AsyncSession"""
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    async def create_policy(self, policy_dto: CreatePolicyDTO) -> Policy:
+        """Create a new policy from CreatePolicyDTO"""
+        policy = PolicyDtoMapper.create_entity_from_dto(policy_dto)
+        return await self.repository.add_policy(policy)
+
+    async def create_policies(
+        self, policy_dtos: list[CreatePolicyDTO]
+    ) -> list[BatchItemResult]:
+        """Create many policies at once, returning a result per input item"""
+        results, candidates = _validate_batch(policy_dtos)
+        existing = await self.repository.find_existing_policy_numbers(
+            [policy.policy_number.value for _, policy in candidates]
+        )
+        rejected, to_insert = _exclude_existing(candidates, existing)
+        results.extend(rejected)
+
+        created = await self.repository.add_policies(
+            [policy for _, policy in to_insert]
+        )
+        for (index, _), policy in zip(to_insert, created):
+            results.append(BatchItemResult(index, policy.policy_number.value, policy))
+
+        return sorted(results, key=lambda result: result.index)
+
+    async def activate_policy(self, policy_number: str) -> Policy:
+        """Activate an existing policy by policy number"""
+        policy = await self.repository.get_policy_by_policy_number(policy_number)
+        if not policy:
+            raise ValueError("Policy not found")
+        policy.activate()
+        return await self.repository.update_policy(policy)
+
+    async def cancel_policy(self, policy_number: str, reason: str | None = None):
+        """Cancel an existing policy by policy number with optional reason"""
+        policy = await self.repository.get_policy_by_policy_number(policy_number)
+        if not policy:
+            raise ValueError("Policy not found")
+        policy.cancel(reason)
+        await self.repository.update_policy(policy)
+
+    async def activate_policies(
+        self, policy_numbers: list[str]
+    ) -> list[BatchItemResult]:
+        """Activate many policies, returning a result per input policy number"""
+        return await self._transition_policies(policy_numbers, Policy.activate)
+
+    async def cancel_policies(
+        self, policy_numbers: list[str], reason: str | None = None
+    ) -> list[BatchItemResult]:
+        """Cancel many policies with an optional reason, returning a result per input"""
+        return await self._transition_policies(
+            policy_numbers, lambda policy: policy.cancel(reason)
+        )
+
+    async def _transition_policies(
+        self, policy_numbers: list[str], transition: Callable[[Policy], None]
+    ) -> list[BatchItemResult]:
+        """Fetch with one query, transition in memory, persist one UPDATE per status"""
+        policies = await self.repository.get_policies_by_policy_numbers(
+            list(set(policy_numbers))
+        )
+        results, to_update, read_statuses = _apply_transitions(
+            policy_numbers, policies, transition
+        )
+        updated = await self.repository.update_policy_statuses(
+            [policy for _, policy in to_update], read_statuses
+        )
+        results.extend(_transition_results(to_update, updated))
+        return sorted(results, key=lambda result: result.index)
+
+    async def get_policy(self, policy_number: str) -> Policy | None:
+        """Retrieve a policy by policy number"""
+        return await self.repository.get_policy_by_policy_number(policy_number)
+
+    async def get_policy_version(
+        self, policy_number: str
+    ) -> tuple[int, datetime] | None:
+        """ID and updated_at of a policy, without loading it"""
+        return await self.repository.get_policy_version(policy_number)
+
+    async def list_policies(self) -> list[Policy]:
+        """List all policies"""
+        return await self.repository.list_all_policies()
+
+    async def list_policies_page(
+        self,
+        filter_dto: PolicyFilterDTO,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = PolicySortKey.CREATED_AT.value,
+    ) -> tuple[list[Policy], str | None]:
+        """List one page of filtered policies and the cursor of the next page"""
+        sort_key, policy_filter, after = _page_arguments(filter_dto, cursor, sort)
+        page = await self.repository.list_policies_page(
+            policy_filter, limit, after=after, sort=sort_key
+        )
+        next_cursor = encode_cursor(sort_key, page.next_key) if page.next_key else None
+        return page.items, next_cursor
+
+    async def get_premium_summary(self) -> list[PremiumTotal]:
+        """Gross written premium by policy type, status and currency"""
+        return await self.repository.get_premium_summary()
+
+    async def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> tuple[list[Policy], int | None]:
+        """Search policies by insured name, returning matches and the next offset"""
+        page = await self.repository.search_policies(
+            _search_query(query), limit, offset, fuzzy
+        )
+        return page.items, page.next_key[0] if page.next_key else None
+
+    async def export_policies(
+        self, filter_dto: PolicyFilterDTO
+    ) -> AsyncIterator[Policy]:
+        """Stream every policy matching the filters, validating them eagerly"""
+        policy_filter = PolicyDtoMapper.filter_from_dto(filter_dto)
+        return self.repository.iter_policies(policy_filter)
@@ -0,0 +1,70 @@
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from ..domain.entities import Policy, PolicyStatus
+
+"""Fast path for the flat, display-formatted policy representation
+
+Produces exactly what PolicyDtoMapper.to_dict always has, with the lookup
+tables built once at import time and dates formatted through a cache, since
+a page of policies shares few distinct start and end dates.
+"""
+
+CURRENCY_SYMBOLS = {"USD": "$", "GBP": "£", "EUR": "€", "JPY": "¥"}
+
+STATUS_LABELS = {status: status.value.capitalize() for status in PolicyStatus}
+
+# Keys of policy_to_dict, in order; the columns of the columnar representation
+POLICY_FIELDS = (
+    "id",
+    "policy_number",
+    "insured_name",
+    "premium",
+    "status",
+    "policy_type",
+    "start_date",
+    "end_date",
+)
+
+
+@lru_cache(maxsize=8192)
+def format_date(value: date) -> str:
+    return value.strftime("%d/%m/%Y")
+
+
+def format_premium(amount, currency: str) -> str:
+    """Currency symbol plus amount; whole amounts (and floats) drop the decimals"""
+    symbol = CURRENCY_SYMBOLS.get(currency, currency)
+    if isinstance(amount, float) or (
+        isinstance(amount, Decimal) and amount == int(amount)
+    ):
+        return f"{symbol}{int(amount):,}"
+    return f"{symbol}{amount:,.2f}"
+
+
+def policy_to_dict(policy: Policy) -> dict:
+    """Convert Policy domain entity to flat dictionary for JSON response"""
+    premium = policy.premium
+    period = policy.period
+    return {
+        "id": policy.id,
+        "policy_number": policy.policy_number.value,
+        "insured_name": policy.insured_name,
+        "premium": format_premium(premium.amount, premium.currency),
+        "status": STATUS_LABELS[policy.status],
+        "policy_type": policy.policy_type.value,
+        "start_date": format_date(period.start_date),
+        "end_date": format_date(period.end_date),
+    }
+
+
+def policies_to_dicts(policies: list[Policy]) -> list[dict]:
+    return [policy_to_dict(policy) for policy in policies]
+
+
+def policies_to_columns(policies: list[Policy]) -> dict:
+    """Columnar form of policies_to_dicts: the field names once, then one array per policy"""
+    return {
+        "fields": list(POLICY_FIELDS),
+        "rows": [list(policy_to_dict(policy).values()) for policy in policies],
+    }
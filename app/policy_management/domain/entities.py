@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from ..domain.value_objects import Money, PolicyNumber, Period
 
@@ -27,6 +28,17 @@ class PolicyType(str, Enum):
 class Policy:
     """Policy domain entity representing an insurance policy"""
 
+    __slots__ = (
+        "id",
+        "policy_number",
+        "insured_name",
+        "premium",
+        "status",
+        "policy_type",
+        "period",
+        "updated_at",
+    )
+
     def __init__(
         self,
         policy_number: PolicyNumber,
@@ -36,6 +48,7 @@ class Policy:
         status: PolicyStatus = PolicyStatus.PENDING,
         policy_type: PolicyType = PolicyType.PROPERTY,
         id: int | None = None,
+        updated_at: datetime | None = None,
     ):
         self.id = id
         self.policy_number = policy_number
@@ -44,6 +57,8 @@ class Policy:
         self.status = status
         self.policy_type = policy_type
         self.period = period
+        # Last persisted modification time, set by the repository
+        self.updated_at = updated_at
 
     def __repr__(self) -> str:
         """String representation of the Policy entity"""
@@ -1,14 +1,66 @@
 from abc import ABC, abstractmethod
-from ..domain.entities import Policy
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from ..domain.entities import Policy, PolicyStatus, PolicyType
 
 """Abstract repository interface for Policy entity"""
 
 
+class PolicySortKey(str, Enum):
+    """Orderings supported by keyset-paginated policy listings"""
+
+    CREATED_AT = "created_at"
+    POLICY_NUMBER = "policy_number"
+
+
+@dataclass(frozen=True)
+class PolicyFilter:
+    """Server-side filter criteria for policy listings
+
+    The active_from/active_to bounds select policies whose period overlaps
+    the given window; either bound may be omitted.
+    """
+
+    status: PolicyStatus | None = None
+    policy_type: PolicyType | None = None
+    currency: str | None = None
+    min_premium: float | None = None
+    max_premium: float | None = None
+    active_from: date | None = None
+    active_to: date | None = None
+
+
+@dataclass(frozen=True)
+class PremiumTotal:
+    """Gross written premium for one (policy type, status, currency) group"""
+
+    policy_type: PolicyType
+    status: PolicyStatus
+    currency: str
+    policy_count: int
+    total_premium: Decimal
+
+
+@dataclass(frozen=True)
+class PolicyPage:
+    """A single page of policies plus the keyset position of the next page"""
+
+    items: list[Policy] = field(default_factory=list)
+    next_key: tuple | None = None
+
+
 class PolicyRepository(ABC):
     @abstractmethod
     def add_policy(self, policy: Policy) -> Policy:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_policies(self, policies: list[Policy]) -> list[Policy]:
+        raise NotImplementedError
+
     @abstractmethod
     def update_policy(self, policy: Policy) -> Policy:
         raise NotImplementedError
@@ -25,6 +77,59 @@ class PolicyRepository(ABC):
     def get_policy_by_policy_number(self, policy_number: str) -> Policy | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_policy_version(self, policy_number: str) -> tuple[int, datetime] | None:
+        """The ID and updated_at of a policy, enough to build its ETag"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_existing_policy_numbers(self, policy_numbers: list[str]) -> set[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def list_all_policies(self) -> list[Policy]:
         raise NotImplementedError
+
+    @abstractmethod
+    def list_policies_page(
+        self,
+        policy_filter: PolicyFilter,
+        limit: int,
+        after: tuple | None = None,
+        sort: PolicySortKey = PolicySortKey.CREATED_AT,
+    ) -> PolicyPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_policies(
+        self, policy_filter: PolicyFilter, chunk_size: int = 1000
+    ) -> Iterator[Policy]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_policies_by_policy_numbers(self, policy_numbers: list[str]) -> list[Policy]:
+        """Retrieve every existing policy among the given numbers in one query"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_policy_statuses(
+        self, policies: list[Policy], read_statuses: dict[int, PolicyStatus]
+    ) -> set[int]:
+        """Persist the status of many policies with one UPDATE per target status
+
+        Rows are only updated while still in the status they were read with
+        (read_statuses, by policy ID). Returns the IDs of the rows updated.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_premium_summary(self) -> list[PremiumTotal]:
+        """Premium totals per type, status and currency, read from the summary table"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> PolicyPage:
+        """Ranked insured-name matches; next_key holds the next page's offset"""
+        raise NotImplementedError
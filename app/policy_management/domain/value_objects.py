@@ -2,10 +2,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 
-"""This file contains value object definitions for Policy Management Domain"""
+"""This file contains value object definitions for Policy Management Domain
 
+Value objects are slotted. Their trusted() constructors skip validation and are
+only for values read back from storage, which were validated when written.
+"""
 
-@dataclass(frozen=True)
+_new = object.__new__
+
+
+@dataclass(frozen=True, slots=True)
 class Money:
     amount: float
     currency: str = "GBP"
@@ -16,8 +22,20 @@ class Money:
         if not self.currency.isalpha() or len(self.currency) != 3:
             raise ValueError("Currency must be a 3-letter ISO code")
 
+    @classmethod
+    def trusted(cls, amount: float, currency: str) -> Money:
+        money = _new(cls)
+        _set_amount(money, amount)
+        _set_currency(money, currency)
+        return money
+
 
-@dataclass(frozen=True)
+# Slot descriptors assign directly, bypassing the frozen __setattr__
+_set_amount = Money.amount.__set__
+_set_currency = Money.currency.__set__
+
+
+@dataclass(frozen=True, slots=True)
 class PolicyNumber:
     value: str
 
@@ -27,8 +45,17 @@ class PolicyNumber:
         if not self.value.isalnum():
             raise ValueError("Policy number must be alphanumeric")
 
+    @classmethod
+    def trusted(cls, value: str) -> PolicyNumber:
+        policy_number = _new(cls)
+        _set_value(policy_number, value)
+        return policy_number
+
 
-@dataclass(frozen=True)
+_set_value = PolicyNumber.value.__set__
+
+
+@dataclass(frozen=True, slots=True)
 class Period:
     start_date: date
     end_date: date
@@ -40,8 +67,19 @@ class Period:
         if self.end_date <= self.start_date:
             raise ValueError("End date must be after start date")
 
+    @classmethod
+    def trusted(cls, start_date: date, end_date: date) -> Period:
+        period = _new(cls)
+        _set_start_date(period, start_date)
+        _set_end_date(period, end_date)
+        return period
+
     @property
     def is_active(self) -> bool:
         today = date.today()
         result = self.start_date <= today <= self.end_date
         return result
+
+
+_set_start_date = Period.start_date.__set__
+_set_end_date = Period.end_date.__set__
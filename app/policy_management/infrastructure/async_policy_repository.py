@@ -0,0 +1,245 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..domain.entities import Policy, PolicyStatus
+from ..domain.repository import PolicyFilter, PolicyPage, PolicySortKey, PremiumTotal
+from .models import PolicyModel
+from .mappers import PolicyDbMapper
+from .book_version import book_version
+from .reference_data import ReferenceData, reference_data
+from . import policy_statements as statements
+from . import summary
+
+"""AsyncSession-based implementation of the Policy Repository
+
+Executes the same statements as SQLPolicyRepository without blocking the
+event loop, so async routes never borrow a threadpool worker.
+"""
+
+
+class AsyncSQLPolicyRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add_policy(self, policy: Policy) -> Policy:
+        """Add a new policy with a single INSERT"""
+        try:
+            statement = statements.insert_policy(policy, await self._reference_data())
+            if self._dialect.insert_returning:
+                result = await self.db.execute(
+                    statement.returning(*statements.POLICY_COLUMNS)
+                )
+                row = result.one()
+                policy_id = row.id
+            else:
+                row = None
+                result = await self.db.execute(statement)
+                policy_id = result.inserted_primary_key[0]
+            await self.db.commit()
+            book_version.bump()
+            return statements.written_policy(policy, row, policy_id)
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise statements.duplicate_policy_number(e) or e
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def add_policies(self, policies: list[Policy]) -> list[Policy]:
+        """Insert many policies in one transaction with a single executemany INSERT"""
+        if not policies:
+            return []
+        try:
+            refs = await self._reference_data()
+            rows = [statements.policy_values(policy, refs) for policy in policies]
+            if self._dialect.insert_executemany_returning:
+                result = await self.db.execute(
+                    insert(PolicyModel).returning(
+                        PolicyModel.policy_number, PolicyModel.id
+                    ),
+                    rows,
+                )
+            else:
+                await self.db.execute(insert(PolicyModel), rows)
+                result = await self.db.execute(
+                    select(PolicyModel.policy_number, PolicyModel.id).where(
+                        PolicyModel.policy_number.in_(
+                            [row["policy_number"] for row in rows]
+                        )
+                    )
+                )
+            ids = dict(result.all())
+            await self.db.commit()
+            book_version.bump()
+
+            for policy in policies:
+                policy.id = ids[policy.policy_number.value]
+            return policies
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise statements.duplicate_policy_number(e) or e
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def update_policy(self, policy: Policy) -> Policy:
+        """Update an existing policy with a single UPDATE, returning the stored row"""
+        try:
+            statement = statements.update_policy(policy, await self._reference_data())
+            if self._dialect.update_returning:
+                result = await self.db.execute(
+                    statement.returning(*statements.POLICY_COLUMNS)
+                )
+                row = result.first()
+                found = row is not None
+            else:
+                row = None
+                found = (await self.db.execute(statement)).rowcount > 0
+            if not found:
+                raise ValueError("Policy not found")
+            await self.db.commit()
+            book_version.bump()
+            return statements.written_policy(policy, row, policy.id)
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def cancel_policy(self, policy: Policy) -> None:
+        """Cancel a policy by updating its status to cancelled"""
+        try:
+            await self.db.execute(
+                statements.cancel_policy(policy.id, await self._reference_data())
+            )
+            await self.db.commit()
+            book_version.bump()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def update_policy_statuses(
+        self, policies: list[Policy], read_statuses: dict[int, PolicyStatus]
+    ) -> set[int]:
+        """Persist many status transitions in one transaction, one UPDATE per target status"""
+        if not policies:
+            return set()
+        try:
+            # id -> updated_at of the UPDATE that wrote it
+            written = {}
+            for statement, ids, updated_at in statements.update_statuses(
+                policies, read_statuses, await self._reference_data()
+            ):
+                if self._dialect.update_returning:
+                    result = await self.db.scalars(statement.returning(PolicyModel.id))
+                else:
+                    await self.db.execute(statement)
+                    result = await self.db.scalars(
+                        statements.select_updated_ids(ids, updated_at)
+                    )
+                written.update(dict.fromkeys(result.all(), updated_at))
+            await self.db.commit()
+            book_version.bump()
+
+            for policy in policies:
+                if policy.id in written:
+                    policy.updated_at = written[policy.id]
+            return set(written)
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def get_policy_by_id(self, policy_id: int) -> Policy | None:
+        """Retrieve a policy by its ID"""
+        result = await self.db.scalars(
+            statements.select_policies().where(PolicyModel.id == policy_id)
+        )
+        return PolicyDbMapper.to_domain(result.first())
+
+    async def get_policy_by_policy_number(self, policy_number: str) -> Policy | None:
+        """Retrieve a policy by its policy number"""
+        result = await self.db.scalars(
+            statements.select_policies().where(
+                PolicyModel.policy_number == policy_number
+            )
+        )
+        return PolicyDbMapper.to_domain(result.first())
+
+    async def get_policy_version(
+        self, policy_number: str
+    ) -> tuple[int, datetime] | None:
+        """Retrieve a policy's ID and updated_at with one narrow SELECT"""
+        row = (await self.db.execute(statements.select_version(policy_number))).first()
+        return tuple(row) if row else None
+
+    async def get_policies_by_policy_numbers(
+        self, policy_numbers: list[str]
+    ) -> list[Policy]:
+        """Retrieve every existing policy among the given numbers in one IN query"""
+        if not policy_numbers:
+            return []
+        result = await self.db.scalars(statements.select_by_numbers(policy_numbers))
+        return [PolicyDbMapper.to_domain(db_policy) for db_policy in result]
+
+    async def find_existing_policy_numbers(self, policy_numbers: list[str]) -> set[str]:
+        """Return which of the given policy numbers already exist, in one IN query"""
+        if not policy_numbers:
+            return set()
+        result = await self.db.scalars(
+            statements.select_existing_numbers(policy_numbers)
+        )
+        return set(result)
+
+    async def list_all_policies(self) -> list[Policy]:
+        """List all policies in the database"""
+        result = await self.db.scalars(statements.select_policies())
+        return [PolicyDbMapper.to_domain(db_policy) for db_policy in result]
+
+    async def list_policies_page(
+        self,
+        policy_filter: PolicyFilter,
+        limit: int,
+        after: tuple | None = None,
+        sort: PolicySortKey = PolicySortKey.CREATED_AT,
+    ) -> PolicyPage:
+        """List one page of policies matching the filter using keyset pagination"""
+        statement = statements.select_page(
+            policy_filter, await self._reference_data(), limit, after, sort
+        )
+        result = await self.db.scalars(statement)
+        return statements.build_page(result.all(), limit, sort)
+
+    async def iter_policies(
+        self, policy_filter: PolicyFilter, chunk_size: int = 1000
+    ) -> AsyncIterator[Policy]:
+        """Stream policies matching the filter from a server-side cursor"""
+        statement = statements.select_export(
+            policy_filter, await self._reference_data(), chunk_size
+        )
+        async for db_policy in await self.db.stream_scalars(statement):
+            yield PolicyDbMapper.to_domain(db_policy)
+
+    async def get_premium_summary(self) -> list[PremiumTotal]:
+        """Premium totals per type, status and currency from the summary table"""
+        result = await self.db.scalars(summary.select_summary())
+        return summary.to_premium_totals(result.all(), await self._reference_data())
+
+    async def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> PolicyPage:
+        """Search insured names through the dialect's full-text index"""
+        statement = statements.select_search(self._dialect, query, limit, offset, fuzzy)
+        result = await self.db.scalars(statement)
+        return statements.build_search_page(result.all(), limit, offset)
+
+    # Helper methods for database operations
+    async def _reference_data(self) -> ReferenceData:
+        """Reference data for this engine, loaded through the sync facade on first use"""
+        refs = reference_data.cached(self.db)
+        if refs is None:
+            refs = await self.db.run_sync(reference_data.load)
+        return refs
+
+    @property
+    def _dialect(self):
+        return self.db.get_bind().dialect
@@ -0,0 +1,35 @@
+import threading
+import uuid
+
+"""In-process version counter of the policy book"""
+
+
+class BookVersion:
+    """Counter bumped after every committed write to the policies table
+
+    The epoch is unique per process, so tags built from the version never
+    collide between processes or across restarts.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @property
+    def tag(self) -> str:
+        """Version identifier that is unique across processes"""
+        return f"{self.epoch}-{self._value}"
+
+    def bump(self) -> int:
+        """Record a write, returning the new version"""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+book_version = BookVersion()
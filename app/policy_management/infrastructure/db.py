@@ -1,14 +1,117 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+from sqlalchemy import create_engine, event, inspect, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
-import os
+from ..api.config import Settings, get_settings
 
 """Database setup and session management for Policy Management"""
 
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./policies.db")
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and make_url(url).database in (None, "", ":memory:")
+
+
+def engine_options(url: str, settings: Settings, is_async: bool = False) -> dict:
+    """Keyword arguments for create_engine/create_async_engine for this URL
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool, since
+    every new connection would otherwise see an empty database.
+    """
+    options = {}
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        if is_async and "pool_size" in options:
+            # aiosqlite defaults to NullPool for file databases
+            options["poolclass"] = AsyncAdaptedQueuePool
+        options["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.sqlite_busy_timeout_ms / 1000,
+        }
+    elif backend == "postgresql":
+        # asyncpg names the connect timeout differently from psycopg2
+        timeout_arg = "timeout" if is_async else "connect_timeout"
+        options["connect_args"] = {timeout_arg: settings.db_connect_timeout}
+    return options
+
+
+def apply_sqlite_pragmas(engine, settings: Settings) -> None:
+    """Configure every new SQLite connection of a sync engine for concurrent use
+
+    WAL lets readers proceed while a write is in progress, synchronous=NORMAL
+    is durable in WAL mode without an fsync per commit, and busy_timeout makes
+    writers wait for the lock instead of failing with "database is locked".
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+        f"PRAGMA cache_size = -{int(settings.sqlite_cache_size_kib)}",
+        f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size)}",
+    ]
+    if not _is_memory_sqlite(str(engine.url)):
+        pragmas.insert(0, f"PRAGMA journal_mode = {settings.sqlite_journal_mode}")
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(settings: Settings | None = None, url: str | None = None):
+    """Build the application engine from Settings"""
+    settings = settings or get_settings()
+    url = url or settings.database_url
+    engine = create_engine(url, **engine_options(url, settings))
+    if _is_sqlite(url):
+        apply_sqlite_pragmas(engine, settings)
+    return engine
+
+
+def create_async_db_engine(settings: Settings | None = None, url: str | None = None):
+    """Build the async engine from Settings; requires aiosqlite/asyncpg"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = settings or get_settings()
+    url = to_async_url(url or settings.database_url)
+    async_engine = create_async_engine(
+        url, **engine_options(url, settings, is_async=True)
+    )
+    if _is_sqlite(url):
+        apply_sqlite_pragmas(async_engine.sync_engine, settings)
+    return async_engine
+
+
+def get_pool_status(bind=None) -> dict:
+    """Connection pool statistics for monitoring"""
+    pool = (bind if bind is not None else engine).pool
+    status = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        metric = getattr(pool, name, None)
+        if callable(metric):
+            status[name] = metric()
+    return status
+
+
+SQLALCHEMY_DATABASE_URL = get_settings().database_url
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -22,22 +125,108 @@ def get_db():
         db.close()
 
 
-def create_tables():
+def to_async_url(url: str) -> str:
+    """Map a sync database URL onto the matching async driver"""
+    async_drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    scheme, separator, rest = url.partition("://")
+    backend = scheme.split("+")[0]
+    return f"{async_drivers.get(backend, scheme)}{separator}{rest}"
+
+
+@lru_cache(maxsize=None)
+def get_async_engine():
+    """The async engine, created on first use
+
+    Deferred so the async driver (aiosqlite/asyncpg) is only required when
+    the async data path is enabled.
+    """
+    return create_async_db_engine()
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker():
+    """Session factory for the async engine"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def create_tables(bind=None):
     from . import models
 
-    Base.metadata.create_all(bind=engine)
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind=bind)
+
+    # create_all skips indexes on tables that already exist
+    for index in models.PolicyModel.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
+    # Likewise the search index and summary triggers, which are only created
+    # alongside new tables
+    with bind.begin() as connection:
+        models.install_derived_structures(connection)
     print("Database tables created successfully!")
 
 
+def schema_version(bind=None) -> str | None:
+    """The schema version recorded in schema_meta, or None if never initialized"""
+    from .models import SchemaMetaModel
+
+    bind = bind if bind is not None else engine
+    with bind.connect() as connection:
+        if not inspect(connection).has_table(SchemaMetaModel.__tablename__):
+            return None
+        return connection.execute(
+            select(SchemaMetaModel.value).where(SchemaMetaModel.key == "schema_version")
+        ).scalar()
+
+
+def initialize_database(bind=None) -> bool:
+    """Bring the database up to SCHEMA_VERSION without touching existing policies
+
+    Creates missing tables, indexes and derived structures, adds missing
+    lookup rows and records the version. A database already at the current
+    version costs two cheap queries. Returns whether any work was done.
+    """
+    from .models import SCHEMA_VERSION, SchemaMetaModel
+    from .seed_data import ensure_reference_data
+
+    bind = bind if bind is not None else engine
+    if schema_version(bind) == SCHEMA_VERSION:
+        return False
+
+    create_tables(bind)
+    db = Session(bind=bind)
+    try:
+        ensure_reference_data(db)
+        db.merge(SchemaMetaModel(key="schema_version", value=SCHEMA_VERSION))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+    return True
+
+
 def seed_initial_data():
-    """Create tables and seed initial data"""
-    create_tables()
-    from .seed_data import seed_database
+    """Initialize the database and add any missing sample policies"""
+    initialize_database()
+    from .seed_data import seed_policies
+    from .reference_data import reference_data
 
     db = SessionLocal()
     try:
-        seed_database(db)
-        print("Database initialization complete!")
+        seed_policies(db)
+        reference_data.load(db)
+        print("Sample data seeded!")
     except Exception as e:
         print(f"Error seeding database: {e}")
         raise
@@ -1,5 +1,12 @@
 -- TMHCC Policy Management Database Schema
 
+-- Initialization markers; startup skips all work when schema_version is current
+CREATE TABLE IF NOT EXISTS schema_meta (
+    key VARCHAR(50) PRIMARY KEY,
+    value VARCHAR(100) NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+
 -- Policy Statuses lookup table
 CREATE TABLE IF NOT EXISTS policy_statuses (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,4 +45,42 @@ CREATE INDEX IF NOT EXISTS idx_policies_insured_name ON policies(insured_name);
 CREATE INDEX IF NOT EXISTS idx_policies_status ON policies(status_id);
 CREATE INDEX IF NOT EXISTS idx_policies_type ON policies(type_id);
 CREATE INDEX IF NOT EXISTS idx_policies_period ON policies(period_start_date, period_end_date);
-CREATE INDEX IF NOT EXISTS idx_policies_created_at ON policies(created_at);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_policies_created_at ON policies(created_at);
+
+-- Composite indexes for keyset pagination and filtered listings
+CREATE INDEX IF NOT EXISTS idx_policies_created_at_id ON policies(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_policies_status_created ON policies(status_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_policies_type_created ON policies(type_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_policies_currency_created ON policies(premium_currency, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_policies_premium ON policies(premium_amount);
+CREATE INDEX IF NOT EXISTS idx_policies_status_end ON policies(status_id, period_end_date);
+CREATE INDEX IF NOT EXISTS idx_policies_status_start ON policies(status_id, period_start_date);
+-- Insured-name search (SQLite FTS5 trigram index kept in sync by triggers;
+-- PostgreSQL uses a pg_trgm GIN index instead, see infrastructure/search.py)
+CREATE VIRTUAL TABLE IF NOT EXISTS policies_fts USING fts5(
+    insured_name, content='policies', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS policies_fts_insert AFTER INSERT ON policies BEGIN
+    INSERT INTO policies_fts(rowid, insured_name) VALUES (new.id, new.insured_name);
+END;
+CREATE TRIGGER IF NOT EXISTS policies_fts_delete AFTER DELETE ON policies BEGIN
+    INSERT INTO policies_fts(policies_fts, rowid, insured_name) VALUES ('delete', old.id, old.insured_name);
+END;
+CREATE TRIGGER IF NOT EXISTS policies_fts_update AFTER UPDATE OF insured_name ON policies
+WHEN old.insured_name IS NOT new.insured_name BEGIN
+    INSERT INTO policies_fts(policies_fts, rowid, insured_name) VALUES ('delete', old.id, old.insured_name);
+    INSERT INTO policies_fts(rowid, insured_name) VALUES (new.id, new.insured_name);
+END;
+
+-- Premium totals per (type, status, currency), maintained by triggers on policies
+-- (see infrastructure/summary.py); premium_minor is in hundredths of the currency unit
+CREATE TABLE IF NOT EXISTS policy_summary (
+    type_id INTEGER NOT NULL,
+    status_id INTEGER NOT NULL,
+    currency VARCHAR(3) NOT NULL,
+    policy_count INTEGER NOT NULL DEFAULT 0,
+    premium_minor BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (type_id, status_id, currency),
+    FOREIGN KEY (status_id) REFERENCES policy_statuses(id),
+    FOREIGN KEY (type_id) REFERENCES policy_types(id)
+);
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable
+from sqlalchemy import Update, select, update
+from sqlalchemy.orm import Session
+from .book_version import book_version
+from .models import PolicyModel, utc_now
+from .reference_data import reference_data
+
+"""Background sweeper moving lapsed policies out of their live statuses
+
+ACTIVE policies whose period has ended become INACTIVE; optionally, PENDING
+policies whose period has already started without being activated do too.
+Each batch is one UPDATE over an indexed (status_id, date) range, committed
+on its own so the sweeper never holds a long write transaction.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepResult:
+    """Rows moved by one sweep"""
+
+    expired: int = 0
+    lapsed: int = 0
+    batches: int = 0
+
+
+@dataclass
+class SweeperStats:
+    """Counters describing the sweeper's work since startup"""
+
+    runs: int = 0
+    batches: int = 0
+    expired: int = 0
+    lapsed: int = 0
+    errors: int = 0
+    started_at: datetime | None = None
+    last_run_at: datetime | None = None
+    last_duration_ms: float | None = None
+    last_error: str | None = None
+
+
+def lapse_batch(
+    from_status_id: int, to_status_id: int, date_column, today: date, batch_size: int
+) -> Update:
+    """UPDATE at most batch_size policies in from_status whose date_column is before today"""
+    candidates = (
+        select(PolicyModel.id)
+        .where(PolicyModel.status_id == from_status_id, date_column < today)
+        .limit(batch_size)
+    )
+    return (
+        update(PolicyModel)
+        .where(PolicyModel.id.in_(candidates))
+        .values(status_id=to_status_id, updated_at=utc_now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+class ExpirySweeper:
+    """Moves lapsed policies to INACTIVE in batches, on demand or on an interval"""
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        interval: float = 300.0,
+        lapse_pending: bool = False,
+        on_change: Callable[[], None] | None = None,
+    ):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lapse_pending = lapse_pending
+        self.on_change = on_change
+        self.stats = SweeperStats()
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def sweep(self, db: Session, today: date | None = None) -> SweepResult:
+        """Run one sweep to completion on the given session"""
+        today = today or date.today()
+        # Manual triggers and the background loop never overlap
+        with self._lock:
+            started = time.perf_counter()
+            result = SweepResult()
+            try:
+                refs = reference_data.get(db)
+                inactive = refs.status_id("inactive")
+                result.expired = self._drain(
+                    db,
+                    result,
+                    refs.status_id("active"),
+                    inactive,
+                    PolicyModel.period_end_date,
+                    today,
+                )
+                if self.lapse_pending:
+                    result.lapsed = self._drain(
+                        db,
+                        result,
+                        refs.status_id("pending"),
+                        inactive,
+                        PolicyModel.period_start_date,
+                        today,
+                    )
+                self.stats.last_error = None
+            except Exception as e:
+                db.rollback()
+                self.stats.errors += 1
+                self.stats.last_error = str(e)
+                raise e
+            finally:
+                self.stats.runs += 1
+                self.stats.batches += result.batches
+                self.stats.expired += result.expired
+                self.stats.lapsed += result.lapsed
+                self.stats.last_run_at = utc_now()
+                self.stats.last_duration_ms = round(
+                    (time.perf_counter() - started) * 1000, 2
+                )
+            return result
+
+    def _drain(
+        self,
+        db: Session,
+        result: SweepResult,
+        from_status_id: int,
+        to_status_id: int,
+        date_column,
+        today: date,
+    ) -> int:
+        """Repeat one batch UPDATE until fewer than batch_size rows qualify"""
+        moved = 0
+        while True:
+            statement = lapse_batch(
+                from_status_id, to_status_id, date_column, today, self.batch_size
+            )
+            count = db.execute(statement).rowcount
+            db.commit()
+            result.batches += 1
+            if count:
+                moved += count
+                book_version.bump()
+                if self.on_change is not None:
+                    self.on_change()
+            if count < self.batch_size:
+                return moved
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Sweep every interval seconds on the running event loop until stopped"""
+        if self._task is None:
+            self.stats.started_at = utc_now()
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(session_factory)
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._sweep_new_session, session_factory)
+            except Exception:
+                logger.exception("Policy expiry sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def _sweep_new_session(self, session_factory: Callable[[], Session]) -> SweepResult:
+        with session_factory() as db:
+            return self.sweep(db)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def lag_seconds(self, now: datetime | None = None) -> float | None:
+        """How long the next sweep is overdue, or None when the loop is not running
+
+        A sweep is due interval seconds after the last one finished (or after
+        start-up, before the first finishes); 0 means it is not yet due.
+        """
+        if not self.running:
+            return None
+        since = self.stats.last_run_at or self.stats.started_at
+        elapsed = ((now or utc_now()) - since).total_seconds()
+        return round(max(0.0, elapsed - self.interval), 3)
+
+    def snapshot(self) -> dict:
+        """Configuration and counters for monitoring"""
+        return {
+            "running": self.running,
+            "batch_size": self.batch_size,
+            "interval_seconds": self.interval,
+            "lapse_pending": self.lapse_pending,
+            "runs": self.stats.runs,
+            "batches": self.stats.batches,
+            "expired": self.stats.expired,
+            "lapsed": self.stats.lapsed,
+            "errors": self.stats.errors,
+            "last_run_at": self.stats.last_run_at,
+            "last_duration_ms": self.stats.last_duration_ms,
+            "last_error": self.stats.last_error,
+            "lag_seconds": self.lag_seconds(),
+        }
@@ -2,32 +2,50 @@ from ..domain.entities import Policy, PolicyStatus, PolicyType
 from ..infrastructure.models import PolicyModel, PolicyStatusModel, PolicyTypeModel
 from ..domain.value_objects import PolicyNumber, Money, Period
 
+# Enum members by value; a dict lookup is much cheaper than calling the Enum
+STATUSES = {status.value: status for status in PolicyStatus}
+POLICY_TYPES = {policy_type.value: policy_type for policy_type in PolicyType}
+
 
 class PolicyDbMapper:
     """Maps between Domain entities and Database models"""
 
     @staticmethod
-    def to_domain(db_policy: PolicyModel) -> Policy:
-        """Convert ORM model to domain entity"""
+    def to_domain(
+        db_policy: PolicyModel, status_name: str = None, type_name: str = None
+    ) -> Policy:
+        """Convert ORM model (or a row with the same columns) to domain entity
+
+        Args:
+            db_policy: ORM model or result row
+            status_name: Status name when already known, skipping the relationship
+            type_name: Type name when already known, skipping the relationship
+        """
         if not db_policy:
             return None
 
         # Get status and type names from relationships
-        status_name = (
-            db_policy.status_rel.name if db_policy.status_rel else db_policy.status
-        )
-        type_name = (
-            db_policy.type_rel.name if db_policy.type_rel else db_policy.policy_type
-        )
+        if status_name is None:
+            status_name = (
+                db_policy.status_rel.name if db_policy.status_rel else db_policy.status
+            )
+        if type_name is None:
+            type_name = (
+                db_policy.type_rel.name if db_policy.type_rel else db_policy.policy_type
+            )
 
+        # Stored rows were validated when written, so skip re-validation
         policy = Policy(
-            policy_number=PolicyNumber(db_policy.policy_number),
+            policy_number=PolicyNumber.trusted(db_policy.policy_number),
             insured_name=db_policy.insured_name,
-            premium=Money(db_policy.premium_amount, db_policy.premium_currency),
-            period=Period(db_policy.period_start_date, db_policy.period_end_date),
-            status=PolicyStatus(status_name),
-            policy_type=PolicyType(type_name),
+            premium=Money.trusted(db_policy.premium_amount, db_policy.premium_currency),
+            period=Period.trusted(
+                db_policy.period_start_date, db_policy.period_end_date
+            ),
+            status=STATUSES.get(status_name) or PolicyStatus(status_name),
+            policy_type=POLICY_TYPES.get(type_name) or PolicyType(type_name),
             id=db_policy.id,
+            updated_at=getattr(db_policy, "updated_at", None),
         )
         return policy
 
@@ -59,6 +77,20 @@ class PolicyDbMapper:
 
         return policy_model
 
+    @staticmethod
+    def to_values(policy: Policy, status_id: int, type_id: int) -> dict:
+        """Convert domain entity to a column/value dict for Core INSERT/UPDATE"""
+        return {
+            "policy_number": policy.policy_number.value,
+            "insured_name": policy.insured_name,
+            "premium_amount": policy.premium.amount,
+            "premium_currency": policy.premium.currency,
+            "period_start_date": policy.period.start_date,
+            "period_end_date": policy.period.end_date,
+            "status_id": status_id,
+            "type_id": type_id,
+        }
+
     @staticmethod
     def get_status_name(db_policy: PolicyModel) -> str:
         """Get status name from PolicyModel"""
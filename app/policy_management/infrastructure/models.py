@@ -1,12 +1,46 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, DateTime
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    Date,
+    ForeignKey,
+    DateTime,
+    Index,
+    BigInteger,
+    event,
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from datetime import date
+from datetime import date, datetime, timezone
 from .db import Base
 
 """ORM models for Policy Management"""
 
 
+def utc_now() -> datetime:
+    """Naive UTC timestamp with microsecond precision
+
+    Generated client-side so stored values round-trip exactly, which keyset
+    pagination on (created_at, id) relies on.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Version of the schema, indexes, derived structures and lookup rows that startup
+# brings a database up to; bump it whenever any of them change
+SCHEMA_VERSION = "1"
+
+
+class SchemaMetaModel(Base):
+    """Key/value markers recording how far the database has been initialized"""
+
+    __tablename__ = "schema_meta"
+
+    key = Column(String(50), primary_key=True)
+    value = Column(String(100), nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=utc_now, onupdate=utc_now)
+
+
 class PolicyStatusModel(Base):
     """Policy Status Model"""
 
@@ -55,11 +89,58 @@ class PolicyModel(Base):
     type_id = Column(Integer, ForeignKey("policy_types.id"), nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
-    )
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+    updated_at = Column(DateTime, nullable=False, default=utc_now, onupdate=utc_now)
 
     # Relationships
     status_rel = relationship("PolicyStatusModel", back_populates="policies")
     type_rel = relationship("PolicyTypeModel", back_populates="policies")
+
+    # Composite indexes backing keyset pagination, list filters and the expiry sweeper
+    __table_args__ = (
+        Index("idx_policies_created_at_id", "created_at", "id"),
+        Index("idx_policies_status_created", "status_id", "created_at", "id"),
+        Index("idx_policies_type_created", "type_id", "created_at", "id"),
+        Index("idx_policies_currency_created", "premium_currency", "created_at", "id"),
+        Index("idx_policies_premium", "premium_amount"),
+        Index("idx_policies_period", "period_start_date", "period_end_date"),
+        Index("idx_policies_status_end", "status_id", "period_end_date"),
+        Index("idx_policies_status_start", "status_id", "period_start_date"),
+    )
+
+
+class PolicySummaryModel(Base):
+    """Premium totals per (type, status, currency), maintained by database triggers"""
+
+    __tablename__ = "policy_summary"
+
+    type_id = Column(Integer, ForeignKey("policy_types.id"), primary_key=True)
+    status_id = Column(Integer, ForeignKey("policy_statuses.id"), primary_key=True)
+    currency = Column(String(3), primary_key=True)
+    policy_count = Column(Integer, nullable=False, default=0)
+    # Integer minor units (pence/cents), so totals never accumulate float error
+    premium_minor = Column(BigInteger, nullable=False, default=0)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_derived_structures(target, connection, **kw):
+    """Create the search index and summary triggers once every table exists"""
+    install_derived_structures(connection)
+
+
+def install_derived_structures(connection):
+    """Create (or repair) the structures derived from the policies table"""
+    from .search import search_backend
+    from .summary import summary_backend
+
+    search_backend(connection.dialect).install(connection)
+    summary_backend(connection.dialect).install(connection)
+
+
+def suspend_derived_structures(connection):
+    """Stop maintaining the derived structures; install_derived_structures resumes"""
+    from .search import search_backend
+    from .summary import summary_backend
+
+    search_backend(connection.dialect).suspend(connection)
+    summary_backend(connection.dialect).suspend(connection)
@@ -0,0 +1,345 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from ..domain.entities import Policy, PolicyStatus
+from ..domain.repository import PolicyFilter, PolicyPage, PolicySortKey, PremiumTotal
+
+"""Read-through cache for single-policy lookups
+
+The cache wraps any policy repository. Writes made through the wrapper
+invalidate the affected entries. A read-through fill records the cache
+generation before it loads and is dropped if the key was invalidated since,
+so a row read just before a concurrent write cannot be cached after that
+write's invalidation. Policies are copied on the way in and out, because
+callers mutate the entities they receive (activate/cancel).
+"""
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness"""
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    stale_fills: int = 0
+
+
+class PolicyCache:
+    """Thread-safe bounded LRU of policies keyed by policy number and by id
+
+    Entries expire after ttl seconds. A lookup that found nothing is remembered
+    for negative_ttl seconds, so repeated requests for an unknown number do not
+    each reach the database.
+    """
+
+    def __init__(
+        self, max_entries: int = 10000, ttl: float = 60.0, negative_ttl: float = 5.0
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        # Generation of the last invalidation per key, oldest first, at most
+        # max_entries; fills older than a forgotten invalidation are dropped
+        self._generation = 0
+        self._invalidated: OrderedDict = OrderedDict()
+        self._forgotten_through = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        """Current generation; take it before loading and pass it to put()"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: tuple):
+        """Return the cached policy (or None for a cached miss), else _MISSING"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return _MISSING
+            policy, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            if policy is None:
+                self.stats.negative_hits += 1
+                return None
+            self.stats.hits += 1
+            return copy.copy(policy)
+
+    def put(self, key: tuple, policy: Policy | None, generation: int) -> None:
+        """Cache a lookup result under key and, for policies, under both keys,
+        unless one of them was invalidated after generation was taken"""
+        if policy is None:
+            self._store([key], None, self.negative_ttl, generation)
+        else:
+            keys = [("number", policy.policy_number.value), ("id", policy.id)]
+            self._store(keys, copy.copy(policy), self.ttl, generation)
+
+    def invalidate(
+        self, policy_number: str | None = None, policy_id: int | None = None
+    ) -> None:
+        """Drop the entries for a policy and fail fills that started before now"""
+        with self._lock:
+            self._generation += 1
+            for key in (("number", policy_number), ("id", policy_id)):
+                if key[1] is None:
+                    continue
+                self._invalidated[key] = self._generation
+                self._invalidated.move_to_end(key)
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+            while len(self._invalidated) > self.max_entries:
+                _, forgotten = self._invalidated.popitem(last=False)
+                self._forgotten_through = forgotten
+
+    def clear(self) -> None:
+        """Drop every entry and fail every fill already in progress"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidated.clear()
+            self._forgotten_through = self._generation
+
+    def snapshot(self) -> dict:
+        """Counters and occupancy for monitoring"""
+        with self._lock:
+            lookups = self.stats.hits + self.stats.negative_hits + self.stats.misses
+            hits = self.stats.hits + self.stats.negative_hits
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.stats.hits,
+                "negative_hits": self.stats.negative_hits,
+                "misses": self.stats.misses,
+                "evictions": self.stats.evictions,
+                "invalidations": self.stats.invalidations,
+                "stale_fills": self.stats.stale_fills,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _store(
+        self, keys: list[tuple], policy: Policy | None, ttl: float, generation: int
+    ) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            if generation < self._forgotten_through or any(
+                self._invalidated.get(key, 0) > generation for key in keys
+            ):
+                self.stats.stale_fills += 1
+                return
+            for key in keys:
+                self._entries[key] = (policy, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+
+class CachedPolicyRepository:
+    """Policy repository decorator serving get-by-number/id from a PolicyCache"""
+
+    def __init__(self, repository, cache: PolicyCache):
+        self.repository = repository
+        self.cache = cache
+
+    def add_policy(self, policy: Policy) -> Policy:
+        created = self.repository.add_policy(policy)
+        self.cache.invalidate(created.policy_number.value, created.id)
+        return created
+
+    def add_policies(self, policies: list[Policy]) -> list[Policy]:
+        created = self.repository.add_policies(policies)
+        for policy in created:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+        return created
+
+    def update_policy(self, policy: Policy) -> Policy:
+        try:
+            return self.repository.update_policy(policy)
+        finally:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    def cancel_policy(self, policy: Policy) -> None:
+        try:
+            self.repository.cancel_policy(policy)
+        finally:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    def update_policy_statuses(
+        self, policies: list[Policy], read_statuses: dict[int, PolicyStatus]
+    ) -> set[int]:
+        try:
+            return self.repository.update_policy_statuses(policies, read_statuses)
+        finally:
+            for policy in policies:
+                self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    def get_policy_by_id(self, policy_id: int) -> Policy | None:
+        key = ("id", policy_id)
+        policy = self.cache.get(key)
+        if policy is _MISSING:
+            generation = self.cache.generation()
+            policy = self.repository.get_policy_by_id(policy_id)
+            self.cache.put(key, policy, generation)
+        return policy
+
+    def get_policy_by_policy_number(self, policy_number: str) -> Policy | None:
+        key = ("number", policy_number)
+        policy = self.cache.get(key)
+        if policy is _MISSING:
+            generation = self.cache.generation()
+            policy = self.repository.get_policy_by_policy_number(policy_number)
+            self.cache.put(key, policy, generation)
+        return policy
+
+    def get_policy_version(self, policy_number: str) -> tuple[int, datetime] | None:
+        policy = self.cache.get(("number", policy_number))
+        if policy is _MISSING or policy is None:
+            return self.repository.get_policy_version(policy_number)
+        return policy.id, policy.updated_at
+
+    def get_policies_by_policy_numbers(self, policy_numbers: list[str]) -> list[Policy]:
+        return self.repository.get_policies_by_policy_numbers(policy_numbers)
+
+    def find_existing_policy_numbers(self, policy_numbers: list[str]) -> set[str]:
+        return self.repository.find_existing_policy_numbers(policy_numbers)
+
+    def list_all_policies(self) -> list[Policy]:
+        return self.repository.list_all_policies()
+
+    def list_policies_page(
+        self,
+        policy_filter: PolicyFilter,
+        limit: int,
+        after: tuple | None = None,
+        sort: PolicySortKey = PolicySortKey.CREATED_AT,
+    ) -> PolicyPage:
+        return self.repository.list_policies_page(policy_filter, limit, after, sort)
+
+    def iter_policies(
+        self, policy_filter: PolicyFilter, chunk_size: int = 1000
+    ) -> Iterator[Policy]:
+        return self.repository.iter_policies(policy_filter, chunk_size)
+
+    def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> PolicyPage:
+        return self.repository.search_policies(query, limit, offset, fuzzy)
+
+    def get_premium_summary(self) -> list[PremiumTotal]:
+        return self.repository.get_premium_summary()
+
+
+class AsyncCachedPolicyRepository:
+    """Async variant of CachedPolicyRepository for AsyncSQLPolicyRepository"""
+
+    def __init__(self, repository, cache: PolicyCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def add_policy(self, policy: Policy) -> Policy:
+        created = await self.repository.add_policy(policy)
+        self.cache.invalidate(created.policy_number.value, created.id)
+        return created
+
+    async def add_policies(self, policies: list[Policy]) -> list[Policy]:
+        created = await self.repository.add_policies(policies)
+        for policy in created:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+        return created
+
+    async def update_policy(self, policy: Policy) -> Policy:
+        try:
+            return await self.repository.update_policy(policy)
+        finally:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    async def cancel_policy(self, policy: Policy) -> None:
+        try:
+            await self.repository.cancel_policy(policy)
+        finally:
+            self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    async def update_policy_statuses(
+        self, policies: list[Policy], read_statuses: dict[int, PolicyStatus]
+    ) -> set[int]:
+        try:
+            return await self.repository.update_policy_statuses(policies, read_statuses)
+        finally:
+            for policy in policies:
+                self.cache.invalidate(policy.policy_number.value, policy.id)
+
+    async def get_policy_by_id(self, policy_id: int) -> Policy | None:
+        key = ("id", policy_id)
+        policy = self.cache.get(key)
+        if policy is _MISSING:
+            generation = self.cache.generation()
+            policy = await self.repository.get_policy_by_id(policy_id)
+            self.cache.put(key, policy, generation)
+        return policy
+
+    async def get_policy_by_policy_number(self, policy_number: str) -> Policy | None:
+        key = ("number", policy_number)
+        policy = self.cache.get(key)
+        if policy is _MISSING:
+            generation = self.cache.generation()
+            policy = await self.repository.get_policy_by_policy_number(policy_number)
+            self.cache.put(key, policy, generation)
+        return policy
+
+    async def get_policy_version(
+        self, policy_number: str
+    ) -> tuple[int, datetime] | None:
+        policy = self.cache.get(("number", policy_number))
+        if policy is _MISSING or policy is None:
+            return await self.repository.get_policy_version(policy_number)
+        return policy.id, policy.updated_at
+
+    async def get_policies_by_policy_numbers(
+        self, policy_numbers: list[str]
+    ) -> list[Policy]:
+        return await self.repository.get_policies_by_policy_numbers(policy_numbers)
+
+    async def find_existing_policy_numbers(self, policy_numbers: list[str]) -> set[str]:
+        return await self.repository.find_existing_policy_numbers(policy_numbers)
+
+    async def list_all_policies(self) -> list[Policy]:
+        return await self.repository.list_all_policies()
+
+    async def list_policies_page(
+        self,
+        policy_filter: PolicyFilter,
+        limit: int,
+        after: tuple | None = None,
+        sort: PolicySortKey = PolicySortKey.CREATED_AT,
+    ) -> PolicyPage:
+        return await self.repository.list_policies_page(
+            policy_filter, limit, after, sort
+        )
+
+    def iter_policies(
+        self, policy_filter: PolicyFilter, chunk_size: int = 1000
+    ) -> AsyncIterator[Policy]:
+        return self.repository.iter_policies(policy_filter, chunk_size)
+
+    async def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> PolicyPage:
+        return await self.repository.search_policies(query, limit, offset, fuzzy)
+
+    async def get_premium_summary(self) -> list[PremiumTotal]:
+        return await self.repository.get_premium_summary()
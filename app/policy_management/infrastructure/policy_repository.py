@@ -1,8 +1,16 @@
-from sqlalchemy.orm import Session, joinedload
-from ..domain.entities import Policy, PolicyStatus, PolicyType
-from ..domain.value_objects import PolicyNumber, Money, Period
-from .models import PolicyModel, PolicyStatusModel, PolicyTypeModel
+from collections.abc import Iterator
+from datetime import datetime
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..domain.entities import Policy, PolicyStatus
+from ..domain.repository import PolicyFilter, PolicyPage, PolicySortKey, PremiumTotal
+from .models import PolicyModel
 from .mappers import PolicyDbMapper
+from .book_version import book_version
+from .reference_data import reference_data
+from . import policy_statements as statements
+from . import summary
 
 """SQL-based implementation of the Policy Repository"""
 
@@ -14,52 +22,90 @@ class SQLPolicyRepository:
     ""
 
     def add_policy(self, policy: Policy) -> Policy:
-        """Add a new policy to the database"""
-        # Convert domain entity to ORM model using mapper
+        """Add a new policy with a single INSERT
+
+        Lookup IDs come from the reference data registry and the stored row is
+        returned via RETURNING where the dialect supports it. Duplicate policy
+        numbers are detected by the unique constraint rather than a pre-select.
+        """
         try:
-            db_policy = PolicyDbMapper.to_orm(policy)
+            statement = statements.insert_policy(policy, reference_data.get(self.db))
+            if self._dialect.insert_returning:
+                row = self.db.execute(
+                    statement.returning(*statements.POLICY_COLUMNS)
+                ).one()
+                policy_id = row.id
+            else:
+                row = None
+                policy_id = self.db.execute(statement).inserted_primary_key[0]
+            self.db.commit()
+            book_version.bump()
+            return statements.written_policy(policy, row, policy_id)
+        except IntegrityError as e:
+            self.db.rollback()
+            raise statements.duplicate_policy_number(e) or e
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def add_policies(self, policies: list[Policy]) -> list[Policy]:
+        """Insert many policies in one transaction with a single executemany INSERT
 
-            # Set the foreign key relationships
-            db_policy.status_id = self._get_status_id(policy.status.value)
-            db_policy.type_id = self._get_type_id(policy.policy_type.value)
+        Returns the inserted policies, in input order, with their new IDs.
+        """
+        if not policies:
+            return []
+        try:
+            refs = reference_data.get(self.db)
+            rows = [statements.policy_values(policy, refs) for policy in policies]
 
-            self.db.add(db_policy)
+            if self._dialect.insert_executemany_returning:
+                inserted = self.db.execute(
+                    insert(PolicyModel).returning(
+                        PolicyModel.policy_number, PolicyModel.id
+                    ),
+                    rows,
+                ).all()
+            else:
+                self.db.execute(insert(PolicyModel), rows)
+                inserted = self.db.execute(
+                    select(PolicyModel.policy_number, PolicyModel.id).where(
+                        PolicyModel.policy_number.in_(
+                            [row["policy_number"] for row in rows]
+                        )
+                    )
+                ).all()
             self.db.commit()
-            self.db.refresh(db_policy)
+            book_version.bump()
 
-            # Return the full policy with relationships loaded
-            full_db_policy = self._get_policy_with_relationships(db_policy.id)
-            return PolicyDbMapper.to_domain(full_db_policy)
+            ids = {policy_number: policy_id for policy_number, policy_id in inserted}
+            for policy in policies:
+                policy.id = ids[policy.policy_number.value]
+            return policies
+        except IntegrityError as e:
+            self.db.rollback()
+            raise statements.duplicate_policy_number(e) or e
         except Exception as e:
             self.db.rollback()
             raise e
 
     def update_policy(self, policy: Policy) -> Policy:
-        """Update an existing policy"""
+        """Update an existing policy with a single UPDATE, returning the stored row"""
         try:
-            db_policy = (
-                self.db.query(PolicyModel).filter(PolicyModel.id == policy.id).first()
-            )
-            if not db_policy:
+            statement = statements.update_policy(policy, reference_data.get(self.db))
+            if self._dialect.update_returning:
+                row = self.db.execute(
+                    statement.returning(*statements.POLICY_COLUMNS)
+                ).first()
+                found = row is not None
+            else:
+                row = None
+                found = self.db.execute(statement).rowcount > 0
+            if not found:
                 raise ValueError("Policy not found")
-
-            # Update basic fields
-            db_policy.insured_name = policy.insured_name
-            db_policy.premium_amount = policy.premium.amount
-            db_policy.premium_currency = policy.premium.currency
-            db_policy.period_start_date = policy.period.start_date
-            db_policy.period_end_date = policy.period.end_date
-
-            # Update status and type using their IDs
-            db_policy.status_id = self._get_status_id(policy.status.value)
-            db_policy.type_id = self._get_type_id(policy.policy_type.value)
-
             self.db.commit()
-            self.db.refresh(db_policy)
-
-            # Return the full policy with relationships
-            full_db_policy = self._get_policy_with_relationships(db_policy.id)
-            return PolicyDbMapper.to_domain(full_db_policy)
+            book_version.bump()
+            return statements.written_policy(policy, row, policy.id)
         except Exception as e:
             self.db.rollback()
             raise e
@@ -67,13 +113,43 @@ class SQLPolicyRepository:
     def cancel_policy(self, policy: Policy) -> None:
         """Cancel (delete) a policy by updating its status to cancelled"""
         try:
-            db_policy = (
-                self.db.query(PolicyModel).filter(PolicyModel.id == policy.id).first()
+            # Instead of deleting, update status to cancelled
+            self.db.execute(
+                statements.cancel_policy(policy.id, reference_data.get(self.db))
             )
-            if db_policy:
-                # Instead of deleting, update status to cancelled
-                db_policy.status_id = self._get_status_id(PolicyStatus.CANCELLED.value)
-                self.db.commit()
+            self.db.commit()
+            book_version.bump()
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def update_policy_statuses(
+        self, policies: list[Policy], read_statuses: dict[int, PolicyStatus]
+    ) -> set[int]:
+        """Persist many status transitions in one transaction, one UPDATE per target status"""
+        if not policies:
+            return set()
+        try:
+            # id -> updated_at of the UPDATE that wrote it
+            written = {}
+            for statement, ids, updated_at in statements.update_statuses(
+                policies, read_statuses, reference_data.get(self.db)
+            ):
+                if self._dialect.update_returning:
+                    updated = self.db.scalars(statement.returning(PolicyModel.id)).all()
+                else:
+                    self.db.execute(statement)
+                    updated = self.db.scalars(
+                        statements.select_updated_ids(ids, updated_at)
+                    ).all()
+                written.update(dict.fromkeys(updated, updated_at))
+            self.db.commit()
+            book_version.bump()
+
+            for policy in policies:
+                if policy.id in written:
+                    policy.updated_at = written[policy.id]
+            return set(written)
         except Exception as e:
             self.db.rollback()
             raise e
@@ -94,6 +170,35 @@ class SQLPolicyRepository:
         except Exception as e:
             raise e
 
+    def get_policy_version(self, policy_number: str) -> tuple[int, datetime] | None:
+        """Retrieve a policy's ID and updated_at with one narrow SELECT"""
+        try:
+            row = self.db.execute(statements.select_version(policy_number)).first()
+            return tuple(row) if row else None
+        except Exception as e:
+            raise e
+
+    def get_policies_by_policy_numbers(self, policy_numbers: list[str]) -> list[Policy]:
+        """Retrieve every existing policy among the given numbers in one IN query"""
+        if not policy_numbers:
+            return []
+        try:
+            db_policies = self.db.scalars(statements.select_by_numbers(policy_numbers))
+            return [PolicyDbMapper.to_domain(db_policy) for db_policy in db_policies]
+        except Exception as e:
+            raise e
+
+    def find_existing_policy_numbers(self, policy_numbers: list[str]) -> set[str]:
+        """Return which of the given policy numbers already exist, in one IN query"""
+        if not policy_numbers:
+            return set()
+        try:
+            return set(
+                self.db.scalars(statements.select_existing_numbers(policy_numbers))
+            )
+        except Exception as e:
+            raise e
+
     def list_all_policies(self) -> list[Policy]:
         """List all policies in the database"""
         try:
@@ -102,18 +207,69 @@ class SQLPolicyRepository:
         except Exception as e:
             raise e
 
+    def list_policies_page(
+        self,
+        policy_filter: PolicyFilter,
+        limit: int,
+        after: tuple | None = None,
+        sort: PolicySortKey = PolicySortKey.CREATED_AT,
+    ) -> PolicyPage:
+        """List one page of policies matching the filter using keyset pagination
+
+        Fetches one row beyond the limit to tell whether another page exists,
+        so no COUNT query is needed.
+        """
+        try:
+            statement = statements.select_page(
+                policy_filter, reference_data.get(self.db), limit, after, sort
+            )
+            return statements.build_page(self.db.scalars(statement).all(), limit, sort)
+        except Exception as e:
+            raise e
+
+    def iter_policies(
+        self, policy_filter: PolicyFilter, chunk_size: int = 1000
+    ) -> Iterator[Policy]:
+        """Stream policies matching the filter from a server-side cursor
+
+        Rows are fetched chunk_size at a time and mapped one by one, so memory
+        stays flat regardless of how many policies match.
+        """
+        statement = statements.select_export(
+            policy_filter, reference_data.get(self.db), chunk_size
+        )
+        for db_policy in self.db.scalars(statement):
+            yield PolicyDbMapper.to_domain(db_policy)
+
+    def get_premium_summary(self) -> list[PremiumTotal]:
+        """Premium totals per type, status and currency from the summary table"""
+        try:
+            rows = self.db.scalars(summary.select_summary()).all()
+            return summary.to_premium_totals(rows, reference_data.get(self.db))
+        except Exception as e:
+            raise e
+
+    def search_policies(
+        self, query: str, limit: int, offset: int = 0, fuzzy: bool = False
+    ) -> PolicyPage:
+        """Search insured names through the dialect's full-text index"""
+        try:
+            statement = statements.select_search(
+                self._dialect, query, limit, offset, fuzzy
+            )
+            return statements.build_search_page(
+                self.db.scalars(statement).all(), limit, offset
+            )
+        except Exception as e:
+            raise e
+
     # Helper methods for database operations
     def _get_policy_with_relationships(self, policy_id: int) -> PolicyModel | None:
         """Get policy with status and type relationships loaded"""
         try:
-            return (
-                self.db.query(PolicyModel)
-                .options(
-                    joinedload(PolicyModel.status_rel), joinedload(PolicyModel.type_rel)
-                )
-                .filter(PolicyModel.id == policy_id)
-                .first()
-            )
+            return self.db.scalars(
+                statements.select_policies().where(PolicyModel.id == policy_id)
+            ).first()
         except Exception as e:
             raise e
 
@@ -122,54 +278,21 @@ class SQLPolicyRepository:
     ) -> PolicyModel | None:
         """Get policy by number with relationships loaded"""
         try:
-            return (
-                self.db.query(PolicyModel)
-                .options(
-                    joinedload(PolicyModel.status_rel), joinedload(PolicyModel.type_rel)
+            return self.db.scalars(
+                statements.select_policies().where(
+                    PolicyModel.policy_number == policy_number
                 )
-                .filter(PolicyModel.policy_number == policy_number)
-                .first()
-            )
+            ).first()
         except Exception as e:
             raise e
 
     def _get_all_policies_with_relationships(self) -> list[PolicyModel]:
         """Get all policies with relationships loaded"""
         try:
-            return (
-                self.db.query(PolicyModel)
-                .options(
-                    joinedload(PolicyModel.status_rel), joinedload(PolicyModel.type_rel)
-                )
-                .all()
-            )
+            return self.db.scalars(statements.select_policies()).all()
         except Exception as e:
             raise e
 
-    def _get_status_id(self, status_name: str) -> int:
-        """Get status ID by name"""
-        try:
-            status = (
-                self.db.query(PolicyStatusModel)
-                .filter(PolicyStatusModel.name == status_name)
-                .first()
-            )
-            if not status:
-                raise ValueError(f"Status '{status_name}' not found")
-            return status.id
-        except Exception as e:
-            raise e
-
-    def _get_type_id(self, type_name: str) -> int:
-        """Get type ID by name"""
-        try:
-            policy_type = (
-                self.db.query(PolicyTypeModel)
-                .filter(PolicyTypeModel.name == type_name)
-                .first()
-            )
-            if not policy_type:
-                raise ValueError(f"Policy type '{type_name}' not found")
-            return policy_type.id
-        except Exception as e:
-            raise e
+    @property
+    def _dialect(self):
+        return self.db.get_bind().dialect
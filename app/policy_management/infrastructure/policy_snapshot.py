@@ -0,0 +1,292 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..domain.repository import PolicyFilter
+from .book_version import book_version
+from .models import PolicyModel, utc_now
+from .reference_data import reference_data
+
+"""Columnar in-memory snapshot of the policy book for analytics
+
+Each column is a NumPy array indexed by row: premiums in integer minor units,
+period bounds as date ordinals, and status, type, currency and insured name
+dictionary-encoded as integer codes into a list of labels. Filters are boolean
+masks and aggregations are bincounts, so no per-row Python objects are built
+after loading.
+"""
+
+# Dimensions a snapshot can group by
+DIMENSIONS = ("status", "policy_type", "currency")
+
+
+def dictionary_encode(values) -> tuple[np.ndarray, list]:
+    """Integer codes into a list of distinct labels, in first-seen order"""
+    index = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, list(index)
+
+
+def to_minor(amount: float) -> int:
+    return int(round(amount * 100))
+
+
+@dataclass(frozen=True)
+class PolicyBookSnapshot:
+    """The policy book at one book version, held as NumPy columns"""
+
+    version: str
+    loaded_at: datetime
+    ids: np.ndarray
+    premium_minor: np.ndarray
+    start_ordinal: np.ndarray
+    end_ordinal: np.ndarray
+    status_codes: np.ndarray
+    status_labels: list
+    type_codes: np.ndarray
+    type_labels: list
+    currency_codes: np.ndarray
+    currency_labels: list
+    name_codes: np.ndarray
+    name_labels: list
+
+    @classmethod
+    def load(cls, db: Session, version: str | None = None, chunk_size: int = 50_000):
+        """Read every policy in chunks into a new snapshot"""
+        refs = reference_data.get(db)
+        statement = (
+            select(
+                PolicyModel.id,
+                PolicyModel.premium_amount,
+                PolicyModel.period_start_date,
+                PolicyModel.period_end_date,
+                PolicyModel.status_id,
+                PolicyModel.type_id,
+                PolicyModel.premium_currency,
+                PolicyModel.insured_name,
+            )
+            .order_by(PolicyModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        columns = [[] for _ in range(8)]
+        for partition in db.execute(statement).partitions():
+            for column, values in zip(columns, zip(*partition)):
+                column.extend(values)
+        ids, amounts, starts, ends, status_ids, type_ids, currencies, names = columns
+
+        status_codes, distinct_status_ids = dictionary_encode(status_ids)
+        type_codes, distinct_type_ids = dictionary_encode(type_ids)
+        currency_codes, currency_labels = dictionary_encode(currencies)
+        name_codes, name_labels = dictionary_encode(names)
+        return cls(
+            version=version if version is not None else book_version.tag,
+            loaded_at=utc_now(),
+            ids=np.array(ids, dtype=np.int64),
+            premium_minor=np.rint(np.array(amounts, dtype=np.float64) * 100).astype(
+                np.int64
+            ),
+            start_ordinal=np.fromiter(
+                (start.toordinal() for start in starts),
+                dtype=np.int32,
+                count=len(starts),
+            ),
+            end_ordinal=np.fromiter(
+                (end.toordinal() for end in ends), dtype=np.int32, count=len(ends)
+            ),
+            status_codes=status_codes,
+            status_labels=[
+                refs.status_name(status_id) for status_id in distinct_status_ids
+            ],
+            type_codes=type_codes,
+            type_labels=[refs.type_name(type_id) for type_id in distinct_type_ids],
+            currency_codes=currency_codes,
+            currency_labels=currency_labels,
+            name_codes=name_codes,
+            name_labels=name_labels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _codes(self, dimension: str) -> tuple[np.ndarray, list]:
+        if dimension == "status":
+            return self.status_codes, self.status_labels
+        if dimension == "policy_type":
+            return self.type_codes, self.type_labels
+        if dimension == "currency":
+            return self.currency_codes, self.currency_labels
+        raise ValueError(f"Cannot group by '{dimension}'")
+
+    def _equals(self, dimension: str, label: str) -> np.ndarray:
+        codes, labels = self._codes(dimension)
+        if label not in labels:
+            return np.zeros(len(self), dtype=bool)
+        return codes == labels.index(label)
+
+    def filter_mask(self, policy_filter: PolicyFilter) -> np.ndarray:
+        """Boolean row mask with the same semantics as the SQL listing filter"""
+        mask = np.ones(len(self), dtype=bool)
+        if policy_filter.status is not None:
+            mask &= self._equals("status", policy_filter.status.value)
+        if policy_filter.policy_type is not None:
+            mask &= self._equals("policy_type", policy_filter.policy_type.value)
+        if policy_filter.currency is not None:
+            mask &= self._equals("currency", policy_filter.currency)
+        if policy_filter.min_premium is not None:
+            mask &= self.premium_minor >= to_minor(policy_filter.min_premium)
+        if policy_filter.max_premium is not None:
+            mask &= self.premium_minor <= to_minor(policy_filter.max_premium)
+        if policy_filter.active_to is not None:
+            mask &= self.start_ordinal <= policy_filter.active_to.toordinal()
+        if policy_filter.active_from is not None:
+            mask &= self.end_ordinal >= policy_filter.active_from.toordinal()
+        return mask
+
+    def group_totals(self, dimensions: list[str], mask: np.ndarray) -> list[dict]:
+        """Policy count and premium per combination of dimension labels
+
+        Premiums are only summed within one currency, so currency is always
+        part of the grouping.
+        """
+        dimensions = [dimension for dimension in dimensions if dimension != "currency"]
+        dimensions.append("currency")
+        key = np.zeros(int(mask.sum()), dtype=np.int64)
+        sizes = []
+        for dimension in dimensions:
+            codes, labels = self._codes(dimension)
+            key = key * len(labels) + codes[mask]
+            sizes.append(len(labels))
+
+        groups = int(np.prod(sizes))
+        counts = np.bincount(key, minlength=groups)
+        premiums = np.bincount(key, weights=self.premium_minor[mask], minlength=groups)
+        rows = []
+        for group in np.flatnonzero(counts):
+            codes = np.unravel_index(group, sizes)
+            row = {
+                dimension: self._codes(dimension)[1][code]
+                for dimension, code in zip(dimensions, codes)
+            }
+            row["policy_count"] = int(counts[group])
+            row["premium_minor"] = int(round(premiums[group]))
+            rows.append(row)
+        return rows
+
+    def premium_histogram(self, bins: int, mask: np.ndarray) -> dict[str, dict]:
+        """Premium distribution per currency as bin edges (minor units) and counts"""
+        histograms = {}
+        for code, currency in enumerate(self.currency_labels):
+            premiums = self.premium_minor[mask & (self.currency_codes == code)]
+            if len(premiums) == 0:
+                continue
+            counts, edges = np.histogram(premiums, bins=bins)
+            histograms[currency] = {"edges": edges.tolist(), "counts": counts.tolist()}
+        return histograms
+
+    def expiry_ladder(
+        self, as_of: date, bucket_days: int, buckets: int, mask: np.ndarray
+    ) -> list[dict]:
+        """Policies ending in each bucket_days window after as_of, with premium by currency"""
+        days = self.end_ordinal[mask].astype(np.int64) - as_of.toordinal()
+        in_range = (days >= 0) & (days < bucket_days * buckets)
+        bucket = days[in_range] // bucket_days
+        currencies = len(self.currency_labels)
+        key = bucket * currencies + self.currency_codes[mask][in_range]
+        counts = np.bincount(key, minlength=buckets * currencies).reshape(
+            buckets, currencies
+        )
+        premiums = np.bincount(
+            key,
+            weights=self.premium_minor[mask][in_range],
+            minlength=buckets * currencies,
+        ).reshape(buckets, currencies)
+        return [
+            {
+                "from_day": index * bucket_days,
+                "to_day": (index + 1) * bucket_days - 1,
+                "policy_count": int(counts[index].sum()),
+                "premium_minor": {
+                    currency: int(round(premiums[index, code]))
+                    for code, currency in enumerate(self.currency_labels)
+                    if counts[index, code]
+                },
+            }
+            for index in range(buckets)
+        ]
+
+    def describe(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "policies": len(self),
+            "distinct_insured_names": len(self.name_labels),
+            "bytes": sum(
+                column.nbytes
+                for column in (
+                    self.ids,
+                    self.premium_minor,
+                    self.start_ordinal,
+                    self.end_ordinal,
+                    self.status_codes,
+                    self.type_codes,
+                    self.currency_codes,
+                    self.name_codes,
+                )
+            ),
+        }
+
+
+class PolicySnapshotStore:
+    """Holds the current snapshot, reloading it when the book version changes
+
+    max_age bounds staleness against writes the in-process book version
+    cannot see, such as those made by other worker processes.
+    """
+
+    def __init__(self, max_age: float = 300.0):
+        self.max_age = max_age
+        self.loads = 0
+        self.last_load_ms: float | None = None
+        self._snapshot: PolicyBookSnapshot | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> PolicyBookSnapshot:
+        """The current snapshot, reloading it first if it is out of date"""
+        snapshot = self._snapshot
+        if snapshot is not None and not self._stale(snapshot):
+            return snapshot
+        with self._lock:
+            # Another request may have reloaded while this one waited
+            snapshot = self._snapshot
+            if snapshot is None or self._stale(snapshot):
+                started = time.monotonic()
+                snapshot = PolicyBookSnapshot.load(db, book_version.tag)
+                self._loaded_at = time.monotonic()
+                self.last_load_ms = round((self._loaded_at - started) * 1000, 2)
+                self.loads += 1
+                self._snapshot = snapshot
+            return snapshot
+
+    def _stale(self, snapshot: PolicyBookSnapshot) -> bool:
+        return (
+            snapshot.version != book_version.tag
+            or time.monotonic() - self._loaded_at > self.max_age
+        )
+
+    def snapshot(self) -> dict:
+        """Store counters and the loaded snapshot's description, for monitoring"""
+        current = self._snapshot
+        return {
+            "loads": self.loads,
+            "last_load_ms": self.last_load_ms,
+            "max_age_seconds": self.max_age,
+            "current": current.describe() if current is not None else None,
+        }
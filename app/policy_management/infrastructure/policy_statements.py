@@ -0,0 +1,260 @@
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import Select, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from ..domain.entities import Policy, PolicyStatus
+from ..domain.repository import PolicyFilter, PolicyPage, PolicySortKey
+from .models import PolicyModel, utc_now
+from .mappers import PolicyDbMapper
+from .reference_data import ReferenceData
+from .search import search_backend
+
+"""SQL statement builders shared by the sync and async policy repositories"""
+
+# Columns returned by single-statement writes
+POLICY_COLUMNS = tuple(PolicyModel.__table__.c)
+
+
+def select_policies() -> Select:
+    """SELECT policies with status and type relationships loaded in the same query"""
+    return select(PolicyModel).options(
+        joinedload(PolicyModel.status_rel), joinedload(PolicyModel.type_rel)
+    )
+
+
+def apply_filter(
+    statement: Select, policy_filter: PolicyFilter, refs: ReferenceData
+) -> Select:
+    """Push the filter criteria down into the SQL WHERE clause"""
+    if policy_filter.status is not None:
+        statement = statement.where(
+            PolicyModel.status_id == refs.status_id(policy_filter.status.value)
+        )
+    if policy_filter.policy_type is not None:
+        statement = statement.where(
+            PolicyModel.type_id == refs.type_id(policy_filter.policy_type.value)
+        )
+    if policy_filter.currency is not None:
+        statement = statement.where(
+            PolicyModel.premium_currency == policy_filter.currency
+        )
+    if policy_filter.min_premium is not None:
+        statement = statement.where(
+            PolicyModel.premium_amount >= policy_filter.min_premium
+        )
+    if policy_filter.max_premium is not None:
+        statement = statement.where(
+            PolicyModel.premium_amount <= policy_filter.max_premium
+        )
+    # Period overlap: the policy starts before the window ends and ends after it starts
+    if policy_filter.active_to is not None:
+        statement = statement.where(
+            PolicyModel.period_start_date <= policy_filter.active_to
+        )
+    if policy_filter.active_from is not None:
+        statement = statement.where(
+            PolicyModel.period_end_date >= policy_filter.active_from
+        )
+    return statement
+
+
+def sort_columns(sort: PolicySortKey) -> tuple:
+    """Columns forming the unique keyset ordering for a sort key"""
+    if sort == PolicySortKey.POLICY_NUMBER:
+        return (PolicyModel.policy_number,)
+    return (PolicyModel.created_at, PolicyModel.id)
+
+
+def page_key(db_policy: PolicyModel, sort: PolicySortKey) -> tuple:
+    """JSON-safe keyset position of a row"""
+    if sort == PolicySortKey.POLICY_NUMBER:
+        return (db_policy.policy_number,)
+    return (db_policy.created_at.isoformat(), db_policy.id)
+
+
+def parse_page_key(sort: PolicySortKey, key: tuple) -> tuple:
+    """Convert a keyset position back into column values"""
+    try:
+        if sort == PolicySortKey.POLICY_NUMBER:
+            (policy_number,) = key
+            return (str(policy_number),)
+        created_at, policy_id = key
+        return (datetime.fromisoformat(created_at), int(policy_id))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def select_page(
+    policy_filter: PolicyFilter,
+    refs: ReferenceData,
+    limit: int,
+    after: tuple | None,
+    sort: PolicySortKey,
+) -> Select:
+    """SELECT one keyset page, plus one extra row to detect a following page"""
+    columns = sort_columns(sort)
+    statement = apply_filter(select_policies(), policy_filter, refs)
+    if after is not None:
+        statement = statement.where(
+            tuple_(*columns) > tuple_(*parse_page_key(sort, after))
+        )
+    return statement.order_by(*columns).limit(limit + 1)
+
+
+def build_page(
+    db_policies: list[PolicyModel], limit: int, sort: PolicySortKey
+) -> PolicyPage:
+    """Map the rows of select_page to a PolicyPage"""
+    next_key = None
+    if len(db_policies) > limit:
+        db_policies = db_policies[:limit]
+        next_key = page_key(db_policies[-1], sort)
+    return PolicyPage(
+        items=[PolicyDbMapper.to_domain(db_policy) for db_policy in db_policies],
+        next_key=next_key,
+    )
+
+
+def select_export(
+    policy_filter: PolicyFilter, refs: ReferenceData, chunk_size: int
+) -> Select:
+    """SELECT every matching policy for streaming through a server-side cursor"""
+    return (
+        apply_filter(select_policies(), policy_filter, refs)
+        .order_by(PolicyModel.id)
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def select_search(dialect, query: str, limit: int, offset: int, fuzzy: bool) -> Select:
+    """SELECT one page of ranked search matches, plus one row to detect more"""
+    statement = search_backend(dialect).apply(select_policies(), query, fuzzy)
+    return statement.limit(limit + 1).offset(offset)
+
+
+def build_search_page(
+    db_policies: list[PolicyModel], limit: int, offset: int
+) -> PolicyPage:
+    """Map the rows of select_search to a PolicyPage keyed by the next offset"""
+    next_key = (offset + limit,) if len(db_policies) > limit else None
+    return PolicyPage(
+        items=[
+            PolicyDbMapper.to_domain(db_policy) for db_policy in db_policies[:limit]
+        ],
+        next_key=next_key,
+    )
+
+
+def select_version(policy_number: str) -> Select:
+    """SELECT only the ID and updated_at of one policy, without loading the entity"""
+    return select(PolicyModel.id, PolicyModel.updated_at).where(
+        PolicyModel.policy_number == policy_number
+    )
+
+
+def select_existing_numbers(policy_numbers: list[str]) -> Select:
+    """SELECT which of the given policy numbers already exist"""
+    return select(PolicyModel.policy_number).where(
+        PolicyModel.policy_number.in_(policy_numbers)
+    )
+
+
+def policy_values(policy: Policy, refs: ReferenceData) -> dict:
+    """Column values for writing a policy, with lookup IDs from the registry"""
+    return PolicyDbMapper.to_values(
+        policy,
+        refs.status_id(policy.status.value),
+        refs.type_id(policy.policy_type.value),
+    )
+
+
+def insert_policy(policy: Policy, refs: ReferenceData):
+    """INSERT one policy"""
+    return insert(PolicyModel).values(**policy_values(policy, refs))
+
+
+def update_policy(policy: Policy, refs: ReferenceData):
+    """UPDATE every mutable column of a policy by ID"""
+    values = policy_values(policy, refs)
+    # The policy number is the business key and is never rewritten
+    del values["policy_number"]
+    return (
+        update(PolicyModel)
+        .where(PolicyModel.id == policy.id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def select_by_numbers(policy_numbers: list[str]) -> Select:
+    """SELECT the policies with the given policy numbers"""
+    return select_policies().where(PolicyModel.policy_number.in_(policy_numbers))
+
+
+def update_statuses(
+    policies: list[Policy], read_statuses: dict[int, PolicyStatus], refs: ReferenceData
+) -> list:
+    """One UPDATE per target status, moving the policies to their new status
+
+    Each UPDATE only touches rows still in a status the policies were read
+    with, so a row changed concurrently in between is left alone. Returns
+    (statement, ids, updated_at) per target status.
+    """
+    groups = defaultdict(list)
+    for policy in policies:
+        groups[policy.status].append(policy)
+    now = utc_now()
+    statements = []
+    for status, group in groups.items():
+        ids = [policy.id for policy in group]
+        sources = {refs.status_id(read_statuses[policy.id].value) for policy in group}
+        statement = (
+            update(PolicyModel)
+            .where(PolicyModel.id.in_(ids), PolicyModel.status_id.in_(sources))
+            .values(status_id=refs.status_id(status.value), updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        statements.append((statement, ids, now))
+    return statements
+
+
+def select_updated_ids(ids: list[int], updated_at: datetime) -> Select:
+    """SELECT which of the given rows were written by an update at updated_at"""
+    return select(PolicyModel.id).where(
+        PolicyModel.id.in_(ids), PolicyModel.updated_at == updated_at
+    )
+
+
+def cancel_policy(policy_id: int, refs: ReferenceData):
+    """UPDATE a policy's status to cancelled"""
+    return (
+        update(PolicyModel)
+        .where(PolicyModel.id == policy_id)
+        .values(status_id=refs.status_id(PolicyStatus.CANCELLED.value))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def written_policy(policy: Policy, row, policy_id: int | None = None) -> Policy:
+    """Domain entity for a written policy, from its RETURNING row when available"""
+    if row is not None:
+        return PolicyDbMapper.to_domain(
+            row, policy.status.value, policy.policy_type.value
+        )
+    return Policy(
+        policy_number=policy.policy_number,
+        insured_name=policy.insured_name,
+        premium=policy.premium,
+        period=policy.period,
+        status=policy.status,
+        policy_type=policy.policy_type,
+        id=policy_id,
+    )
+
+
+def duplicate_policy_number(error: IntegrityError) -> ValueError | None:
+    """Translate a unique-constraint violation on policy_number into a domain error"""
+    if "policy_number" in str(error.orig):
+        return ValueError("Policy number already exists")
+    return None
@@ -0,0 +1,73 @@
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+"""Per-request and process-wide SQL statement counters
+
+Listeners on the Engine class time every cursor execution. Totals are kept
+for the process; a request (or any unit of work) can additionally collect its
+own counts by activating a QueryStats with track_queries(). The active stats
+live in a context variable, so they follow the request into the threadpool
+and into the async engine's greenlets.
+"""
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Number of statements executed and the time spent in them"""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_totals = QueryStats()
+_totals_lock = threading.Lock()
+
+
+def track_queries() -> tuple[QueryStats, object]:
+    """Start collecting statements in the current context; returns (stats, token)"""
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def stop_tracking(token) -> None:
+    _current.reset(token)
+
+
+def query_totals() -> QueryStats:
+    """Copy of the process-wide totals"""
+    with _totals_lock:
+        return QueryStats(_totals.queries, _totals.seconds)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+    with _totals_lock:
+        _totals.queries += 1
+        _totals.seconds += elapsed
+
+
+def engines_instrumented() -> bool:
+    """Whether instrument_engines() has attached the statement listeners"""
+    return event.contains(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def instrument_engines() -> None:
+    """Count statements on every engine, sync or async; safe to call repeatedly"""
+    if not engines_instrumented():
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,230 @@
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+"""Opt-in SQL profiler: slow-query log and N+1 detection
+
+The profiler hooks before/after_cursor_execute. Statements slower than the
+threshold are logged with their parameters and the repository method that
+issued them. Inside a profile() scope (one per request when enabled in the
+app) statements are grouped by shape, meaning SQL text with literals and IN
+lists normalized. A shape executed repeat_threshold times or more is reported
+as a likely N+1 pattern, such as lazy-loading a relationship per row.
+"""
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+
+# Names of the frames skipped when looking for the code that issued a statement
+_INTERNAL_PACKAGES = ("sqlalchemy", "contextlib", "threading", "asyncio")
+
+# Statements that come from transaction handling rather than application queries
+TRANSACTION_VERBS = frozenset({"BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE"})
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with whitespace, literals and IN lists normalized"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _STRING.sub("?", shape)
+    return _NUMBER.sub("?", shape)
+
+
+def is_transaction_statement(statement: str) -> bool:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb in TRANSACTION_VERBS
+
+
+def calling_method(skip_module: str = __name__) -> str:
+    """Qualified name of the repository method that issued the current statement
+
+    That is the outermost of the innermost run of repository frames, so a
+    public method is reported rather than the private helper it called. Falls
+    back to the nearest application frame outside SQLAlchemy.
+    """
+    frame = sys._getframe(1)
+    found = fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != skip_module and not module.startswith(_INTERNAL_PACKAGES):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            if owner is not None:
+                name = f"{type(owner).__name__}.{name}"
+            if "repository" in module:
+                found = name
+            elif found is not None:
+                return found
+            elif fallback is None and module.startswith("app."):
+                fallback = name
+        frame = frame.f_back
+    return found or fallback or "<unknown>"
+
+
+@dataclass
+class RepeatedStatement:
+    """A statement shape executed repeatedly within one profile scope"""
+
+    scope: str
+    shape: str
+    count: int
+    caller: str
+
+
+@dataclass
+class ProfileScope:
+    """Statements executed within one profile() block"""
+
+    label: str
+    statements: list = field(default_factory=list)
+    shapes: Counter = field(default_factory=Counter)
+    callers: dict = field(default_factory=dict)
+
+    def record(self, statement: str, parameters, seconds: float) -> None:
+        if is_transaction_statement(statement):
+            return
+        shape = statement_shape(statement)
+        self.statements.append((statement, parameters, seconds))
+        self.shapes[shape] += 1
+        if shape not in self.callers:
+            self.callers[shape] = calling_method()
+
+    @property
+    def query_count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int) -> list[RepeatedStatement]:
+        """Shapes executed at least threshold times, most frequent first"""
+        return [
+            RepeatedStatement(self.label, shape, count, self.callers[shape])
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_scope: ContextVar[ProfileScope | None] = ContextVar(
+    "query_profile_scope", default=None
+)
+
+
+class QueryProfiler:
+    """Slow-query logging and per-scope N+1 detection on SQLAlchemy engines"""
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.1,
+        repeat_threshold: int = 5,
+        log_parameters: bool = True,
+        history: int = 50,
+    ):
+        self.slow_threshold = slow_threshold
+        self.repeat_threshold = repeat_threshold
+        self.log_parameters = log_parameters
+        self.slow_queries = 0
+        self.repeated_statements = 0
+        self.recent_slow = deque(maxlen=history)
+        self.recent_repeated = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def install(self, target=Engine) -> None:
+        """Listen on one engine, or on every engine by default"""
+        if not event.contains(target, "before_cursor_execute", self._before):
+            event.listen(target, "before_cursor_execute", self._before)
+            event.listen(target, "after_cursor_execute", self._after)
+
+    def remove(self, target=Engine) -> None:
+        if event.contains(target, "before_cursor_execute", self._before):
+            event.remove(target, "before_cursor_execute", self._before)
+            event.remove(target, "after_cursor_execute", self._after)
+
+    @contextmanager
+    def profile(self, label: str = ""):
+        """Collect the statements run in this block and report repeated shapes"""
+        scope = ProfileScope(label)
+        token = _scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _scope.reset(token)
+            self.report_repeated(scope)
+
+    def report_repeated(self, scope: ProfileScope) -> list[RepeatedStatement]:
+        repeated = scope.repeated(self.repeat_threshold)
+        for finding in repeated:
+            logger.warning(
+                "Possible N+1 in %s: %d executions from %s of %s",
+                finding.scope or "<scope>",
+                finding.count,
+                finding.caller,
+                finding.shape,
+            )
+        if repeated:
+            with self._lock:
+                self.repeated_statements += len(repeated)
+                self.recent_repeated.extend(repeated)
+        return repeated
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profiler_started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_profiler_started", None)
+        elapsed = time.perf_counter() - started if started is not None else 0.0
+        scope = _scope.get()
+        if scope is not None:
+            scope.record(statement, parameters, elapsed)
+        if elapsed >= self.slow_threshold:
+            self._log_slow(statement, parameters, elapsed)
+
+    def _log_slow(self, statement: str, parameters, elapsed: float) -> None:
+        caller = calling_method()
+        shown = parameters if self.log_parameters else "<hidden>"
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s; parameters=%r",
+            elapsed * 1000,
+            caller,
+            _WHITESPACE.sub(" ", statement).strip(),
+            shown,
+        )
+        with self._lock:
+            self.slow_queries += 1
+            self.recent_slow.append(
+                {
+                    "ms": round(elapsed * 1000, 2),
+                    "caller": caller,
+                    "statement": statement_shape(statement),
+                }
+            )
+
+    def snapshot(self) -> dict:
+        """Counters and the most recent findings, for monitoring"""
+        with self._lock:
+            return {
+                "slow_threshold_ms": self.slow_threshold * 1000,
+                "repeat_threshold": self.repeat_threshold,
+                "slow_queries": self.slow_queries,
+                "repeated_statements": self.repeated_statements,
+                "recent_slow": list(self.recent_slow),
+                "recent_repeated": [
+                    {
+                        "scope": finding.scope,
+                        "count": finding.count,
+                        "caller": finding.caller,
+                        "statement": finding.shape,
+                    }
+                    for finding in self.recent_repeated
+                ],
+            }
@@ -0,0 +1,96 @@
+import threading
+import weakref
+from dataclasses import dataclass
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+from .models import PolicyStatusModel, PolicyTypeModel
+
+"""In-process registry of policy status and type lookup IDs"""
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """Name/ID maps for the policy_statuses and policy_types lookup tables"""
+
+    status_ids: dict[str, int]
+    type_ids: dict[str, int]
+
+    def status_id(self, status_name: str) -> int:
+        """Get status ID by name"""
+        try:
+            return self.status_ids[status_name]
+        except KeyError:
+            raise ValueError(f"Status '{status_name}' not found")
+
+    def type_id(self, type_name: str) -> int:
+        """Get type ID by name"""
+        try:
+            return self.type_ids[type_name]
+        except KeyError:
+            raise ValueError(f"Policy type '{type_name}' not found")
+
+    def status_name(self, status_id: int) -> str:
+        """Get status name by ID"""
+        for name, candidate_id in self.status_ids.items():
+            if candidate_id == status_id:
+                return name
+        raise ValueError(f"Status ID {status_id} not found")
+
+    def type_name(self, type_id: int) -> str:
+        """Get type name by ID"""
+        for name, candidate_id in self.type_ids.items():
+            if candidate_id == type_id:
+                return name
+        raise ValueError(f"Policy type ID {type_id} not found")
+
+
+class ReferenceDataRegistry:
+    """Caches ReferenceData per engine so writes never look up IDs in SQL
+
+    The lookup tables only change when they are seeded, so the registry is
+    loaded once at startup (or lazily on first use) and invalidated by the
+    seeding code.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = weakref.WeakKeyDictionary()
+
+    def get(self, db: Session) -> ReferenceData:
+        """Get the reference data for the session's engine, loading it if needed"""
+        data = self.cached(db)
+        if data is None:
+            data = self.load(db)
+        return data
+
+    def cached(self, db) -> ReferenceData | None:
+        """Get already-loaded reference data for a sync or async session's engine"""
+        return self._data.get(db.get_bind().engine)
+
+    def load(self, db: Session) -> ReferenceData:
+        """(Re)load both lookup tables with a single query"""
+        rows = db.execute(
+            union_all(
+                select(
+                    literal("status").label("kind"),
+                    PolicyStatusModel.id,
+                    PolicyStatusModel.name,
+                ),
+                select(literal("type"), PolicyTypeModel.id, PolicyTypeModel.name),
+            )
+        ).all()
+        data = ReferenceData(
+            status_ids={name: id for kind, id, name in rows if kind == "status"},
+            type_ids={name: id for kind, id, name in rows if kind == "type"},
+        )
+        with self._lock:
+            self._data[db.get_bind().engine] = data
+        return data
+
+    def invalidate(self) -> None:
+        """Forget all cached reference data, e.g. after reseeding lookup tables"""
+        with self._lock:
+            self._data.clear()
+
+
+reference_data = ReferenceDataRegistry()
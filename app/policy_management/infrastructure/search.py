@@ -0,0 +1,168 @@
+from sqlalchemy import Float, Integer, Select, func, text
+from .models import PolicyModel
+
+"""Full-text search over insured names, one backend per database dialect
+
+SQLite uses an external-content FTS5 table with the trigram tokenizer, kept in
+sync with the policies table by triggers. PostgreSQL uses a pg_trgm GIN
+index. Other databases fall back to unindexed LIKE matching.
+
+Plain queries match every term as a substring (so prefixes match too). Fuzzy
+queries match on shared trigrams and rank by how many the name has in common
+with the query, tolerating typos.
+"""
+
+# The trigram tokenizer cannot match terms shorter than one trigram
+MIN_INDEXED_TERM = 3
+
+
+def query_terms(query: str) -> list[str]:
+    return [term for term in query.lower().split() if term]
+
+
+def contains(term: str):
+    """Case-insensitive substring match on insured_name, with LIKE wildcards escaped"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return PolicyModel.insured_name.ilike(f"%{escaped}%", escape="\\")
+
+
+def trigrams(term: str) -> list[str]:
+    return [term[i : i + 3] for i in range(len(term) - 2)]
+
+
+class SearchBackend:
+    """Unindexed LIKE search, used for dialects without a dedicated backend"""
+
+    def install(self, connection) -> None:
+        """Create the search index if missing; safe to run repeatedly"""
+
+    def suspend(self, connection) -> None:
+        """Stop index maintenance ahead of a bulk load; install() resumes and rebuilds"""
+
+    def apply(self, statement: Select, query: str, fuzzy: bool) -> Select:
+        """Restrict a policy SELECT to matches of query, best matches first"""
+        for term in query_terms(query):
+            statement = statement.where(contains(term))
+        return statement.order_by(PolicyModel.insured_name, PolicyModel.id)
+
+
+class SQLiteFtsSearch(SearchBackend):
+    """FTS5 trigram index on policies.insured_name, ranked by bm25"""
+
+    TABLE = "policies_fts"
+
+    DDL = [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+            insured_name, content='policies', content_rowid='id', tokenize='trigram'
+        )""",
+        f"""CREATE TRIGGER IF NOT EXISTS policies_fts_insert AFTER INSERT ON policies BEGIN
+            INSERT INTO {TABLE}(rowid, insured_name) VALUES (new.id, new.insured_name);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS policies_fts_delete AFTER DELETE ON policies BEGIN
+            INSERT INTO {TABLE}({TABLE}, rowid, insured_name)
+            VALUES ('delete', old.id, old.insured_name);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS policies_fts_update AFTER UPDATE OF insured_name
+            ON policies WHEN old.insured_name IS NOT new.insured_name BEGIN
+            INSERT INTO {TABLE}({TABLE}, rowid, insured_name)
+            VALUES ('delete', old.id, old.insured_name);
+            INSERT INTO {TABLE}(rowid, insured_name) VALUES (new.id, new.insured_name);
+        END""",
+    ]
+
+    OBJECTS = {
+        TABLE,
+        "policies_fts_insert",
+        "policies_fts_delete",
+        "policies_fts_update",
+    }
+
+    def install(self, connection) -> None:
+        existing = {
+            name
+            for (name,) in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE name LIKE 'policies_fts%'"
+            )
+        }
+        if self.OBJECTS <= existing:
+            return
+        for statement in self.DDL:
+            connection.exec_driver_sql(statement)
+        # Index rows written while the table or its triggers were missing
+        connection.exec_driver_sql(
+            f"INSERT INTO {self.TABLE}({self.TABLE}) VALUES ('rebuild')"
+        )
+
+    def suspend(self, connection) -> None:
+        for name in sorted(self.OBJECTS - {self.TABLE}):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+    def apply(self, statement: Select, query: str, fuzzy: bool) -> Select:
+        terms = query_terms(query)
+        indexed = [term for term in terms if len(term) >= MIN_INDEXED_TERM]
+        if fuzzy:
+            grams = dict.fromkeys(gram for term in indexed for gram in trigrams(term))
+            match = " OR ".join(self._quote(gram) for gram in grams)
+        else:
+            match = " AND ".join(self._quote(term) for term in indexed)
+            # Terms too short for the index are checked against the row itself
+            for term in terms:
+                if len(term) < MIN_INDEXED_TERM:
+                    statement = statement.where(contains(term))
+        if not match:
+            return super().apply(statement, " ".join(terms), fuzzy)
+
+        matches = (
+            text(
+                f"SELECT rowid AS id, rank FROM {self.TABLE} WHERE {self.TABLE} MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(id=Integer, rank=Float)
+            .subquery("matches")
+        )
+        # bm25 ranks are negative; the best match has the lowest rank
+        return statement.join(matches, matches.c.id == PolicyModel.id).order_by(
+            matches.c.rank, PolicyModel.id
+        )
+
+    @staticmethod
+    def _quote(term: str) -> str:
+        return '"' + term.replace('"', '""') + '"'
+
+
+class PostgresTrigramSearch(SearchBackend):
+    """pg_trgm GIN index on policies.insured_name, ranked by similarity"""
+
+    DDL = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS idx_policies_insured_name_trgm "
+        "ON policies USING gin (insured_name gin_trgm_ops)",
+    ]
+
+    def install(self, connection) -> None:
+        for statement in self.DDL:
+            connection.exec_driver_sql(statement)
+
+    def suspend(self, connection) -> None:
+        connection.exec_driver_sql(
+            "DROP INDEX IF EXISTS idx_policies_insured_name_trgm"
+        )
+
+    def apply(self, statement: Select, query: str, fuzzy: bool) -> Select:
+        similarity = func.similarity(PolicyModel.insured_name, query)
+        if fuzzy:
+            # % is pg_trgm's similarity operator, served by the GIN index
+            statement = statement.where(PolicyModel.insured_name.op("%")(query))
+        else:
+            for term in query_terms(query):
+                statement = statement.where(contains(term))
+        return statement.order_by(similarity.desc(), PolicyModel.id)
+
+
+def search_backend(dialect) -> SearchBackend:
+    """Search backend for a SQLAlchemy dialect"""
+    if dialect.name == "sqlite":
+        return SQLiteFtsSearch()
+    if dialect.name == "postgresql":
+        return PostgresTrigramSearch()
+    return SearchBackend()
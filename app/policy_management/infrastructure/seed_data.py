@@ -1,8 +1,50 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import date, timedelta
 from .models import PolicyModel, PolicyStatusModel, PolicyTypeModel
+from .reference_data import reference_data
+from .book_version import book_version
 from ..domain.entities import PolicyStatus, PolicyType
 
+# Lookup rows every database needs, with descriptions
+STATUSES_DATA = [
+    {
+        "name": PolicyStatus.ACTIVE.value,
+        "description": "Policy is currently active and providing coverage",
+    },
+    {
+        "name": PolicyStatus.PENDING.value,
+        "description": "Policy is created but not yet activated",
+    },
+    {
+        "name": PolicyStatus.INACTIVE.value,
+        "description": "Policy is no longer active (expired or suspended)",
+    },
+    {
+        "name": PolicyStatus.CANCELLED.value,
+        "description": "Policy has been cancelled by insurer or insured",
+    },
+]
+
+TYPES_DATA = [
+    {
+        "name": PolicyType.PROPERTY.value,
+        "description": "Insurance for buildings, contents, and business interruption",
+    },
+    {
+        "name": PolicyType.CASUALTY.value,
+        "description": "Liability insurance for injuries and damages to others",
+    },
+    {
+        "name": PolicyType.MARINE.value,
+        "description": "Insurance for ships, cargo, and marine liabilities",
+    },
+    {
+        "name": PolicyType.CONSTRUCTION.value,
+        "description": "Insurance for construction projects and contractors",
+    },
+]
+
 
 def seed_database(db: Session):
     """Seed the database with statuses, types, and sample policies"""
@@ -27,64 +69,49 @@ def seed_statuses_and_types(db: Session):
     db.query(PolicyTypeModel).delete()
     db.commit()
 
-    # Seed policy statuses with comprehensive descriptions
-    statuses_data = [
-        {
-            "name": PolicyStatus.ACTIVE.value,
-            "description": "Policy is currently active and providing coverage",
-        },
-        {
-            "name": PolicyStatus.PENDING.value,
-            "description": "Policy is created but not yet activated",
-        },
-        {
-            "name": PolicyStatus.INACTIVE.value,
-            "description": "Policy is no longer active (expired or suspended)",
-        },
-        {
-            "name": PolicyStatus.CANCELLED.value,
-            "description": "Policy has been cancelled by insurer or insured",
-        },
-    ]
-
     print("Adding policy statuses...")
-    for status_data in statuses_data:
+    for status_data in STATUSES_DATA:
         status = PolicyStatusModel(**status_data)
         db.add(status)
         print(f"{status_data['name']} - {status_data['description']}")
 
     db.commit()
 
-    # Seed policy types with comprehensive descriptions
-    types_data = [
-        {
-            "name": PolicyType.PROPERTY.value,
-            "description": "Insurance for buildings, contents, and business interruption",
-        },
-        {
-            "name": PolicyType.CASUALTY.value,
-            "description": "Liability insurance for injuries and damages to others",
-        },
-        {
-            "name": PolicyType.MARINE.value,
-            "description": "Insurance for ships, cargo, and marine liabilities",
-        },
-        {
-            "name": PolicyType.CONSTRUCTION.value,
-            "description": "Insurance for construction projects and contractors",
-        },
-    ]
-
     print("Adding policy types...")
-    for type_data in types_data:
+    for type_data in TYPES_DATA:
         policy_type = PolicyTypeModel(**type_data)
         db.add(policy_type)
         print(f"{type_data['name']} - {type_data['description']}")
 
     db.commit()
+    reference_data.invalidate()
     print("Policy statuses and types seeded successfully!")
 
 
+def ensure_reference_data(db: Session) -> int:
+    """Add any missing policy statuses and types without touching existing rows
+
+    Returns the number of rows added.
+    """
+    existing = {
+        (PolicyStatusModel, name) for (name,) in db.query(PolicyStatusModel.name)
+    } | {(PolicyTypeModel, name) for (name,) in db.query(PolicyTypeModel.name)}
+    missing = [
+        model(**data)
+        for model, rows in (
+            (PolicyStatusModel, STATUSES_DATA),
+            (PolicyTypeModel, TYPES_DATA),
+        )
+        for data in rows
+        if (model, data["name"]) not in existing
+    ]
+    if missing:
+        db.add_all(missing)
+        db.commit()
+        reference_data.invalidate()
+    return len(missing)
+
+
 def seed_policies(db: Session):
     """Seed sample policies with realistic data"""
     print("Seeding sample policies...")
@@ -239,10 +266,22 @@ def seed_policies(db: Session):
         },
     ]
 
+    # Sample policies already present are left as they are
+    existing = {
+        number
+        for (number,) in db.query(PolicyModel.policy_number).filter(
+            PolicyModel.policy_number.in_(
+                [data["policy_number"] for data in policies_data]
+            )
+        )
+    }
+
     print("Adding sample policies...")
     policies_added = 0
 
     for policy_data in policies_data:
+        if policy_data["policy_number"] in existing:
+            continue
         policy = PolicyModel(**policy_data)
         db.add(policy)
 
@@ -261,6 +300,7 @@ def seed_policies(db: Session):
         policies_added += 1
 
     db.commit()
+    book_version.bump()
     print(f"Successfully seeded {policies_added} sample policies!")
 
 
@@ -303,6 +343,7 @@ def seed_sample_policy(db: Session) -> PolicyModel:
 
     db.add(sample_policy)
     db.commit()
+    book_version.bump()
     db.refresh(sample_policy)
     print(f"Added sample policy: {sample_policy.policy_number}")
     return sample_policy
@@ -313,6 +354,7 @@ def clear_policies(db: Session):
     print("Clearing all policies from database...")
     deleted_count = db.query(PolicyModel).delete()
     db.commit()
+    book_version.bump()
     print(f"{deleted_count} policies cleared from database")
 
 
@@ -323,6 +365,8 @@ def clear_all_data(db: Session):
     db.query(PolicyStatusModel).delete()
     db.query(PolicyTypeModel).delete()
     db.commit()
+    reference_data.invalidate()
+    book_version.bump()
     print("All database data cleared")
 
 
@@ -337,23 +381,19 @@ def get_seeding_summary(db: Session):
     print(f"   Policy Types: {type_count}")
     print(f"   Policies: {policy_count}")
 
-    # Breakdown by status
+    # Breakdowns are aggregated in the database, so large books stay cheap
     print("\n   Policies by Status:")
-    policies = db.query(PolicyModel).all()
-    status_stats = {}
-    for policy in policies:
-        status_name = policy.status_rel.name if policy.status_rel else "Unknown"
-        status_stats[status_name] = status_stats.get(status_name, 0) + 1
-
-    for status, count in status_stats.items():
+    for status, count in (
+        db.query(PolicyStatusModel.name, func.count(PolicyModel.id))
+        .join(PolicyModel, PolicyModel.status_id == PolicyStatusModel.id)
+        .group_by(PolicyStatusModel.name)
+    ):
         print(f"     {status}: {count}")
 
-    # Breakdown by type
     print("\n   Policies by Type:")
-    type_stats = {}
-    for policy in policies:
-        type_name = policy.type_rel.name if policy.type_rel else "Unknown"
-        type_stats[type_name] = type_stats.get(type_name, 0) + 1
-
-    for policy_type, count in type_stats.items():
+    for policy_type, count in (
+        db.query(PolicyTypeModel.name, func.count(PolicyModel.id))
+        .join(PolicyModel, PolicyModel.type_id == PolicyTypeModel.id)
+        .group_by(PolicyTypeModel.name)
+    ):
         print(f"     {policy_type}: {count}")
@@ -0,0 +1,239 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from sqlalchemy import Select, select
+from ..domain.entities import PolicyStatus, PolicyType
+from ..domain.repository import PremiumTotal
+from .models import PolicySummaryModel
+from .reference_data import ReferenceData
+
+"""Incrementally maintained premium totals per policy type, status and currency
+
+Database triggers update the policy_summary table in the same transaction as
+every insert, delete or update of a policy's type, status, currency or
+premium, so reading the summary costs O(groups) whatever the size of the book.
+Premiums are stored in integer minor units (hundredths of the currency unit).
+
+rebuild() recomputes the table from scratch. check() compares it with a live
+aggregate and reports any group that has drifted.
+"""
+
+
+@dataclass(frozen=True)
+class SummaryDiscrepancy:
+    """A summary group whose stored totals differ from the policies table"""
+
+    type_id: int
+    status_id: int
+    currency: str
+    expected: tuple[int, int]
+    actual: tuple[int, int]
+
+
+class SummaryBackend:
+    """Summary maintenance for one SQL dialect
+
+    Dialects without triggers here get no incremental maintenance; their
+    summary only changes when rebuild() runs.
+    """
+
+    # SQL expression converting a premium column to integer minor units
+    MINOR_UNITS = "CAST(ROUND({column} * 100) AS INTEGER)"
+
+    def install(self, connection) -> None:
+        """Create the maintenance triggers if missing, rebuilding the table if so"""
+
+    def suspend(self, connection) -> None:
+        """Drop the maintenance triggers ahead of a bulk load; install() restores them"""
+
+    def minor_units(self, column: str) -> str:
+        return self.MINOR_UNITS.format(column=column)
+
+    def live_totals_sql(self) -> str:
+        return (
+            "SELECT type_id, status_id, premium_currency, COUNT(*), "
+            f"SUM({self.minor_units('premium_amount')}) "
+            "FROM policies GROUP BY type_id, status_id, premium_currency"
+        )
+
+    def rebuild(self, connection) -> int:
+        """Recompute every group from the policies table; returns the group count"""
+        connection.exec_driver_sql("DELETE FROM policy_summary")
+        result = connection.exec_driver_sql(
+            "INSERT INTO policy_summary "
+            "(type_id, status_id, currency, policy_count, premium_minor) "
+            + self.live_totals_sql()
+        )
+        return result.rowcount
+
+    def check(self, connection) -> list[SummaryDiscrepancy]:
+        """Groups whose stored totals differ from a live aggregate of the policies"""
+        expected = {
+            (type_id, status_id, currency): (count, minor)
+            for type_id, status_id, currency, count, minor in connection.exec_driver_sql(
+                self.live_totals_sql()
+            )
+        }
+        actual = {
+            (type_id, status_id, currency): (count, minor)
+            for type_id, status_id, currency, count, minor in connection.exec_driver_sql(
+                "SELECT type_id, status_id, currency, policy_count, premium_minor "
+                "FROM policy_summary WHERE policy_count <> 0 OR premium_minor <> 0"
+            )
+        }
+        return [
+            SummaryDiscrepancy(*key, expected.get(key, (0, 0)), actual.get(key, (0, 0)))
+            for key in sorted(expected.keys() | actual.keys())
+            if expected.get(key) != actual.get(key)
+        ]
+
+
+class SQLiteSummary(SummaryBackend):
+    """Row triggers using SQLite UPSERT"""
+
+    TRIGGERS = (
+        "policy_summary_insert",
+        "policy_summary_delete",
+        "policy_summary_update",
+    )
+
+    def _add(self, row: str) -> str:
+        return (
+            "INSERT INTO policy_summary "
+            "(type_id, status_id, currency, policy_count, premium_minor) "
+            f"VALUES ({row}.type_id, {row}.status_id, {row}.premium_currency, 1, "
+            f"{self.minor_units(row + '.premium_amount')}) "
+            "ON CONFLICT (type_id, status_id, currency) DO UPDATE SET "
+            "policy_count = policy_count + 1, "
+            "premium_minor = premium_minor + excluded.premium_minor;"
+        )
+
+    def _remove(self, row: str) -> str:
+        group = (
+            f"type_id = {row}.type_id AND status_id = {row}.status_id "
+            f"AND currency = {row}.premium_currency"
+        )
+        return (
+            "UPDATE policy_summary SET policy_count = policy_count - 1, "
+            f"premium_minor = premium_minor - {self.minor_units(row + '.premium_amount')} "
+            f"WHERE {group}; "
+            f"DELETE FROM policy_summary WHERE {group} AND policy_count = 0;"
+        )
+
+    def install(self, connection) -> None:
+        existing = {
+            name
+            for (name,) in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+                "AND name LIKE 'policy_summary%'"
+            )
+        }
+        if set(self.TRIGGERS) <= existing:
+            return
+        columns = "type_id, status_id, premium_currency, premium_amount"
+        changed = " OR ".join(
+            f"old.{column} IS NOT new.{column}" for column in columns.split(", ")
+        )
+        for statement in (
+            "CREATE TRIGGER IF NOT EXISTS policy_summary_insert AFTER INSERT ON policies "
+            f"BEGIN {self._add('new')} END",
+            "CREATE TRIGGER IF NOT EXISTS policy_summary_delete AFTER DELETE ON policies "
+            f"BEGIN {self._remove('old')} END",
+            f"CREATE TRIGGER IF NOT EXISTS policy_summary_update AFTER UPDATE OF {columns} "
+            f"ON policies WHEN {changed} "
+            f"BEGIN {self._remove('old')} {self._add('new')} END",
+        ):
+            connection.exec_driver_sql(statement)
+        # Account for rows written while the triggers were missing
+        self.rebuild(connection)
+
+    def suspend(self, connection) -> None:
+        for name in self.TRIGGERS:
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+
+class PostgresSummary(SummaryBackend):
+    """A PL/pgSQL row trigger using INSERT ... ON CONFLICT"""
+
+    MINOR_UNITS = "ROUND(({column})::numeric * 100)::bigint"
+
+    def install(self, connection) -> None:
+        existing = connection.exec_driver_sql(
+            "SELECT 1 FROM pg_trigger WHERE tgname = 'policy_summary_maintain'"
+        ).first()
+        connection.exec_driver_sql(
+            f"""CREATE OR REPLACE FUNCTION policy_summary_maintain() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    UPDATE policy_summary
+                    SET policy_count = policy_count - 1,
+                        premium_minor = premium_minor - {self.minor_units('OLD.premium_amount')}
+                    WHERE type_id = OLD.type_id AND status_id = OLD.status_id
+                      AND currency = OLD.premium_currency;
+                    DELETE FROM policy_summary
+                    WHERE type_id = OLD.type_id AND status_id = OLD.status_id
+                      AND currency = OLD.premium_currency AND policy_count = 0;
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO policy_summary
+                        (type_id, status_id, currency, policy_count, premium_minor)
+                    VALUES (NEW.type_id, NEW.status_id, NEW.premium_currency, 1,
+                            {self.minor_units('NEW.premium_amount')})
+                    ON CONFLICT (type_id, status_id, currency) DO UPDATE SET
+                        policy_count = policy_summary.policy_count + 1,
+                        premium_minor = policy_summary.premium_minor + EXCLUDED.premium_minor;
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql"""
+        )
+        if existing:
+            return
+        connection.exec_driver_sql(
+            "CREATE TRIGGER policy_summary_maintain AFTER INSERT OR DELETE OR UPDATE OF "
+            "type_id, status_id, premium_currency, premium_amount ON policies "
+            "FOR EACH ROW EXECUTE FUNCTION policy_summary_maintain()"
+        )
+        self.rebuild(connection)
+
+    def suspend(self, connection) -> None:
+        connection.exec_driver_sql(
+            "DROP TRIGGER IF EXISTS policy_summary_maintain ON policies"
+        )
+
+
+def summary_backend(dialect) -> SummaryBackend:
+    """Summary backend for a SQLAlchemy dialect"""
+    if dialect.name == "sqlite":
+        return SQLiteSummary()
+    if dialect.name == "postgresql":
+        return PostgresSummary()
+    return SummaryBackend()
+
+
+def select_summary() -> Select:
+    """SELECT every non-empty summary group"""
+    return (
+        select(PolicySummaryModel)
+        .where(PolicySummaryModel.policy_count > 0)
+        .order_by(
+            PolicySummaryModel.type_id,
+            PolicySummaryModel.status_id,
+            PolicySummaryModel.currency,
+        )
+    )
+
+
+def to_premium_totals(
+    rows: list[PolicySummaryModel], refs: ReferenceData
+) -> list[PremiumTotal]:
+    """Map summary rows to domain totals, naming groups from the reference data"""
+    return [
+        PremiumTotal(
+            policy_type=PolicyType(refs.type_name(row.type_id)),
+            status=PolicyStatus(refs.status_name(row.status_id)),
+            currency=row.currency,
+            policy_count=row.policy_count,
+            total_premium=Decimal(row.premium_minor).scaleb(-2),
+        )
+        for row in rows
+    ]
@@ -0,0 +1,339 @@
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection, Engine
+from ..domain.entities import PolicyStatus, PolicyType
+from .book_version import book_version
+from .models import (
+    PolicyModel,
+    install_derived_structures,
+    suspend_derived_structures,
+    utc_now,
+)
+from .reference_data import ReferenceData
+
+"""Reproducible synthetic policy books of any size, bulk-loaded through Core
+
+Rows are generated with NumPy in fixed blocks, each from its own generator
+seeded with (seed, block number), so a given seed always yields the same
+book however it is loaded. Blocks are written with one executemany INSERT
+each; on SQLite the load relaxes durability pragmas, and the secondary
+indexes, search index and summary triggers are rebuilt once at the end
+instead of being maintained row by row.
+"""
+
+# Rows per generation block; part of the reproducibility contract
+BLOCK_SIZE = 10_000
+
+NAME_PREFIXES = [
+    "Acme",
+    "Global",
+    "Harbour",
+    "Northern",
+    "Atlas",
+    "Summit",
+    "Crown",
+    "Pioneer",
+    "Meridian",
+    "Sterling",
+    "Coastal",
+    "Granite",
+    "Oak",
+    "Beacon",
+    "Vanguard",
+    "Orion",
+]
+NAME_TRADES = [
+    "Logistics",
+    "Shipping",
+    "Construction",
+    "Hotels",
+    "Foods",
+    "Engineering",
+    "Haulage",
+    "Textiles",
+    "Marine",
+    "Energy",
+    "Holdings",
+    "Retail",
+    "Aviation",
+]
+NAME_SUFFIXES = ["Ltd", "Inc", "plc", "LLP", "Group", "Partners", "Co"]
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Shape of a synthetic book
+
+    Mixes are relative weights. Premiums are log-normal around premium_median
+    (scaled per policy type), rounded to the penny. Periods start uniformly
+    within start_window_days either side of start_center and run for one of
+    duration_days.
+    """
+
+    count: int
+    seed: int = 42
+    policy_number_prefix: str = "SYN"
+    type_mix: dict = field(
+        default_factory=lambda: {
+            PolicyType.PROPERTY: 0.4,
+            PolicyType.CASUALTY: 0.3,
+            PolicyType.MARINE: 0.2,
+            PolicyType.CONSTRUCTION: 0.1,
+        }
+    )
+    status_mix: dict = field(
+        default_factory=lambda: {
+            PolicyStatus.ACTIVE: 0.6,
+            PolicyStatus.PENDING: 0.2,
+            PolicyStatus.INACTIVE: 0.12,
+            PolicyStatus.CANCELLED: 0.08,
+        }
+    )
+    currency_mix: dict = field(
+        default_factory=lambda: {"GBP": 0.6, "USD": 0.3, "EUR": 0.1}
+    )
+    premium_median: float = 8000.0
+    premium_sigma: float = 0.9
+    # Relative premium level per policy type
+    type_premium_factor: dict = field(
+        default_factory=lambda: {
+            PolicyType.PROPERTY: 1.0,
+            PolicyType.CASUALTY: 0.8,
+            PolicyType.MARINE: 1.6,
+            PolicyType.CONSTRUCTION: 2.5,
+        }
+    )
+    start_center: date = field(default_factory=date.today)
+    start_window_days: int = 365
+    duration_days: tuple = (365, 365, 365, 180, 730)
+
+    def __post_init__(self):
+        if self.count < 0:
+            raise ValueError("count cannot be negative")
+        if not self.policy_number_prefix.isalnum():
+            raise ValueError("policy_number_prefix must be alphanumeric")
+        for name in ("type_mix", "status_mix", "currency_mix"):
+            weights = getattr(self, name)
+            if not weights or min(weights.values()) < 0 or sum(weights.values()) <= 0:
+                raise ValueError(
+                    f"{name} needs non-negative weights with a positive sum"
+                )
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a bulk load"""
+
+    rows: int
+    seconds: float
+    insert_seconds: float
+    rebuild_seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class BulkLoadError(Exception):
+    """A bulk load that failed part way; rows holds how many were committed
+
+    Blocks commit one by one in order, so the committed rows are the first
+    `rows` policy numbers of the book. rebuilt tells whether the indexes and
+    derived structures were rebuilt afterwards; rebuild_error is why not, when
+    the rebuild was tried at all.
+    """
+
+    def __init__(self, rows: int, error: Exception):
+        # The driver error, without SQLAlchemy's dump of the block's parameters
+        cause = getattr(error, "orig", None) or error
+        super().__init__(f"Bulk load failed after {rows:,} committed rows: {cause}")
+        self.rows = rows
+        self.rebuilt = False
+        self.rebuild_error: Exception | None = None
+
+
+def parse_mix(text: str, kind=str) -> dict:
+    """Parse 'a=0.5,b=0.3' into a weight dict, converting keys with kind"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if not weight:
+            raise ValueError(f"Mix entries must look like name=weight, got '{part}'")
+        mix[kind(name.strip())] = float(weight)
+    return mix
+
+
+def _choice(rng: np.random.Generator, weights: dict, size: int) -> np.ndarray:
+    probabilities = np.array(list(weights.values()), dtype=np.float64)
+    return rng.choice(len(weights), size=size, p=probabilities / probabilities.sum())
+
+
+def generate_block(
+    config: GeneratorConfig, refs: ReferenceData, block: int
+) -> list[dict]:
+    """Rows for block number `block`, ready for an executemany INSERT"""
+    first = block * BLOCK_SIZE
+    size = min(BLOCK_SIZE, config.count - first)
+    rng = np.random.default_rng([config.seed, block])
+
+    types = list(config.type_mix)
+    type_index = _choice(rng, config.type_mix, size)
+    factors = np.array([config.type_premium_factor.get(t, 1.0) for t in types])
+    premiums = np.round(
+        rng.lognormal(np.log(config.premium_median), config.premium_sigma, size)
+        * factors[type_index],
+        2,
+    ).clip(min=0.01)
+    status_index = _choice(rng, config.status_mix, size)
+    currency_index = _choice(rng, config.currency_mix, size)
+    start_offsets = rng.integers(
+        -config.start_window_days, config.start_window_days + 1, size
+    )
+    durations = rng.choice(np.array(config.duration_days), size)
+    names = zip(
+        rng.integers(len(NAME_PREFIXES), size=size),
+        rng.integers(len(NAME_TRADES), size=size),
+        rng.integers(len(NAME_SUFFIXES), size=size),
+        rng.integers(1000, size=size),
+    )
+
+    type_ids = [refs.type_id(t.value) for t in types]
+    status_ids = [refs.status_id(s.value) for s in config.status_mix]
+    currencies = list(config.currency_mix)
+    center = config.start_center.toordinal()
+    prefix = config.policy_number_prefix
+    return [
+        {
+            "policy_number": f"{prefix}{first + i:09d}",
+            "insured_name": (
+                f"{NAME_PREFIXES[p]} {NAME_TRADES[t]} {NAME_SUFFIXES[s]} {n}"
+            ),
+            "premium_amount": premium,
+            "premium_currency": currencies[currency],
+            "period_start_date": date.fromordinal(center + offset),
+            "period_end_date": date.fromordinal(center + offset + duration),
+            "status_id": status_ids[status],
+            "type_id": type_ids[policy_type],
+        }
+        for i, (
+            (p, t, s, n),
+            premium,
+            currency,
+            offset,
+            duration,
+            status,
+            policy_type,
+        ) in (
+            enumerate(
+                zip(
+                    names,
+                    premiums.tolist(),
+                    currency_index.tolist(),
+                    start_offsets.tolist(),
+                    durations.tolist(),
+                    status_index.tolist(),
+                    type_index.tolist(),
+                )
+            )
+        )
+    ]
+
+
+def generate_policies(
+    config: GeneratorConfig, refs: ReferenceData
+) -> Iterator[list[dict]]:
+    """Every block of the book, in order"""
+    for block in range(-(-config.count // BLOCK_SIZE)):
+        yield generate_block(config, refs, block)
+
+
+def _relax_sqlite(connection: Connection) -> dict:
+    """Trade durability for load speed on this connection; returns the old settings"""
+    previous = {
+        "synchronous": connection.exec_driver_sql("PRAGMA synchronous").scalar(),
+        "temp_store": connection.exec_driver_sql("PRAGMA temp_store").scalar(),
+    }
+    connection.exec_driver_sql("PRAGMA synchronous = OFF")
+    connection.exec_driver_sql("PRAGMA temp_store = MEMORY")
+    return previous
+
+
+def _rebuild(connection, deferred: list, previous: dict) -> None:
+    """Recreate deferred indexes and derived structures, and restore the pragmas"""
+    with connection.begin():
+        for index in deferred:
+            index.create(connection, checkfirst=True)
+        install_derived_structures(connection)
+    for pragma, value in previous.items():
+        connection.exec_driver_sql(f"PRAGMA {pragma} = {int(value)}")
+    connection.commit()
+
+
+def bulk_load(
+    engine: Engine,
+    config: GeneratorConfig,
+    refs: ReferenceData,
+    progress: Callable[[int], None] | None = None,
+    defer_indexes: bool = True,
+) -> LoadReport:
+    """Insert the synthetic book, one transaction per block
+
+    A failure raises BulkLoadError with the number of rows already committed.
+
+    The search index and summary triggers are suspended during the load and
+    reinstalled afterwards, which rebuilds both from the loaded rows. With
+    defer_indexes the secondary indexes are likewise dropped and rebuilt in
+    one pass; only the unique policy number index is maintained row by row.
+    Appending a small book to a large table is faster without deferring.
+    """
+    deferred = [
+        index
+        for index in PolicyModel.__table__.indexes
+        if defer_indexes and not index.unique
+    ]
+    now = utc_now()
+    statement = insert(PolicyModel).values(created_at=now, updated_at=now)
+    started = time.perf_counter()
+    rows = 0
+    with engine.connect() as connection:
+        is_sqlite = engine.dialect.name == "sqlite"
+        previous = _relax_sqlite(connection) if is_sqlite else {}
+        connection.commit()
+        try:
+            with connection.begin():
+                suspend_derived_structures(connection)
+                for index in deferred:
+                    index.drop(connection, checkfirst=True)
+            for block in generate_policies(config, refs):
+                with connection.begin():
+                    connection.execute(statement, block)
+                rows += len(block)
+                if progress is not None:
+                    progress(rows)
+        except Exception as e:
+            book_version.bump()
+            error = BulkLoadError(rows, e)
+            # A broken connection cannot rebuild anything, and a rebuild failing
+            # on top of the load must not hide why the load failed
+            if not connection.invalidated:
+                try:
+                    _rebuild(connection, deferred, previous)
+                    error.rebuilt = True
+                except Exception as rebuild_error:
+                    error.rebuild_error = rebuild_error
+            raise error from e
+        inserted = time.perf_counter()
+        _rebuild(connection, deferred, previous)
+        book_version.bump()
+
+    finished = time.perf_counter()
+    return LoadReport(
+        rows=rows,
+        seconds=finished - started,
+        insert_seconds=inserted - started,
+        rebuild_seconds=finished - inserted,
+    )
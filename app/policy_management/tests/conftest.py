@@ -1,7 +1,7 @@
 import pytest
 import sys
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 
@@ -19,6 +19,17 @@ def test_engine():
     engine = create_engine(
         "sqlite:///:memory:", connect_args={"check_same_thread": False}
     )
+
+    # pysqlite defers BEGIN until the first DML statement, which turns the
+    # first SAVEPOINT into the outer transaction; emit BEGIN ourselves
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     return engine
 
@@ -28,7 +39,14 @@ def db_session(test_engine):
     """Database session for tests"""
     connection = test_engine.connect()
     transaction = connection.begin()
-    session = sessionmaker(autocommit=False, autoflush=False, bind=connection)()
+    # Session commits/rollbacks become SAVEPOINTs inside the outer transaction,
+    # so a repository rolling back on a constraint violation keeps the test data
+    session = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )()
 
     try:
         from app.policy_management.infrastructure.seed_data import (
@@ -45,6 +63,110 @@ def db_session(test_engine):
     connection.close()
 
 
+@pytest.fixture
+def policy_service(db_session):
+    """PolicyService over the test session, with reference data loaded up front"""
+    from app.policy_management.application.policy_services import PolicyService
+    from app.policy_management.infrastructure.policy_repository import (
+        SQLPolicyRepository,
+    )
+    from app.policy_management.infrastructure.reference_data import reference_data
+
+    reference_data.load(db_session)
+    return PolicyService(SQLPolicyRepository(db_session))
+
+
+@pytest.fixture
+def make_policy(policy_service):
+    """Creates a policy through the service; keyword arguments override the defaults
+
+    make_policy("POL001", status="active", premium_amount=Decimal("250.00"))
+    """
+    from datetime import date
+    from decimal import Decimal
+    from app.policy_management.api.schemas import CreatePolicyDTO
+
+    def make(policy_number, **fields):
+        defaults = {
+            "insured_name": "Test Insured",
+            "premium_amount": Decimal("1000.00"),
+            "premium_currency": "GBP",
+            "period_start_date": date(2024, 1, 1),
+            "period_end_date": date(2099, 12, 31),
+            "status": "pending",
+            "policy_type": "Property",
+        }
+        return policy_service.create_policy(
+            CreatePolicyDTO(policy_number=policy_number, **{**defaults, **fields})
+        )
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def fresh_book_version():
+    """Rolling back a test's data is a write the repositories never see, so
+    bump the book version to keep version-keyed caches from leaking across tests"""
+    from app.policy_management.infrastructure.book_version import book_version
+
+    yield
+    book_version.bump()
+
+
+@pytest.fixture
+def query_counter(test_engine):
+    """Records every SQL statement executed on the test engine"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def query_budget(test_engine):
+    """Fails the test when a block runs more SQL statements than its budget
+
+        with query_budget(1):
+            repository.get_policy_by_policy_number("POL001")
+
+    Transaction control statements are not counted. With max_repeats, running
+    any one statement shape more often than that also fails (an N+1 pattern).
+    The failure lists each shape with the repository method that issued it.
+    """
+    from contextlib import contextmanager
+    from app.policy_management.infrastructure.query_profiler import QueryProfiler
+
+    profiler = QueryProfiler(slow_threshold=float("inf"), repeat_threshold=sys.maxsize)
+    profiler.install(test_engine)
+
+    @contextmanager
+    def budget(max_queries, max_repeats=None):
+        with profiler.profile("query_budget") as scope:
+            yield scope
+        repeated = scope.repeated(max_repeats + 1) if max_repeats is not None else []
+        if scope.query_count > max_queries or repeated:
+            lines = [
+                f"{scope.query_count} statements (budget {max_queries}"
+                + (
+                    f", at most {max_repeats} per shape)"
+                    if max_repeats is not None
+                    else ")"
+                )
+            ]
+            lines += [
+                f"  {count}x from {scope.callers[shape]}: {shape}"
+                for shape, count in scope.shapes.most_common()
+            ]
+            pytest.fail("\n".join(lines), pytrace=False)
+
+    yield budget
+    profiler.remove(test_engine)
+
+
 import importlib
 
 
@@ -62,3 +184,14 @@ def client(db_session):
     app.dependency_overrides[get_db] = lambda: db_session
 
     return TestClient(app)
+
+
+@pytest.fixture
+def response_cache(client):
+    """Enables the (opt-in) response cache on the test client's app"""
+    from app.policy_management.api.dependencies import get_response_cache
+    from app.policy_management.api.http_cache import ResponseCache
+
+    cache = ResponseCache()
+    client.app.dependency_overrides[get_response_cache] = lambda: cache
+    return cache
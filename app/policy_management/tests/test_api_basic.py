@@ -140,3 +140,1153 @@ class TestAPIWorkflows:
             retrieved = response.json()
             assert retrieved["policy_number"] == policy_data["policy_number"]
             assert retrieved["insured_name"] == policy_data["insured_name"]
+
+
+class TestAPIPagination:
+    """API tests for paginated policy listings"""
+
+    def test_next_cursor_header(self, client, make_policy):
+        """Test the next page cursor is returned in response headers"""
+        for i in range(3):
+            make_policy(f"APIPAGE{i}")
+
+        response = client.get("/api/v1/policies/", params={"limit": 2})
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        cursor = response.headers["X-Next-Cursor"]
+        assert 'rel="next"' in response.headers["Link"]
+
+        response = client.get(
+            "/api/v1/policies/", params={"limit": 2, "cursor": cursor}
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_status_filter(self, client, make_policy):
+        """Test filtering the listing by status"""
+        make_policy("APIFILT1", status="pending")
+        make_policy("APIFILT2", status="active")
+
+        response = client.get("/api/v1/policies/", params={"status": "pending"})
+        assert response.status_code == 200
+        assert {p["policy_number"] for p in response.json()} == {"APIFILT1"}
+
+    def test_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected with 400"""
+        response = client.get("/api/v1/policies/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+
+
+class TestAPIExport:
+    """API tests for the streaming bulk export"""
+
+    def test_export_ndjson(self, client, make_policy):
+        """Test NDJSON export streams one record per matching policy"""
+        import json
+        from decimal import Decimal
+
+        make_policy("EXPORT001", status="active", premium_amount=Decimal("1250.50"))
+        make_policy("EXPORT002", status="pending")
+
+        response = client.get("/api/v1/policies/export", params={"status": "active"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["content-encoding"] == "gzip"
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 1
+        assert records[0]["policy_number"] == "EXPORT001"
+        assert records[0]["premium_amount"] == "1250.50"
+        assert records[0]["start_date"] == "2024-01-01"
+
+    def test_export_csv(self, client, make_policy):
+        """Test CSV export has a header row and quotes embedded commas"""
+        import csv
+        import io
+
+        make_policy("EXPORT003", insured_name="Export, Test")
+
+        response = client.get(
+            "/api/v1/policies/export",
+            params={"format": "csv"},
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["policy_number"] for row in rows] == ["EXPORT003"]
+        assert rows[0]["insured_name"] == "Export, Test"
+
+    def test_export_honours_refused_gzip(self, client, make_policy):
+        """Test gzip refused with q=0, or not offered at all, gets a plain body"""
+        make_policy("EXPORT004")
+
+        for accept_encoding in ("gzip;q=0, identity", "identity", "br;q=1, gzip;q=0.0"):
+            response = client.get(
+                "/api/v1/policies/export", headers={"Accept-Encoding": accept_encoding}
+            )
+            assert response.status_code == 200
+            assert "content-encoding" not in response.headers
+            assert "EXPORT004" in response.text
+
+    def test_export_invalid_filter(self, client):
+        """Test invalid filters are rejected before streaming starts"""
+        response = client.get("/api/v1/policies/export", params={"status": "bogus"})
+        assert response.status_code == 400
+
+
+class TestAPIBatchCreate:
+    """API tests for batch policy creation"""
+
+    def _policy(self, policy_number, **overrides):
+        policy = {
+            "policy_number": policy_number,
+            "insured_name": "Batch Test",
+            "premium_amount": 1500.0,
+            "premium_currency": "GBP",
+            "period_start_date": "2024-01-01",
+            "period_end_date": "2024-12-31",
+            "status": "pending",
+            "policy_type": "Casualty",
+        }
+        policy.update(overrides)
+        return policy
+
+    def test_batch_create_reports_per_item_results(self, client):
+        """Test valid items are created while invalid ones are reported"""
+        existing = client.post("/api/v1/policies/", json=self._policy("BATCHOLD1"))
+        assert existing.status_code == 200
+
+        response = client.post(
+            "/api/v1/policies/batch",
+            json={
+                "policies": [
+                    self._policy("BATCH0001"),
+                    self._policy("BATCH0002", policy_type="Marine"),
+                    self._policy("BATCH0001"),
+                    self._policy("BATCHOLD1"),
+                    self._policy("BAD"),
+                ]
+            },
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["failed"] == 3
+
+        results = data["results"]
+        assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+        assert results[0]["success"] and results[0]["policy"]["id"] is not None
+        assert results[1]["policy"]["policy_type"] == "Marine"
+        assert results[2]["error"] == "Duplicate policy number in batch"
+        assert results[3]["error"] == "Policy number already exists"
+        assert "at least 5 characters" in results[4]["error"]
+
+        assert client.get("/api/v1/policies/BATCH0002").status_code == 200
+
+    def test_batch_size_limit(self, client):
+        """Test batches over the configured maximum are rejected"""
+        from app.policy_management.api.routes.policies import settings
+
+        policies = [
+            self._policy(f"BATCHMAX{i}") for i in range(settings.max_batch_size + 1)
+        ]
+        response = client.post("/api/v1/policies/batch", json={"policies": policies})
+        assert response.status_code == 400
+
+
+class TestAsyncAPI:
+    """API tests for the AsyncSession-backed policy routes"""
+
+    @pytest.fixture
+    def async_client(self, tmp_path):
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy import create_engine
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import NullPool
+        from starlette.testclient import TestClient
+
+        from app.policy_management.api.app_factory import create_app
+        from app.policy_management.api.dependencies import (
+            get_policy_service,
+            get_async_policy_service,
+        )
+        from app.policy_management.infrastructure.db import Base, get_async_db
+        from app.policy_management.infrastructure.seed_data import (
+            seed_statuses_and_types,
+        )
+
+        database = tmp_path / "async.db"
+        sync_engine = create_engine(f"sqlite:///{database}")
+        Base.metadata.create_all(bind=sync_engine)
+        with sessionmaker(bind=sync_engine)() as session:
+            seed_statuses_and_types(session)
+        sync_engine.dispose()
+
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{database}", poolclass=NullPool
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSessionLocal() as session:
+                yield session
+
+        app = create_app(testing=True)
+        app.dependency_overrides[get_policy_service] = get_async_policy_service
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        with TestClient(app) as client:
+            yield client
+
+    def _policy(self, policy_number, status="pending"):
+        return {
+            "policy_number": policy_number,
+            "insured_name": "Async Test",
+            "premium_amount": 4200.0,
+            "premium_currency": "GBP",
+            "period_start_date": "2024-01-01",
+            "period_end_date": "2099-12-31",
+            "status": status,
+            "policy_type": "Construction",
+        }
+
+    def test_create_activate_and_get(self, async_client):
+        """Test the single-policy lifecycle through the async service"""
+        response = async_client.post(
+            "/api/v1/policies/", json=self._policy("ASYNC0001")
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["status"] == "Pending"
+
+        duplicate = async_client.post(
+            "/api/v1/policies/", json=self._policy("ASYNC0001")
+        )
+        assert duplicate.status_code == 400
+        assert "already exists" in duplicate.json()["detail"]
+
+        response = async_client.post("/api/v1/policies/ASYNC0001/activate")
+        assert response.status_code == 200, response.text
+        assert response.json()["status"] == "Active"
+
+        response = async_client.get("/api/v1/policies/ASYNC0001")
+        assert response.status_code == 200
+        assert response.json()["policy_type"] == "Construction"
+
+        response = async_client.get(
+            "/api/v1/policies/ASYNC0001",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert response.status_code == 304
+
+    def test_batch_list_and_export(self, async_client):
+        """Test batch create, paginated listing and streaming export"""
+        response = async_client.post(
+            "/api/v1/policies/batch",
+            json={"policies": [self._policy(f"ASYNCB{i:03d}") for i in range(3)]},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["succeeded"] == 3
+
+        response = async_client.get("/api/v1/policies/", params={"limit": 2})
+        assert len(response.json()) == 2
+        cursor = response.headers["X-Next-Cursor"]
+        response = async_client.get(
+            "/api/v1/policies/", params={"limit": 2, "cursor": cursor}
+        )
+        assert [p["policy_number"] for p in response.json()] == ["ASYNCB002"]
+
+        response = async_client.get("/api/v1/policies/export", params={"format": "csv"})
+        assert response.status_code == 200
+        assert len(response.text.strip().splitlines()) == 4
+
+
+class TestAPIConditionalGet:
+    """API tests for ETags, 304 responses and the response cache"""
+
+    def test_policy_etag_follows_updates(self, client, make_policy):
+        """Test a single policy revalidates until it is modified"""
+        make_policy("ETAG0001")
+        response = client.get("/api/v1/policies/ETAG0001")
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            "/api/v1/policies/ETAG0001", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        client.post("/api/v1/policies/ETAG0001/activate")
+        response = client.get(
+            "/api/v1/policies/ETAG0001", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["status"] == "Active"
+
+    def test_policy_revalidation_skips_loading(
+        self, client, query_counter, make_policy
+    ):
+        """Test a matching If-None-Match is answered from the ID and updated_at alone"""
+        make_policy("ETAG0007")
+        etag = client.get("/api/v1/policies/ETAG0007").headers["ETag"]
+
+        query_counter.clear()
+        response = client.get(
+            "/api/v1/policies/ETAG0007", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert len(query_counter) == 1
+        columns = query_counter[0].split("FROM")[0]
+        assert "policies.id" in columns and "policies.updated_at" in columns
+        assert "insured_name" not in columns
+
+        response = client.get(
+            "/api/v1/policies/NOSUCH01", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 404
+
+    def test_list_revalidation_skips_database(
+        self, client, response_cache, query_counter, make_policy
+    ):
+        """Test a matching If-None-Match on the list is answered without SQL"""
+        make_policy("ETAG0002")
+        response = client.get("/api/v1/policies/", params={"limit": 5})
+        etag = response.headers["ETag"]
+
+        query_counter.clear()
+        response = client.get(
+            "/api/v1/policies/", params={"limit": 5}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert query_counter == []
+
+        make_policy("ETAG0003")
+        response = client.get(
+            "/api/v1/policies/", params={"limit": 5}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert "ETAG0003" in [policy["policy_number"] for policy in response.json()]
+
+    def test_repeated_list_served_from_cache(
+        self, client, response_cache, query_counter, make_policy
+    ):
+        """Test identical list requests between writes reuse the cached body"""
+        make_policy("ETAG0004")
+        first = client.get("/api/v1/policies/", params={"status": "pending"})
+
+        query_counter.clear()
+        second = client.get("/api/v1/policies/", params={"status": "pending"})
+        assert query_counter == []
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+
+    def test_cached_list_expires_after_ttl(
+        self, client, response_cache, query_counter, make_policy, monkeypatch
+    ):
+        """Test writes the book version never sees show up once the TTL passes"""
+        from app.policy_management.api import http_cache
+
+        make_policy("ETAG0005")
+        first = client.get("/api/v1/policies/", params={"status": "pending"})
+        etag = first.headers["ETag"]
+
+        now = http_cache.time.time() + response_cache.ttl
+        monkeypatch.setattr(http_cache.time, "time", lambda: now)
+        query_counter.clear()
+        response = client.get(
+            "/api/v1/policies/",
+            params={"status": "pending"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert query_counter != []
+        assert response.headers["ETag"] != etag
+
+    def test_list_etag_without_response_cache(self, client, query_counter, make_policy):
+        """Test lists revalidate by default, while bodies are only replayed when enabled"""
+        make_policy("ETAG0006")
+        etag = client.get("/api/v1/policies/").headers["ETag"]
+
+        query_counter.clear()
+        response = client.get("/api/v1/policies/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert query_counter == []
+
+        response = client.get("/api/v1/policies/")
+        assert response.headers["ETag"] == etag
+        assert query_counter != []
+
+
+class TestAPISearch:
+    """API tests for insured-name search"""
+
+    def test_search_endpoint(self, client):
+        """Test ranked search results and the next-page headers"""
+        for i, name in enumerate(
+            ["Harbour Marine Ltd", "Harbour View Hotels", "Inland Haulage"]
+        ):
+            response = client.post(
+                "/api/v1/policies/",
+                json={
+                    "policy_number": f"APISRCH{i}",
+                    "insured_name": name,
+                    "premium_amount": 1000.0,
+                    "premium_currency": "GBP",
+                    "period_start_date": "2024-01-01",
+                    "period_end_date": "2024-12-31",
+                    "status": "pending",
+                    "policy_type": "Marine",
+                },
+            )
+            assert response.status_code == 200, response.text
+
+        response = client.get(
+            "/api/v1/policies/search", params={"q": "harbour", "limit": 1}
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.headers["X-Next-Offset"] == "1"
+
+        response = client.get(
+            "/api/v1/policies/search", params={"q": "harbur", "fuzzy": True}
+        )
+        assert response.json()[0]["insured_name"].startswith("Harbour")
+
+    def test_blank_search_rejected(self, client):
+        """Test a whitespace-only query returns 400 and a missing one 422"""
+        assert (
+            client.get("/api/v1/policies/search", params={"q": "  "}).status_code == 400
+        )
+        assert client.get("/api/v1/policies/search").status_code == 422
+
+
+class TestAPISummary:
+    """API tests for the portfolio premium summary"""
+
+    def test_summary_endpoint(self, client):
+        """Test grouped and per-currency premium totals"""
+        for i, (amount, currency) in enumerate(
+            [(1250.5, "GBP"), (749.5, "GBP"), (99.99, "EUR")]
+        ):
+            response = client.post(
+                "/api/v1/policies/",
+                json={
+                    "policy_number": f"APISUMM{i}",
+                    "insured_name": "Summary Test",
+                    "premium_amount": amount,
+                    "premium_currency": currency,
+                    "period_start_date": "2024-01-01",
+                    "period_end_date": "2024-12-31",
+                    "status": "pending",
+                    "policy_type": "Casualty",
+                },
+            )
+            assert response.status_code == 200, response.text
+
+        response = client.get("/api/v1/policies/summary")
+        assert response.status_code == 200
+        data = response.json()
+        assert {
+            "policy_type": "Casualty",
+            "status": "pending",
+            "currency": "GBP",
+            "policy_count": 2,
+            "total_premium": "2000.00",
+        } in data["groups"]
+        assert data["totals_by_currency"]["EUR"] == {
+            "policy_count": 1,
+            "total_premium": "99.99",
+        }
+
+
+class TestAPIBatchTransitions:
+    """API tests for batch activation and cancellation"""
+
+    def test_activate_then_cancel_batch(self, client, make_policy):
+        """Test batch endpoints transition valid policies and report the rest"""
+        for policy_number in ("BTRANS001", "BTRANS002"):
+            make_policy(policy_number)
+
+        response = client.post(
+            "/api/v1/policies/activate-batch",
+            json={"policy_numbers": ["BTRANS001", "BTRANS002", "BTRANS404"]},
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert (data["succeeded"], data["failed"]) == (2, 1)
+        assert data["results"][0]["policy"]["status"] == "Active"
+        assert data["results"][2]["error"] == "Policy not found"
+
+        response = client.post(
+            "/api/v1/policies/cancel-batch",
+            json={"policy_numbers": ["BTRANS002"], "reason": "Portfolio exit"},
+        )
+        assert response.json()["succeeded"] == 1
+        assert client.get("/api/v1/policies/BTRANS002").json()["status"] == "Cancelled"
+
+    def test_empty_batch_rejected(self, client):
+        """Test a batch without policy numbers fails validation"""
+        response = client.post(
+            "/api/v1/policies/cancel-batch", json={"policy_numbers": []}
+        )
+        assert response.status_code == 422
+
+
+class TestAPIExpirySweeper:
+    """API tests for the manual sweeper trigger"""
+
+    def test_manual_sweep(self, client):
+        """Test the trigger expires lapsed active policies and reports counters"""
+        response = client.post(
+            "/api/v1/policies/",
+            json={
+                "policy_number": "LAPSED001",
+                "insured_name": "Lapsed Insured",
+                "premium_amount": 400.0,
+                "period_start_date": "2020-01-01",
+                "period_end_date": "2020-12-31",
+                "status": "active",
+            },
+        )
+        assert response.status_code == 200, response.text
+
+        response = client.post("/api/v1/policies/sweep-expired")
+        assert response.status_code == 200
+        assert response.json()["expired"] >= 1
+        assert client.get("/api/v1/policies/LAPSED001").json()["status"] == "Inactive"
+        assert client.get("/health/sweeper").json()["runs"] >= 1
+
+
+class TestAPIAnalytics:
+    """API tests for the snapshot-backed analytics endpoints"""
+
+    def test_groups_follow_writes(self, client):
+        """Test groups are served from a snapshot refreshed after each write"""
+        payload = {
+            "policy_number": "ANALYT001",
+            "insured_name": "Analytics Insured",
+            "premium_amount": 1234.5,
+            "premium_currency": "EUR",
+            "period_start_date": "2025-01-01",
+            "period_end_date": "2025-12-31",
+            "status": "pending",
+            "policy_type": "Construction",
+        }
+        assert client.post("/api/v1/policies/", json=payload).status_code == 200
+
+        response = client.get("/api/v1/analytics/groups?by=policy_type&currency=EUR")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["groups"] == [
+            {
+                "policy_type": "Construction",
+                "currency": "EUR",
+                "policy_count": 1,
+                "total_premium": "1234.50",
+            }
+        ]
+        assert data["snapshot"]["policies"] >= 1
+
+        histogram = client.get(
+            "/api/v1/analytics/premium-histogram?bins=4&currency=EUR"
+        )
+        assert histogram.json()["histograms"]["EUR"]["counts"] == [0, 0, 1, 0]
+
+        ladder = client.get(
+            "/api/v1/analytics/expiry-ladder?as_of=2025-12-01&buckets=2"
+        )
+        assert ladder.json()["buckets"][1]["total_premium"] == {"EUR": "1234.50"}
+
+    def test_unknown_dimension_rejected(self, client):
+        """Test grouping by an unsupported column is a client error"""
+        response = client.get("/api/v1/analytics/groups?by=insured_name")
+        assert response.status_code == 400
+
+
+class TestAPIStartup:
+    """API tests for idempotent application startup"""
+
+    # Interpreter start to a ready app on an initialized database, with margin
+    # for slow CI machines (about 1s locally)
+    COLD_START_BUDGET_SECONDS = 3.0
+
+    STARTUP_SCRIPT = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        "from app.policy_management.api.app_factory import create_app\n"
+        "app = create_app()\n"
+        "print(json.dumps({'seconds': time.perf_counter() - started,"
+        " 'numpy': 'numpy' in sys.modules}))\n"
+    )
+
+    def _start(self, database):
+        import json
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        root = Path(__file__).resolve().parents[3]
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{database}"}
+        result = subprocess.run(
+            [sys.executable, "-c", self.STARTUP_SCRIPT],
+            cwd=root,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        lines = result.stdout.strip().splitlines()
+        return json.loads(lines[-1]), lines[:-1]
+
+    def test_restart_keeps_data_and_stays_within_budget(self, tmp_path):
+        """Test a restart leaves policies alone, does no setup work and starts fast"""
+        import sqlite3
+
+        database = tmp_path / "startup.db"
+        _, first_output = self._start(database)
+        assert "Database initialized" in first_output
+
+        with sqlite3.connect(database) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM policies").fetchone() == (
+                0,
+            )
+            connection.execute(
+                "INSERT INTO policies (policy_number, insured_name, premium_amount, "
+                "premium_currency, period_start_date, period_end_date, status_id, type_id, "
+                "created_at, updated_at) "
+                "SELECT 'KEEP0001', 'Kept Insured', 100, 'GBP', '2024-01-01', '2024-12-31', "
+                "(SELECT id FROM policy_statuses WHERE name = 'active'), "
+                "(SELECT id FROM policy_types WHERE name = 'Marine'), "
+                "'2024-01-01 00:00:00', '2024-01-01 00:00:00'"
+            )
+
+        timing, second_output = self._start(database)
+        assert "Database initialized" not in second_output
+        with sqlite3.connect(database) as connection:
+            assert connection.execute(
+                "SELECT policy_number FROM policies"
+            ).fetchall() == [("KEEP0001",)]
+            assert connection.execute(
+                "SELECT COUNT(*) FROM policy_statuses"
+            ).fetchone() == (4,)
+
+        assert timing["numpy"] is False
+        assert timing["seconds"] < self.COLD_START_BUDGET_SECONDS
+
+
+class TestAPIMetrics:
+    """API tests for the /metrics endpoint"""
+
+    def test_metrics_by_route_template(self, client):
+        """Test requests are recorded per route template with status and SQL counts"""
+        client.get("/api/v1/policies/METRICS404")
+        client.get("/api/v1/policies/")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_requests_total{method="GET",route="/api/v1/policies/{policy_number}",'
+            'status="404"} 1'
+        ) in response.text
+
+        metrics = client.app.state.metrics
+        labels = ("GET", "/api/v1/policies/")
+        assert metrics.request_queries.count(labels) == 1
+        assert metrics.request_queries.sum(labels) >= 1
+        assert metrics.response_size.sum(labels) > 0
+        assert metrics.in_progress.value(("GET",)) == 0
+
+
+class TestAPILoadGenerator:
+    """API tests for scripts/load_generator.py against the in-process app"""
+
+    @pytest.fixture
+    def load_generator(self):
+        import importlib.util
+        from pathlib import Path
+
+        path = Path(__file__).resolve().parents[3] / "scripts" / "load_generator.py"
+        spec = importlib.util.spec_from_file_location("load_generator", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_mixed_profile_report(self, client, load_generator):
+        """Test every scenario runs without errors and the report has percentiles"""
+        import asyncio
+
+        # The client fixture shares one session, so requests must not overlap
+        config = load_generator.LoadConfig(
+            profile=dict(load_generator.PROFILES["mixed"]),
+            concurrency=1,
+            duration=None,
+            requests=60,
+            setup_policies=5,
+        )
+        report = asyncio.run(load_generator.run_load_test(config, app=client.app))
+
+        assert report["errors"] == 0, report["scenarios"]
+        assert (
+            report["requests"]
+            + sum(scenario["skipped"] for scenario in report["scenarios"].values())
+            == 60
+        )
+        assert set(report["latency"]) == {"p50_ms", "p95_ms", "p99_ms", "max_ms"}
+        assert report["latency"]["p50_ms"] <= report["latency"]["p99_ms"]
+        assert all(
+            report["scenarios"][name]["requests"] > 0
+            for name in load_generator.SCENARIOS
+        )
+
+    def test_in_process_app_uses_throwaway_database(self, load_generator):
+        """Test --in-process runs on a temporary database that is removed afterwards"""
+        import asyncio
+        import os
+        from app.policy_management.infrastructure.db import get_db
+
+        config = load_generator.LoadConfig(
+            profile=dict(load_generator.PROFILES["mixed"]),
+            concurrency=2,
+            duration=None,
+            requests=30,
+            setup_policies=3,
+        )
+        with load_generator.in_process_app() as app:
+            sessions = app.dependency_overrides[get_db]()
+            database = next(sessions).get_bind().url.database
+            sessions.close()
+            report = asyncio.run(load_generator.run_load_test(config, app=app))
+            assert os.path.exists(database)
+
+        assert report["errors"] == 0, report["scenarios"]
+        assert not os.path.exists(database)
+
+    def test_config_validation(self, load_generator):
+        """Test unknown scenarios and unbounded runs are rejected"""
+        with pytest.raises(ValueError):
+            load_generator.LoadConfig(profile={"delete": 1})
+        with pytest.raises(ValueError):
+            load_generator.LoadConfig(duration=None, requests=None)
+        assert load_generator.percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+
+
+class TestAPIHealthCheck:
+    """API tests for scripts/automated_health_check.py, sync and --async"""
+
+    @pytest.fixture
+    def health_check(self):
+        import importlib.util
+        from pathlib import Path
+
+        scripts = Path(__file__).resolve().parents[3] / "scripts"
+        spec = importlib.util.spec_from_file_location(
+            "automated_health_check", scripts / "automated_health_check.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        """App on its own SQLite file with a session per request, since the
+        checks run concurrently and the shared db_session is not thread-safe"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.policy_management.api.app_factory import create_app
+        from app.policy_management.infrastructure.db import Base, get_db
+        from app.policy_management.infrastructure.seed_data import (
+            seed_statuses_and_types,
+        )
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'health.db'}",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with Session() as db:
+            seed_statuses_and_types(db)
+
+        def get_test_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = create_app()
+        app.dependency_overrides[get_db] = get_test_db
+        yield app
+        engine.dispose()
+
+    def _seed(self, app, count):
+        """More than a page of policies the listing filter matches, all older
+        than the one the CRUD check creates"""
+        from datetime import date
+        from decimal import Decimal
+        from app.policy_management.api.schemas import CreatePolicyDTO
+        from app.policy_management.application.policy_services import PolicyService
+        from app.policy_management.infrastructure.db import get_db
+        from app.policy_management.infrastructure.policy_repository import (
+            SQLPolicyRepository,
+        )
+
+        sessions = app.dependency_overrides[get_db]()
+        service = PolicyService(SQLPolicyRepository(next(sessions)))
+        service.create_policies(
+            [
+                CreatePolicyDTO(
+                    policy_number=f"HEALTH{i:04d}",
+                    insured_name="Seeded Insured",
+                    premium_amount=Decimal("500.00"),
+                    premium_currency="GBP",
+                    period_start_date=date(2024, 1, 1),
+                    period_end_date=date(2099, 12, 31),
+                    status="pending",
+                    policy_type="Property",
+                )
+                for i in range(count)
+            ]
+        )
+        sessions.close()
+
+    def test_listing_finds_policy_past_first_page(self, app, health_check, monkeypatch):
+        """Test the sync CRUD check pages through the listing to the new policy"""
+        from starlette.testclient import TestClient
+
+        self._seed(app, 150)
+        with TestClient(app) as client:
+            monkeypatch.setattr(health_check, "requests", client)
+            checker = health_check.SystemHealthChecker()
+            assert checker.test_policy_crud_operations()
+
+        listing = checker.results["services"]["Policy Listing"]
+        assert listing["status"] == "PASS"
+        assert listing["message"] == "Found new policy among 151 policies"
+
+    def _run(self, app, health_check, deadline):
+        import asyncio
+
+        import httpx
+
+        async def run():
+            async with httpx.AsyncClient(app=app) as async_client:
+                return await health_check.run_async_checks(
+                    ["http://testserver/"], deadline, client=async_client
+                )
+
+        return asyncio.run(run())
+
+    def test_checks_report_timings(self, app, health_check):
+        """Test every check passes in-process and reports its timing"""
+        report = self._run(app, health_check, deadline=30)
+
+        target = report["targets"]["http://testserver"]
+        failed = {
+            name: s["message"]
+            for name, s in target["services"].items()
+            if s["status"] != "PASS"
+        }
+        assert not failed
+        assert report["overall_status"] == "HEALTHY"
+        assert "Policy Activation" in target["services"]
+        assert all("duration_ms" in s for s in target["services"].values())
+        assert len(target["check_timings_ms"]) == 7
+
+    def test_async_listing_finds_policy_past_first_page(self, app, health_check):
+        """Test the async CRUD check pages through the listing to the new policy"""
+        self._seed(app, 150)
+        report = self._run(app, health_check, deadline=30)
+
+        assert report["overall_status"] == "HEALTHY"
+        listing = report["targets"]["http://testserver"]["services"]["Policy Listing"]
+        assert listing["message"] == "Found new policy among 151 policies"
+
+    def test_deadline_fails_unfinished_checks(self, app, health_check):
+        """Test checks still running at the deadline are cancelled and marked FAIL"""
+        report = self._run(app, health_check, deadline=0)
+
+        services = report["targets"]["http://testserver"]["services"]
+        assert report["overall_status"] == "UNHEALTHY"
+        assert services["Policy Listing"]["status"] == "FAIL"
+        assert services["Policy Listing"]["message"] == "Deadline exceeded"
+
+
+class TestAPIReadiness:
+    """API tests for the liveness and readiness endpoints"""
+
+    def _override(self, client, bind):
+        from app.policy_management.api.dependencies import get_readiness_probe
+        from app.policy_management.api.readiness import ReadinessProbe
+
+        probe = ReadinessProbe(bind, ttl=60)
+        client.app.dependency_overrides[get_readiness_probe] = lambda: probe
+        return probe
+
+    def test_ready_and_live(self, client, test_engine):
+        """Test a healthy instance is ready and repeated probes reuse one result"""
+        probe = self._override(client, test_engine)
+
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert set(body["checks"]) == {"pool", "database", "sweeper", "caches"}
+
+        assert client.get("/health/ready").json()["checked_at"] == body["checked_at"]
+        assert probe.probes == 1
+        assert client.get("/health/live").json() == {"status": "alive"}
+
+    def test_unreachable_database_returns_503(self, client, tmp_path):
+        """Test a failing database ping makes the instance unready"""
+        from sqlalchemy import create_engine
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'policies.db'}")
+        self._override(client, engine)
+
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["checks"]["database"]["status"] == "degraded"
+        assert client.get("/health/live").status_code == 200
+
+    @pytest.fixture
+    def async_db(self, monkeypatch, tmp_path):
+        """ASYNC_DB on, with the async engine built from a throwaway SQLite URL"""
+        pytest.importorskip("aiosqlite")
+        from app.policy_management.api.config import Settings
+        from app.policy_management.api.dependencies import get_readiness_probe
+        from app.policy_management.infrastructure import db
+
+        monkeypatch.setattr(Settings, "async_db", True)
+        monkeypatch.setattr(
+            Settings, "database_url", f"sqlite:///{tmp_path / 'async.db'}"
+        )
+        db.get_async_engine.cache_clear()
+        get_readiness_probe.cache_clear()
+        yield db
+        db.get_async_engine().sync_engine.dispose()
+        db.get_async_engine.cache_clear()
+        get_readiness_probe.cache_clear()
+
+    def test_async_engine_checked_under_async_db(self, client, async_db):
+        """Test readiness pings the async engine and reports its pool"""
+        from app.policy_management.api.dependencies import get_readiness_probe
+
+        probe = get_readiness_probe()
+        assert probe.async_bind is async_db.get_async_engine()
+
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        checks = response.json()["checks"]
+        assert checks["async_database"]["status"] == "ok"
+        assert checks["async_pool"]["pool"] == "AsyncAdaptedQueuePool"
+        assert checks["async_pool"]["exhausted"] is False
+
+    def test_unreachable_async_database_returns_503(self, client, async_db, tmp_path):
+        """Test the sync engine being fine does not hide a failing async engine"""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from app.policy_management.api.dependencies import get_readiness_probe
+        from app.policy_management.api.readiness import ReadinessProbe
+
+        probe = ReadinessProbe(
+            async_db.engine,
+            async_bind=create_async_engine(
+                f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'policies.db'}"
+            ),
+        )
+        client.app.dependency_overrides[get_readiness_probe] = lambda: probe
+
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        checks = response.json()["checks"]
+        assert checks["database"]["status"] == "ok"
+        assert checks["async_database"]["status"] == "degraded"
+
+
+class TestAPIPolicyFragments:
+    """API tests for the server-rendered policy table rows"""
+
+    def _book(self, make_policy, count):
+        for i in range(count):
+            make_policy(
+                f"FRAG{i:04d}",
+                insured_name=f"<b>Fragment</b> {i}",
+                status="active" if i % 2 else "pending",
+                policy_type="Marine",
+            )
+
+    def test_infinite_scroll_pages(self, client, make_policy):
+        """Test each page ends with a revealed-triggered row loading the next one"""
+        import html
+        import re
+
+        self._book(make_policy, 5)
+        response = client.get(
+            "/fragments/policies", params={"limit": 2, "sort": "policy_number"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.text.count('class="view-btn"') == 2
+        assert "&lt;b&gt;Fragment&lt;/b&gt; 0" in response.text
+        assert 'hx-trigger="revealed"' in response.text
+
+        numbers = []
+        url = "/fragments/policies?limit=2&sort=policy_number"
+        while url:
+            page = client.get(url).text
+            numbers += re.findall(r'data-policy-number="(\w+)"', page)
+            next_url = re.search(r'hx-get="([^"]+)"', page)
+            url = html.unescape(next_url.group(1)) if next_url else None
+        assert numbers == [f"FRAG{i:04d}" for i in range(5)]
+
+    def test_filters_and_version_keyed_cache(self, client, response_cache, make_policy):
+        """Test server-side filtering, and that a write invalidates cached pages"""
+        self._book(make_policy, 4)
+        params = {"status": "active"}
+        response = client.get("/fragments/policies", params=params)
+        assert response.text.count('class="view-btn"') == 2
+        assert (
+            "No policies found"
+            in client.get(
+                "/fragments/policies", params={"policy_type": "Property"}
+            ).text
+        )
+
+        hits = response_cache.hits
+        again = client.get("/fragments/policies", params=params)
+        assert again.text == response.text
+        assert response_cache.hits == hits + 1
+        etag = again.headers["ETag"]
+        assert (
+            client.get(
+                "/fragments/policies", params=params, headers={"If-None-Match": etag}
+            ).status_code
+            == 304
+        )
+
+        client.post("/api/v1/policies/FRAG0000/activate")
+        updated = client.get("/fragments/policies", params=params)
+        assert updated.headers["ETag"] != etag
+        assert updated.text.count('class="view-btn"') == 3
+
+    def test_invalid_sort_is_rejected(self, client):
+        """Test an unknown sort order is a 400, not a server error"""
+        assert (
+            client.get("/fragments/policies", params={"sort": "premium"}).status_code
+            == 400
+        )
+
+
+class TestAPIStaticAssets:
+    """API tests for fingerprinted, precompressed static assets"""
+
+    def test_dashboard_links_immutable_assets(self, client):
+        """Test index.html links hashed URLs served with immutable caching"""
+        import re
+
+        page = client.get("/").text
+        urls = re.findall(r'"(/static/[^"]+)"', page)
+        assert {url.rsplit(".", 1)[-1] for url in urls} == {"css", "js"}
+        assert "/static/app.js" not in page
+
+        for url in urls:
+            response = client.get(url, headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert (
+                response.headers["Cache-Control"]
+                == "public, max-age=31536000, immutable"
+            )
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert response.headers["Vary"] == "Accept-Encoding"
+
+            revalidated = client.get(
+                url,
+                headers={
+                    "Accept-Encoding": "gzip",
+                    "If-None-Match": response.headers["ETag"],
+                },
+            )
+            assert revalidated.status_code == 304
+
+    def test_plain_names_revalidate(self, client):
+        """Test unhashed names still work but must be revalidated"""
+        response = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert client.get("/static/../main.py").status_code == 404
+
+
+class TestAPICompressionAndFormats:
+    """API tests for response compression and policy list content negotiation"""
+
+    def test_large_responses_are_gzipped(self, client, response_cache, make_policy):
+        """Test the threshold, weak ETag revalidation and already-encoded responses"""
+        for i in range(30):
+            make_policy(
+                f"FMT{i:05d}", insured_name=f"Format Test Insured {i}", status="active"
+            )
+        response = client.get("/api/v1/policies/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert len(response.json()) == 30
+        etag = response.headers["ETag"]
+        assert etag.startswith("W/")
+        assert (
+            client.get(
+                "/api/v1/policies/",
+                headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+            ).status_code
+            == 304
+        )
+
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in small.headers
+        identity = client.get(
+            "/api/v1/policies/", headers={"Accept-Encoding": "identity"}
+        )
+        assert "Content-Encoding" not in identity.headers
+
+        # The export gzips itself; the middleware must not compress it again
+        export = client.get(
+            "/api/v1/policies/export", headers={"Accept-Encoding": "gzip"}
+        )
+        assert export.headers["Content-Encoding"] == "gzip"
+        assert len(export.text.splitlines()) == 30
+
+    def test_columnar_and_msgpack_match_json(self, client, response_cache, make_policy):
+        """Test every negotiated representation carries the same policies"""
+        for i in range(5):
+            make_policy(f"FMT{i:05d}", premium_currency="USD", status="active")
+        expected = client.get("/api/v1/policies/").json()
+
+        response = client.get(
+            "/api/v1/policies/",
+            headers={"Accept": "application/vnd.tmhcc.columnar+json"},
+        )
+        assert response.headers["content-type"] == "application/vnd.tmhcc.columnar+json"
+        body = response.json()
+        assert [dict(zip(body["fields"], row)) for row in body["rows"]] == expected
+        assert (
+            response.headers["ETag"] != client.get("/api/v1/policies/").headers["ETag"]
+        )
+
+        assert (
+            client.get("/api/v1/policies/", headers={"Accept": "text/csv"}).status_code
+            == 406
+        )
+
+        msgpack = pytest.importorskip("msgpack")
+        response = client.get(
+            "/api/v1/policies/", headers={"Accept": "application/msgpack"}
+        )
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == expected
@@ -9,17 +9,6 @@ from app.policy_management.domain.entities import PolicyStatus, PolicyType
 class TestBasicIntegration:
     """Basic integration tests with real database"""
 
-    @pytest.fixture
-    def policy_service(self, db_session):
-        """Fixture to provide PolicyService with real DB session"""
-        from app.policy_management.application.policy_services import PolicyService
-        from app.policy_management.infrastructure.policy_repository import (
-            SQLPolicyRepository,
-        )
-
-        repository = SQLPolicyRepository(db_session)
-        return PolicyService(repository)
-
     def test_create_and_get_policy(self, policy_service):
         """Test creating a policy and then retrieving it"""
         from app.policy_management.api.schemas import CreatePolicyDTO
@@ -109,3 +98,834 @@ class TestBasicIntegration:
 
         policies = policy_service.list_policies()
         assert policies == []
+
+
+class TestPolicyPagination:
+    """Integration tests for keyset-paginated, filtered policy listings"""
+
+    @pytest.fixture(autouse=True)
+    def book(self, db_session, make_policy):
+        """A book of exactly five policies"""
+        from app.policy_management.infrastructure.models import PolicyModel
+
+        db_session.query(PolicyModel).delete()
+        db_session.commit()
+
+        for i, (status, policy_type, currency) in enumerate(
+            [
+                ("active", "Property", "GBP"),
+                ("pending", "Marine", "USD"),
+                ("active", "Marine", "GBP"),
+                ("cancelled", "Casualty", "EUR"),
+                ("active", "Property", "USD"),
+            ]
+        ):
+            make_policy(
+                f"PAGE00{i}",
+                insured_name=f"Page Customer {i}",
+                premium_amount=Decimal(1000 * (i + 1)),
+                premium_currency=currency,
+                period_start_date=date(2024, 1 + i, 1),
+                period_end_date=date(2024, 6 + i, 1),
+                status=status,
+                policy_type=policy_type,
+            )
+
+    def test_cursor_walks_every_policy_once(self, policy_service):
+        """Test following next cursors visits each policy exactly once in order"""
+        from app.policy_management.api.schemas import PolicyFilterDTO
+
+        seen, cursor = [], None
+        while True:
+            policies, cursor = policy_service.list_policies_page(
+                PolicyFilterDTO(), 2, cursor=cursor
+            )
+            seen.extend(p.policy_number.value for p in policies)
+            if cursor is None:
+                break
+
+        assert seen == [f"PAGE00{i}" for i in range(5)]
+
+    def test_policy_number_sort(self, policy_service):
+        """Test keyset pagination ordered by policy number"""
+        from app.policy_management.api.schemas import PolicyFilterDTO
+
+        first, cursor = policy_service.list_policies_page(
+            PolicyFilterDTO(), 3, sort="policy_number"
+        )
+        second, last_cursor = policy_service.list_policies_page(
+            PolicyFilterDTO(), 3, cursor=cursor, sort="policy_number"
+        )
+        assert [p.policy_number.value for p in first + second] == sorted(
+            f"PAGE00{i}" for i in range(5)
+        )
+        assert last_cursor is None
+
+    def test_filters_are_applied(self, policy_service):
+        """Test status, type, currency, premium and period filters"""
+        from app.policy_management.api.schemas import PolicyFilterDTO
+
+        def numbers(**filters):
+            policies, _ = policy_service.list_policies_page(
+                PolicyFilterDTO(**filters), 10
+            )
+            return {p.policy_number.value for p in policies}
+
+        assert numbers(status="active") == {"PAGE000", "PAGE002", "PAGE004"}
+        assert numbers(status="active", policy_type="marine") == {"PAGE002"}
+        assert numbers(currency="usd") == {"PAGE001", "PAGE004"}
+        assert numbers(min_premium=2000, max_premium=3000) == {"PAGE001", "PAGE002"}
+        assert numbers(active_from=date(2024, 8, 15), active_to=date(2024, 9, 15)) == {
+            "PAGE003",
+            "PAGE004",
+        }
+
+    def test_cursor_from_other_sort_is_rejected(self, policy_service):
+        """Test a cursor cannot be replayed against a different ordering"""
+        from app.policy_management.api.schemas import PolicyFilterDTO
+
+        _, cursor = policy_service.list_policies_page(PolicyFilterDTO(), 2)
+        with pytest.raises(ValueError):
+            policy_service.list_policies_page(
+                PolicyFilterDTO(), 2, cursor=cursor, sort="policy_number"
+            )
+
+
+class TestWritePathQueryBudget:
+    """Create and state changes must cost at most one read and one write"""
+
+    @staticmethod
+    def _budget(statements):
+        verbs = [
+            statement.lstrip().split(None, 1)[0].upper() for statement in statements
+        ]
+        reads = sum(1 for verb in verbs if verb == "SELECT")
+        writes = sum(1 for verb in verbs if verb in {"INSERT", "UPDATE", "DELETE"})
+        return reads, writes
+
+    def _dto(self, policy_number):
+        from app.policy_management.api.schemas import CreatePolicyDTO
+
+        return CreatePolicyDTO(
+            policy_number=policy_number,
+            insured_name="Budget Test",
+            premium_amount=Decimal("1200.0"),
+            premium_currency="GBP",
+            period_start_date=date(2024, 1, 1),
+            period_end_date=date(2099, 12, 31),
+            status="pending",
+            policy_type="Property",
+        )
+
+    def test_create_is_one_write(self, policy_service, query_counter):
+        """Test create issues a single INSERT and no reads"""
+        query_counter.clear()
+        policy = policy_service.create_policy(self._dto("BUDGET001"))
+        assert self._budget(query_counter) == (0, 1)
+        assert policy.id is not None
+        assert policy.status == PolicyStatus.PENDING
+
+    def test_activate_is_one_read_one_write(self, policy_service, query_counter):
+        """Test activate issues one SELECT and one UPDATE"""
+        policy_service.create_policy(self._dto("BUDGET002"))
+        query_counter.clear()
+        policy = policy_service.activate_policy("BUDGET002")
+        assert self._budget(query_counter) == (1, 1)
+        assert policy.status == PolicyStatus.ACTIVE
+
+    def test_cancel_is_one_read_one_write(self, policy_service, query_counter):
+        """Test cancel issues one SELECT and one UPDATE"""
+        policy_service.create_policy(self._dto("BUDGET003"))
+        query_counter.clear()
+        policy_service.cancel_policy("BUDGET003")
+        assert self._budget(query_counter) == (1, 1)
+        assert policy_service.get_policy("BUDGET003").status == PolicyStatus.CANCELLED
+
+    def test_duplicate_rejected_by_unique_constraint(self, policy_service):
+        """Test duplicate policy numbers still raise without a pre-select"""
+        policy_service.create_policy(self._dto("BUDGET004"))
+        with pytest.raises(ValueError, match="already exists"):
+            policy_service.create_policy(self._dto("BUDGET004"))
+        assert policy_service.get_policy("BUDGET004") is not None
+
+
+class TestEngineFactory:
+    """Integration tests for the Settings-driven engine factory"""
+
+    def test_sqlite_file_engine_applies_pragmas(self, tmp_path):
+        """Test a file-backed SQLite engine is pooled and runs in WAL mode"""
+        from app.policy_management.api.config import Settings
+        from app.policy_management.infrastructure.db import (
+            create_db_engine,
+            get_pool_status,
+        )
+
+        engine = create_db_engine(Settings(), url=f"sqlite:///{tmp_path / 'pool.db'}")
+        try:
+            with engine.connect() as connection:
+                pragma = lambda name: connection.exec_driver_sql(
+                    f"PRAGMA {name}"
+                ).scalar()
+                assert pragma("journal_mode") == "wal"
+                assert pragma("synchronous") == 1  # NORMAL
+                assert pragma("busy_timeout") == Settings.sqlite_busy_timeout_ms
+                assert get_pool_status(engine)["checkedout"] == 1
+            status = get_pool_status(engine)
+            assert status["pool"] == "QueuePool"
+            assert status["size"] == Settings.db_pool_size
+            assert status["checkedin"] == 1
+        finally:
+            engine.dispose()
+
+    def test_engine_options_per_dialect(self):
+        """Test pool and connect arguments are only passed where valid"""
+        from app.policy_management.api.config import Settings
+        from app.policy_management.infrastructure.db import engine_options
+
+        memory = engine_options("sqlite:///:memory:", Settings())
+        assert "pool_size" not in memory
+        assert memory["connect_args"]["check_same_thread"] is False
+
+        postgres = engine_options("postgresql://user@host/policies", Settings())
+        assert "check_same_thread" not in postgres["connect_args"]
+        assert postgres["connect_args"] == {
+            "connect_timeout": Settings.db_connect_timeout
+        }
+        assert postgres["pool_pre_ping"] is Settings.db_pool_pre_ping
+
+
+class TestPolicySearch:
+    """Integration tests for insured-name search through the FTS index"""
+
+    @pytest.fixture(autouse=True)
+    def insureds(self, make_policy):
+        names = [
+            "Acme Corporation Ltd",
+            "Acme Shipping Co",
+            "Global Logistics Inc",
+            "Acumen Partners",
+            "100%_Secure Ltd",
+        ]
+        for i, name in enumerate(names):
+            make_policy(
+                f"SEARCH{i:03d}",
+                insured_name=name,
+                premium_amount=Decimal("1000.00"),
+                period_end_date=date(2024, 12, 31),
+            )
+
+    def _names(self, policies):
+        return [policy.insured_name for policy in policies]
+
+    def test_substring_and_prefix_match(self, policy_service):
+        """Test every term must match and prefixes match"""
+        policies, _ = policy_service.search_policies("acm", 10)
+        assert sorted(self._names(policies)) == [
+            "Acme Corporation Ltd",
+            "Acme Shipping Co",
+        ]
+
+        policies, _ = policy_service.search_policies("acme ship", 10)
+        assert self._names(policies) == ["Acme Shipping Co"]
+
+        policies, _ = policy_service.search_policies("co", 10)
+        assert "Acme Shipping Co" in self._names(policies)
+
+    def test_fuzzy_match_ranked(self, policy_service):
+        """Test fuzzy search tolerates typos and ranks the closest name first"""
+        policies, _ = policy_service.search_policies("acme corporatoin", 10)
+        assert policies == []
+
+        policies, _ = policy_service.search_policies("acme corporatoin", 10, fuzzy=True)
+        assert self._names(policies)[0] == "Acme Corporation Ltd"
+
+    def test_pagination_and_wildcards(self, policy_service):
+        """Test offset pagination and that LIKE wildcards are literal"""
+        first, next_offset = policy_service.search_policies("acme", 1)
+        assert next_offset == 1
+        second, next_offset = policy_service.search_policies("acme", 1, offset=1)
+        assert next_offset is None
+        assert {*self._names(first), *self._names(second)} == {
+            "Acme Corporation Ltd",
+            "Acme Shipping Co",
+        }
+
+        policies, _ = policy_service.search_policies("%_", 10)
+        assert self._names(policies) == ["100%_Secure Ltd"]
+
+    def test_index_follows_writes(self, policy_service, db_session):
+        """Test renames and deletes are reflected by the index triggers"""
+        from app.policy_management.infrastructure.models import PolicyModel
+
+        db_session.query(PolicyModel).filter_by(policy_number="SEARCH002").update(
+            {"insured_name": "Worldwide Freight"}
+        )
+        db_session.query(PolicyModel).filter_by(policy_number="SEARCH003").delete()
+        db_session.commit()
+
+        assert policy_service.search_policies("logistics", 10)[0] == []
+        assert self._names(policy_service.search_policies("freight", 10)[0]) == [
+            "Worldwide Freight"
+        ]
+        assert policy_service.search_policies("acumen", 10)[0] == []
+
+    def test_blank_query_rejected(self, policy_service):
+        """Test whitespace-only queries raise ValueError"""
+        with pytest.raises(ValueError):
+            policy_service.search_policies("   ", 10)
+
+
+class TestPremiumSummary:
+    """Integration tests for the trigger-maintained premium summary"""
+
+    def _totals(self, policy_service):
+        return {
+            (total.policy_type.value, total.status.value, total.currency): (
+                total.policy_count,
+                total.total_premium,
+            )
+            for total in policy_service.get_premium_summary()
+        }
+
+    def test_summary_follows_writes(self, policy_service, make_policy):
+        """Test inserts and status changes move premium between groups exactly"""
+        make_policy("SUMM0001", premium_amount=Decimal("1000.10"), policy_type="Marine")
+        make_policy("SUMM0002", premium_amount=Decimal("2000.20"), policy_type="Marine")
+        make_policy(
+            "SUMM0003",
+            premium_amount=Decimal("300.00"),
+            premium_currency="USD",
+            policy_type="Marine",
+        )
+        assert self._totals(policy_service) == {
+            ("Marine", "pending", "GBP"): (2, Decimal("3000.30")),
+            ("Marine", "pending", "USD"): (1, Decimal("300.00")),
+        }
+
+        policy_service.activate_policy("SUMM0001")
+        policy_service.cancel_policy("SUMM0003")
+        assert self._totals(policy_service) == {
+            ("Marine", "active", "GBP"): (1, Decimal("1000.10")),
+            ("Marine", "pending", "GBP"): (1, Decimal("2000.20")),
+            ("Marine", "cancelled", "USD"): (1, Decimal("300.00")),
+        }
+
+    def test_check_and_rebuild(self, policy_service, make_policy, db_session):
+        """Test the checker reports drift and a rebuild repairs it"""
+        from app.policy_management.infrastructure.summary import summary_backend
+
+        make_policy("SUMM0004", premium_amount=Decimal("500.00"), policy_type="Marine")
+        connection = db_session.connection()
+        backend = summary_backend(connection.dialect)
+        assert backend.check(connection) == []
+
+        connection.exec_driver_sql("UPDATE policy_summary SET premium_minor = 1")
+        discrepancies = backend.check(connection)
+        assert len(discrepancies) == 1
+        assert discrepancies[0].expected == (1, 50000)
+
+        backend.rebuild(connection)
+        assert backend.check(connection) == []
+        assert self._totals(policy_service)[("Marine", "pending", "GBP")] == (
+            1,
+            Decimal("500.00"),
+        )
+
+
+class TestBatchTransitions:
+    """Integration tests for batch activation and cancellation"""
+
+    def test_batch_cancel_is_one_read_one_write(
+        self, policy_service, make_policy, query_counter
+    ):
+        """Test a batch issues one SELECT and one UPDATE per target status"""
+        for i in range(5):
+            make_policy(f"TRANS000{i}")
+        make_policy("TRANS0009", status="cancelled")
+        query_counter.clear()
+
+        results = policy_service.cancel_policies(
+            [f"TRANS000{i}" for i in range(5)] + ["TRANS0009", "TRANS0000", "NOPE0001"]
+        )
+        assert TestWritePathQueryBudget._budget(query_counter) == (1, 1)
+
+        assert [result.success for result in results] == [True] * 5 + [False] * 3
+        assert results[5].error == "Policy is already cancelled or inactive"
+        assert results[6].error == "Duplicate policy number in batch"
+        assert results[7].error == "Policy not found"
+        assert policy_service.get_policy("TRANS0004").status == PolicyStatus.CANCELLED
+
+    def test_concurrent_change_is_reported(self, policy_service, make_policy):
+        """Test rows changed after they were read are left alone and reported"""
+        repository = policy_service.repository
+        make_policy("TRANS0010")
+        make_policy("TRANS0011")
+        stale = repository.get_policies_by_policy_numbers(["TRANS0010", "TRANS0011"])
+        read_statuses = {policy.id: policy.status for policy in stale}
+
+        policy_service.cancel_policy("TRANS0011")
+        for policy in stale:
+            policy.activate()
+        updated = repository.update_policy_statuses(stale, read_statuses)
+
+        fresh = policy_service.get_policy("TRANS0010")
+        assert updated == {fresh.id}
+        assert policy_service.get_policy("TRANS0010").status == PolicyStatus.ACTIVE
+        assert policy_service.get_policy("TRANS0011").status == PolicyStatus.CANCELLED
+
+    def test_each_group_keeps_its_own_timestamp(
+        self, policy_service, make_policy, monkeypatch
+    ):
+        """Test every policy gets the updated_at its own UPDATE wrote"""
+        from datetime import datetime, timedelta
+        from app.policy_management.infrastructure import policy_statements
+
+        repository = policy_service.repository
+        make_policy("TRANS0020")
+        make_policy("TRANS0021")
+        policies = repository.get_policies_by_policy_numbers(["TRANS0020", "TRANS0021"])
+        read_statuses = {policy.id: policy.status for policy in policies}
+        policies[0].activate()
+        policies[1].cancel()
+
+        # One timestamp per target status instead of a shared one
+        times = iter(datetime(2030, 1, 1) + timedelta(hours=hour) for hour in range(2))
+        original = policy_statements.update_statuses
+
+        def update_statuses(*args):
+            return [
+                (statement.values(updated_at=at), ids, at)
+                for (statement, ids, _), at in zip(original(*args), times)
+            ]
+
+        monkeypatch.setattr(policy_statements, "update_statuses", update_statuses)
+        assert repository.update_policy_statuses(policies, read_statuses) == {
+            policy.id for policy in policies
+        }
+
+        for policy in policies:
+            stored = repository.get_policy_by_policy_number(policy.policy_number.value)
+            assert policy.updated_at == stored.updated_at
+        assert policies[0].updated_at != policies[1].updated_at
+
+
+class TestExpirySweeper:
+    """Integration tests for the lapsed-policy sweeper"""
+
+    def test_sweep_moves_lapsed_policies_in_batches(
+        self, policy_service, make_policy, db_session
+    ):
+        """Test expired active policies become inactive, batch by batch"""
+        from app.policy_management.infrastructure.expiry_sweeper import ExpirySweeper
+
+        for i in range(3):
+            make_policy(
+                f"SWEEP000{i}",
+                status="active",
+                period_start_date=date(2020, 1, 1),
+                period_end_date=date(2020, 12, 31),
+            )
+        make_policy("SWEEP0010", status="active")
+        make_policy("SWEEP0020")
+
+        sweeper = ExpirySweeper(batch_size=2)
+        result = sweeper.sweep(db_session, today=date(2025, 6, 1))
+        assert (result.expired, result.lapsed, result.batches) == (3, 0, 2)
+        assert policy_service.get_policy("SWEEP0000").status == PolicyStatus.INACTIVE
+        assert policy_service.get_policy("SWEEP0010").status == PolicyStatus.ACTIVE
+        assert policy_service.get_policy("SWEEP0020").status == PolicyStatus.PENDING
+
+        sweeper.lapse_pending = True
+        result = sweeper.sweep(db_session, today=date(2025, 6, 1))
+        assert (result.expired, result.lapsed) == (0, 1)
+        assert policy_service.get_policy("SWEEP0020").status == PolicyStatus.INACTIVE
+        assert sweeper.snapshot()["runs"] == 2
+
+
+class TestPolicyBookSnapshot:
+    """Integration tests for the columnar analytics snapshot"""
+
+    def test_aggregates_match_sql(self, policy_service, make_policy, db_session):
+        """Test group totals and filters agree with the SQL summary and listing"""
+        from app.policy_management.api.schemas import PolicyFilterDTO
+        from app.policy_management.application.mappers import PolicyDtoMapper
+        from app.policy_management.domain.repository import PolicyFilter
+        from app.policy_management.infrastructure.policy_snapshot import (
+            PolicyBookSnapshot,
+        )
+
+        def make(policy_number, amount, currency, end, status="active"):
+            make_policy(
+                policy_number,
+                premium_amount=Decimal(amount),
+                premium_currency=currency,
+                period_start_date=date(2025, 1, 1),
+                period_end_date=end,
+                status=status,
+                policy_type="Casualty",
+            )
+
+        make("SNAP0001", "1000.10", "GBP", date(2025, 1, 20))
+        make("SNAP0002", "250.25", "GBP", date(2025, 2, 10))
+        make("SNAP0003", "99.99", "USD", date(2025, 2, 15), "pending")
+
+        snapshot = PolicyBookSnapshot.load(db_session)
+        everything = snapshot.filter_mask(PolicyFilter())
+        groups = {
+            (group["policy_type"], group["status"], group["currency"]): (
+                group["policy_count"],
+                Decimal(group["premium_minor"]).scaleb(-2),
+            )
+            for group in snapshot.group_totals(["policy_type", "status"], everything)
+        }
+        assert groups == {
+            (total.policy_type.value, total.status.value, total.currency): (
+                total.policy_count,
+                total.total_premium,
+            )
+            for total in policy_service.get_premium_summary()
+        }
+
+        dto = PolicyFilterDTO(currency="gbp", min_premium=Decimal("250.25"))
+        mask = snapshot.filter_mask(PolicyDtoMapper.filter_from_dto(dto))
+        policies, _ = policy_service.list_policies_page(dto, limit=100)
+        assert set(snapshot.ids[mask].tolist()) == {policy.id for policy in policies}
+
+        casualty = snapshot.filter_mask(PolicyFilter(policy_type=PolicyType.CASUALTY))
+        ladder = snapshot.expiry_ladder(date(2025, 1, 1), 30, 2, casualty)
+        assert [rung["policy_count"] for rung in ladder] == [1, 2]
+        assert ladder[1]["premium_minor"] == {"GBP": 25025, "USD": 9999}
+
+
+class TestSyntheticBulkLoad:
+    """Integration tests for bulk loading a synthetic book"""
+
+    def test_bulk_load_rebuilds_derived_structures(self, tmp_path):
+        """Test loaded rows reach the summary, search index and secondary indexes"""
+        from sqlalchemy import create_engine, inspect
+        from sqlalchemy.orm import Session
+        from app.policy_management.infrastructure.db import Base
+        from app.policy_management.infrastructure.models import PolicyModel
+        from app.policy_management.infrastructure.reference_data import reference_data
+        from app.policy_management.infrastructure.seed_data import (
+            seed_statuses_and_types,
+        )
+        from app.policy_management.infrastructure.summary import summary_backend
+        from app.policy_management.infrastructure.synthetic_data import (
+            GeneratorConfig,
+            bulk_load,
+        )
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'synthetic.db'}")
+        try:
+            Base.metadata.create_all(bind=engine)
+            with Session(engine) as session:
+                seed_statuses_and_types(session)
+                refs = reference_data.load(session)
+
+            report = bulk_load(engine, GeneratorConfig(count=2500), refs)
+            assert report.rows == 2500
+
+            with engine.connect() as connection:
+                assert (
+                    connection.exec_driver_sql("SELECT COUNT(*) FROM policies").scalar()
+                    == 2500
+                )
+                assert summary_backend(engine.dialect).check(connection) == []
+                matches = connection.exec_driver_sql(
+                    "SELECT COUNT(*) FROM policies_fts WHERE policies_fts MATCH 'harbour'"
+                ).scalar()
+                assert (
+                    matches
+                    == connection.exec_driver_sql(
+                        "SELECT COUNT(*) FROM policies WHERE insured_name LIKE 'Harbour %'"
+                    ).scalar()
+                )
+                assert matches > 0
+            indexes = {
+                index["name"] for index in inspect(engine).get_indexes("policies")
+            }
+            assert {index.name for index in PolicyModel.__table__.indexes} <= indexes
+        finally:
+            engine.dispose()
+
+    @pytest.fixture
+    def failing_load(self, tmp_path, monkeypatch):
+        """Engine, config and refs for a load whose second block fails"""
+        from sqlalchemy import create_engine, insert
+        from sqlalchemy.orm import Session
+        from app.policy_management.infrastructure import synthetic_data
+        from app.policy_management.infrastructure.db import Base
+        from app.policy_management.infrastructure.models import PolicyModel
+        from app.policy_management.infrastructure.reference_data import reference_data
+        from app.policy_management.infrastructure.seed_data import (
+            seed_statuses_and_types,
+        )
+
+        monkeypatch.setattr(synthetic_data, "BLOCK_SIZE", 100)
+        engine = create_engine(f"sqlite:///{tmp_path / 'synthetic.db'}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            seed_statuses_and_types(session)
+            refs = reference_data.load(session)
+
+        # The first row of the second block already exists
+        config = synthetic_data.GeneratorConfig(count=250)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(PolicyModel),
+                synthetic_data.generate_block(config, refs, 1)[:1],
+            )
+        yield engine, config, refs
+        engine.dispose()
+
+    def test_failed_load_reports_committed_rows(self, failing_load):
+        """Test a load failing mid-way reports the rows its earlier blocks committed"""
+        from sqlalchemy import inspect
+        from app.policy_management.infrastructure import synthetic_data
+        from app.policy_management.infrastructure.models import PolicyModel
+
+        engine, config, refs = failing_load
+        with pytest.raises(synthetic_data.BulkLoadError) as failure:
+            synthetic_data.bulk_load(engine, config, refs)
+        assert failure.value.rows == 100
+        assert failure.value.rebuilt
+
+        with engine.connect() as connection:
+            assert (
+                connection.exec_driver_sql("SELECT COUNT(*) FROM policies").scalar()
+                == 101
+            )
+        indexes = {index["name"] for index in inspect(engine).get_indexes("policies")}
+        assert {index.name for index in PolicyModel.__table__.indexes} <= indexes
+
+    def test_failed_rebuild_keeps_load_error(self, failing_load, monkeypatch):
+        """Test a rebuild failing after the load does not replace the load's error"""
+        from app.policy_management.infrastructure import synthetic_data
+
+        def broken_install(connection):
+            raise RuntimeError("rebuild failed")
+
+        monkeypatch.setattr(
+            synthetic_data, "install_derived_structures", broken_install
+        )
+        engine, config, refs = failing_load
+        with pytest.raises(synthetic_data.BulkLoadError) as failure:
+            synthetic_data.bulk_load(engine, config, refs)
+        assert failure.value.rows == 100
+        assert "UNIQUE constraint failed" in str(failure.value)
+        assert not failure.value.rebuilt
+        assert str(failure.value.rebuild_error) == "rebuild failed"
+
+    def test_broken_connection_skips_rebuild(self, failing_load, monkeypatch):
+        """Test no rebuild is attempted on a connection the failure invalidated"""
+        from sqlalchemy import event
+        from app.policy_management.infrastructure import synthetic_data
+
+        installs = []
+        monkeypatch.setattr(
+            synthetic_data, "install_derived_structures", installs.append
+        )
+        engine, config, refs = failing_load
+
+        @event.listens_for(engine, "handle_error")
+        def disconnect(context):
+            context.is_disconnect = True
+
+        with pytest.raises(synthetic_data.BulkLoadError) as failure:
+            synthetic_data.bulk_load(engine, config, refs)
+        assert failure.value.rows == 100
+        assert not failure.value.rebuilt
+        assert failure.value.rebuild_error is None
+        assert installs == []
+
+    def test_generate_script_initializes_database(self, tmp_path):
+        """Test a freshly generated book has its schema version and derived structures"""
+        import os
+        import sqlite3
+        import subprocess
+        import sys
+        from pathlib import Path
+        from app.policy_management.infrastructure.models import SCHEMA_VERSION
+
+        root = Path(__file__).resolve().parents[3]
+        database = tmp_path / "generated.db"
+        subprocess.run(
+            [sys.executable, "scripts/generate_policies.py", "--count", "50"],
+            cwd=root,
+            env={**os.environ, "DATABASE_URL": f"sqlite:///{database}"},
+            capture_output=True,
+            check=True,
+        )
+        with sqlite3.connect(database) as connection:
+            assert connection.execute(
+                "SELECT value FROM schema_meta WHERE key = 'schema_version'"
+            ).fetchone() == (SCHEMA_VERSION,)
+            assert connection.execute(
+                "SELECT COUNT(*) FROM policies_fts"
+            ).fetchone() == (50,)
+            assert connection.execute(
+                "SELECT SUM(policy_count) FROM policy_summary"
+            ).fetchone() == (50,)
+
+
+class TestQueryProfiler:
+    """Integration tests for the slow-query log, N+1 detection and query budgets"""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        from app.policy_management.infrastructure.policy_repository import (
+            SQLPolicyRepository,
+        )
+        from app.policy_management.infrastructure.reference_data import (
+            reference_data,
+        )
+        from app.policy_management.domain.entities import Policy
+        from app.policy_management.domain.value_objects import (
+            Money,
+            Period,
+            PolicyNumber,
+        )
+
+        reference_data.load(db_session)
+        repository = SQLPolicyRepository(db_session)
+        for i in range(6):
+            repository.add_policy(
+                Policy(
+                    policy_number=PolicyNumber(f"PROF{i:04d}"),
+                    insured_name=f"Profiled Insured {i}",
+                    premium=Money(100.0 + i),
+                    period=Period(date(2024, 1, 1), date(2024, 12, 31)),
+                )
+            )
+        return repository
+
+    def test_repository_calls_within_budget(self, repository, query_budget):
+        """Test single, batch and page reads each run one query, without N+1"""
+        from app.policy_management.domain.repository import PolicyFilter
+
+        with query_budget(1):
+            assert repository.get_policy_by_policy_number("PROF0001") is not None
+        with query_budget(1):
+            assert (
+                len(repository.get_policies_by_policy_numbers(["PROF0001", "PROF0002"]))
+                == 2
+            )
+        with query_budget(1, max_repeats=1):
+            page = repository.list_policies_page(PolicyFilter(), limit=5)
+        assert len(page.items) == 5
+
+    def test_budget_failure_names_the_repository_method(self, repository, query_budget):
+        """Test a lookup loop over budget fails and points at the repository method"""
+        with pytest.raises(pytest.fail.Exception) as failure:
+            with query_budget(10, max_repeats=2):
+                for i in range(4):
+                    repository.get_policy_by_policy_number(f"PROF{i:04d}")
+        assert "4x from SQLPolicyRepository.get_policy_by_policy_number" in str(
+            failure.value
+        )
+
+    def test_slow_and_repeated_statements_are_logged(
+        self, repository, test_engine, caplog
+    ):
+        """Test slow statements log their parameters and caller, and N+1 shapes are reported"""
+        from app.policy_management.infrastructure.query_profiler import QueryProfiler
+
+        profiler = QueryProfiler(slow_threshold=0.0, repeat_threshold=3)
+        profiler.install(test_engine)
+        try:
+            with caplog.at_level("WARNING"):
+                with profiler.profile("GET /loop"):
+                    for i in range(3):
+                        repository.get_policy_by_policy_number(f"PROF{i:04d}")
+        finally:
+            profiler.remove(test_engine)
+
+        # Transaction statements (SAVEPOINT here) are logged too when slow
+        messages = [record.getMessage() for record in caplog.records]
+        slow = [m for m in messages if m.startswith("Slow") and ": SELECT" in m]
+        assert len(slow) == 3
+        assert "from SQLPolicyRepository.get_policy_by_policy_number" in slow[0]
+        assert "'PROF0000'" in slow[0]
+
+        snapshot = profiler.snapshot()
+        assert snapshot["slow_queries"] >= 3
+        assert snapshot["repeated_statements"] == 1
+        finding = snapshot["recent_repeated"][0]
+        assert (finding["scope"], finding["count"]) == ("GET /loop", 3)
+        assert finding["caller"] == "SQLPolicyRepository.get_policy_by_policy_number"
+
+
+class TestReadinessProbe:
+    """Integration tests for the cached readiness probe"""
+
+    def test_probe_result_is_cached(self, test_engine):
+        """Test a healthy probe pings the database once per ttl"""
+        from app.policy_management.api.readiness import ReadinessProbe
+
+        probe = ReadinessProbe(test_engine, ttl=60)
+        first = probe.check()
+        assert first.ready
+        assert first.checks["database"]["status"] == "ok"
+        assert probe.check() is first
+        assert probe.probes == 1
+
+        probe.ttl = 0
+        assert probe.check() is not first
+        assert probe.probes == 2
+
+    def test_exhausted_pool_is_degraded_without_blocking(self, tmp_path):
+        """Test a pool with no free connection is reported instead of waited on"""
+        from sqlalchemy import create_engine
+
+        from app.policy_management.api.readiness import ReadinessProbe
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'ready.db'}",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=30,
+        )
+        probe = ReadinessProbe(engine, ttl=0)
+        try:
+            with engine.connect():
+                result = probe.check()
+            assert not result.ready
+            assert result.checks["pool"]["exhausted"] is True
+            assert result.checks["pool"]["capacity"] == 1
+            assert result.checks["database"]["error"] == "Connection pool exhausted"
+
+            assert probe.check().ready
+        finally:
+            engine.dispose()
+
+    def test_overdue_sweeper_is_degraded(self, test_engine):
+        """Test sweeper lag counts from start-up until the first sweep finishes"""
+        import asyncio
+        from datetime import timedelta
+
+        from app.policy_management.api.readiness import ReadinessProbe
+        from app.policy_management.infrastructure.expiry_sweeper import ExpirySweeper
+
+        sweeper = ExpirySweeper(interval=600)
+        probe = ReadinessProbe(test_engine, ttl=0, sweeper=sweeper, max_sweeper_lag=60)
+
+        def failing_session_factory():
+            raise RuntimeError("database unavailable")
+
+        async def run():
+            sweeper.start(failing_session_factory)
+            await asyncio.sleep(0.05)
+            try:
+                started = sweeper.stats.started_at
+                assert sweeper.lag_seconds(now=started + timedelta(seconds=300)) == 0
+                assert sweeper.lag_seconds(now=started + timedelta(seconds=690)) == 90
+                assert probe.check().checks["sweeper"]["status"] == "ok"
+
+                sweeper.stats.started_at = started - timedelta(seconds=700)
+                assert probe.check().checks["sweeper"]["status"] == "degraded"
+            finally:
+                await sweeper.stop()
+
+        asyncio.run(run())
+        assert sweeper.lag_seconds() is None
@@ -124,3 +124,499 @@ class TestBasicUnit:
         assert len(result) == 2
         assert result[0].policy_number.value == "POL001"
         assert result[1].policy_number.value == "POL002"
+
+
+class TestCursorEncoding:
+    """Unit tests for opaque pagination cursors"""
+
+    def test_cursor_round_trip(self):
+        """Test a keyset position survives encoding"""
+        from app.policy_management.application.pagination import (
+            encode_cursor,
+            decode_cursor,
+        )
+        from app.policy_management.domain.repository import PolicySortKey
+
+        key = ("2024-01-01T10:00:00.123456", 42)
+        cursor = encode_cursor(PolicySortKey.CREATED_AT, key)
+        assert "2024" not in cursor
+        assert decode_cursor(cursor, PolicySortKey.CREATED_AT) == key
+
+    def test_tampered_cursor_rejected(self):
+        """Test garbage cursors raise ValueError"""
+        from app.policy_management.application.pagination import decode_cursor
+        from app.policy_management.domain.repository import PolicySortKey
+
+        with pytest.raises(ValueError):
+            decode_cursor("%%%garbage", PolicySortKey.CREATED_AT)
+
+
+class TestPolicyCache:
+    """Unit tests for the read-through policy cache"""
+
+    def _policy(self, policy_number="CACHE0001", id=1):
+        return Policy(
+            policy_number=PolicyNumber(policy_number),
+            insured_name="Cache Insured",
+            premium=Money(1000.0),
+            period=Period(date(2024, 1, 1), date(2099, 12, 31)),
+            id=id,
+        )
+
+    def _repository(self, **cache_options):
+        from app.policy_management.infrastructure.policy_cache import (
+            CachedPolicyRepository,
+            PolicyCache,
+        )
+
+        mock_repo = Mock(spec=PolicyRepository)
+        return mock_repo, CachedPolicyRepository(
+            mock_repo, PolicyCache(**cache_options)
+        )
+
+    def test_hit_served_without_repository_call(self):
+        """Test repeated lookups by number and id hit the cache"""
+        mock_repo, repository = self._repository()
+        mock_repo.get_policy_by_policy_number.return_value = self._policy()
+
+        assert repository.get_policy_by_policy_number("CACHE0001").id == 1
+        assert repository.get_policy_by_policy_number("CACHE0001").id == 1
+        assert repository.get_policy_by_id(1).policy_number.value == "CACHE0001"
+        mock_repo.get_policy_by_policy_number.assert_called_once()
+        mock_repo.get_policy_by_id.assert_not_called()
+        assert repository.cache.snapshot()["hits"] == 2
+
+    def test_version_read_from_cached_policy(self):
+        """Test get_policy_version reuses a cached policy and falls back to the repository"""
+        mock_repo, repository = self._repository()
+        policy = self._policy()
+        mock_repo.get_policy_by_policy_number.return_value = policy
+        mock_repo.get_policy_version.return_value = (2, policy.updated_at)
+
+        assert repository.get_policy_version("CACHE0002") == (2, policy.updated_at)
+        repository.get_policy_by_policy_number("CACHE0001")
+        assert repository.get_policy_version("CACHE0001") == (1, policy.updated_at)
+        mock_repo.get_policy_version.assert_called_once_with("CACHE0002")
+
+    def test_cached_policy_is_a_copy(self):
+        """Test mutating a returned policy does not corrupt the cache"""
+        mock_repo, repository = self._repository()
+        mock_repo.get_policy_by_policy_number.return_value = self._policy()
+
+        repository.get_policy_by_policy_number("CACHE0001").activate()
+        cached = repository.get_policy_by_policy_number("CACHE0001")
+        assert cached.status == PolicyStatus.PENDING
+
+    def test_negative_lookup_cached_until_created(self):
+        """Test misses are cached and cleared by add_policy"""
+        mock_repo, repository = self._repository()
+        mock_repo.get_policy_by_policy_number.return_value = None
+
+        assert repository.get_policy_by_policy_number("CACHE0001") is None
+        assert repository.get_policy_by_policy_number("CACHE0001") is None
+        mock_repo.get_policy_by_policy_number.assert_called_once()
+
+        mock_repo.add_policy.return_value = self._policy()
+        repository.add_policy(self._policy(id=None))
+        mock_repo.get_policy_by_policy_number.return_value = self._policy()
+        assert repository.get_policy_by_policy_number("CACHE0001").id == 1
+
+    def test_update_invalidates(self):
+        """Test update_policy drops both cache keys"""
+        mock_repo, repository = self._repository()
+        policy = self._policy()
+        mock_repo.get_policy_by_policy_number.return_value = policy
+        mock_repo.update_policy.return_value = policy
+
+        repository.get_policy_by_policy_number("CACHE0001")
+        repository.update_policy(policy)
+        repository.get_policy_by_policy_number("CACHE0001")
+        assert mock_repo.get_policy_by_policy_number.call_count == 2
+        assert repository.cache.snapshot()["entries"] == 2
+
+    def test_fill_racing_a_write_is_dropped(self):
+        """Test a row loaded before a concurrent write is not cached after its invalidation"""
+        mock_repo, repository = self._repository()
+        stale = self._policy()
+        fresh = self._policy()
+        fresh.activate()
+        mock_repo.update_policy.return_value = fresh
+
+        def load_then_concurrent_write(policy_number):
+            # The reader has its row; a writer commits and invalidates before the fill
+            repository.update_policy(fresh)
+            return stale
+
+        mock_repo.get_policy_by_policy_number.side_effect = load_then_concurrent_write
+        assert (
+            repository.get_policy_by_policy_number("CACHE0001").status
+            == PolicyStatus.PENDING
+        )
+        assert repository.cache.snapshot()["entries"] == 0
+        assert repository.cache.snapshot()["stale_fills"] == 1
+
+        mock_repo.get_policy_by_policy_number.side_effect = None
+        mock_repo.get_policy_by_policy_number.return_value = fresh
+        assert (
+            repository.get_policy_by_policy_number("CACHE0001").status
+            == PolicyStatus.ACTIVE
+        )
+        assert (
+            repository.get_policy_by_policy_number("CACHE0001").status
+            == PolicyStatus.ACTIVE
+        )
+        assert mock_repo.get_policy_by_policy_number.call_count == 2
+
+    def test_fill_guard_stays_bounded(self):
+        """Test forgotten invalidations and clear() still fail older fills"""
+        from app.policy_management.infrastructure.policy_cache import PolicyCache
+
+        cache = PolicyCache(max_entries=2)
+        generation = cache.generation()
+        for i in range(5):
+            cache.invalidate(f"OTHER{i:04d}", 100 + i)
+        assert len(cache._invalidated) == 2
+        cache.put(("number", "CACHE0001"), self._policy(), generation)
+        assert cache.snapshot()["entries"] == 0
+
+        generation = cache.generation()
+        cache.clear()
+        cache.put(("number", "CACHE0001"), self._policy(), generation)
+        assert cache.snapshot()["entries"] == 0
+        cache.put(("number", "CACHE0001"), self._policy(), cache.generation())
+        assert cache.snapshot()["entries"] == 2
+
+    def test_lru_eviction_and_ttl(self):
+        """Test the cache is bounded and entries expire"""
+        mock_repo, repository = self._repository(max_entries=2)
+        mock_repo.get_policy_by_policy_number.side_effect = lambda number: self._policy(
+            number, id=int(number[-4:])
+        )
+        repository.get_policy_by_policy_number("CACHE0001")
+        repository.get_policy_by_policy_number("CACHE0002")
+        assert repository.cache.snapshot()["entries"] == 2
+        assert repository.cache.snapshot()["evictions"] == 2
+
+        mock_repo, repository = self._repository(ttl=0)
+        mock_repo.get_policy_by_policy_number.return_value = self._policy()
+        repository.get_policy_by_policy_number("CACHE0001")
+        repository.get_policy_by_policy_number("CACHE0001")
+        assert mock_repo.get_policy_by_policy_number.call_count == 2
+
+
+class TestPolicySerializer:
+    """Unit tests for the fast policy serializer"""
+
+    def _policy(self, amount, currency="GBP"):
+        return Policy(
+            policy_number=PolicyNumber("SERIAL001"),
+            insured_name="Serial Insured",
+            premium=Money(amount, currency),
+            period=Period(date(2024, 3, 5), date(2025, 3, 4)),
+            status=PolicyStatus.ACTIVE,
+            policy_type=PolicyType.MARINE,
+            id=7,
+        )
+
+    def test_display_formatting(self):
+        """Test premiums, dates and status labels keep the mapper's formatting"""
+        from app.policy_management.application.serializers import policy_to_dict
+
+        assert policy_to_dict(self._policy(12500.75)) == {
+            "id": 7,
+            "policy_number": "SERIAL001",
+            "insured_name": "Serial Insured",
+            "premium": "£12,500",
+            "status": "Active",
+            "policy_type": "Marine",
+            "start_date": "05/03/2024",
+            "end_date": "04/03/2025",
+        }
+        assert (
+            policy_to_dict(self._policy(Decimal("1500.00"), "USD"))["premium"]
+            == "$1,500"
+        )
+        assert (
+            policy_to_dict(self._policy(Decimal("99.5"), "EUR"))["premium"] == "€99.50"
+        )
+        assert policy_to_dict(self._policy(Decimal("10"), "CHF"))["premium"] == "CHF10"
+
+    def test_orjson_rendering(self):
+        """Test responses render compact UTF-8 JSON and fall back for Decimal"""
+        from app.policy_management.api.responses import dump_json
+
+        assert dump_json({"premium": "£1", "amount": Decimal("2.5")}) == (
+            '{"premium":"£1","amount":2.5}'.encode()
+        )
+
+
+class TestCompactEntities:
+    """Unit tests for slotted entities and trusted value object constructors"""
+
+    def test_trusted_constructors_match_validated(self):
+        """Test trusted value objects equal validated ones but skip validation"""
+        assert Money.trusted(100.0, "USD") == Money(100.0, "USD")
+        assert PolicyNumber.trusted("TRUST0001") == PolicyNumber("TRUST0001")
+        period = Period.trusted(date(2024, 1, 1), date(2024, 12, 31))
+        assert period == Period(date(2024, 1, 1), date(2024, 12, 31))
+        assert hash(period) == hash(Period(date(2024, 1, 1), date(2024, 12, 31)))
+
+        # Stored values are trusted as-is
+        assert Money.trusted(-1.0, "GBP").amount == -1.0
+        with pytest.raises(AttributeError):
+            Money.trusted(1.0, "GBP").amount = 2.0
+
+    def test_entities_are_slotted(self):
+        """Test entities and value objects carry no per-instance __dict__"""
+        policy = Policy(
+            policy_number=PolicyNumber("SLOTS0001"),
+            insured_name="Slotted",
+            premium=Money(10.0),
+            period=Period(date(2024, 1, 1), date(2024, 12, 31)),
+        )
+        for value in (policy, policy.policy_number, policy.premium, policy.period):
+            assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            policy.unknown_attribute = 1
+
+
+class TestSyntheticGenerator:
+    """Unit tests for the reproducible synthetic policy generator"""
+
+    @pytest.fixture
+    def refs(self):
+        from app.policy_management.infrastructure.reference_data import ReferenceData
+
+        return ReferenceData(
+            status_ids={status.value: i for i, status in enumerate(PolicyStatus, 1)},
+            type_ids={
+                policy_type.value: i for i, policy_type in enumerate(PolicyType, 1)
+            },
+        )
+
+    def test_blocks_are_reproducible(self, refs):
+        """Test a seed always yields the same rows, and a different seed does not"""
+        from app.policy_management.infrastructure.synthetic_data import (
+            BLOCK_SIZE,
+            GeneratorConfig,
+            generate_block,
+            generate_policies,
+        )
+
+        config = GeneratorConfig(count=BLOCK_SIZE + 5, start_center=date(2024, 6, 1))
+        blocks = list(generate_policies(config, refs))
+        assert [len(block) for block in blocks] == [BLOCK_SIZE, 5]
+        assert blocks[1] == generate_block(config, refs, 1)
+        assert blocks[1][0]["policy_number"] == f"SYN{BLOCK_SIZE:09d}"
+
+        reseeded = GeneratorConfig(count=5, seed=7, start_center=date(2024, 6, 1))
+        assert generate_block(reseeded, refs, 0) != blocks[0][:5]
+
+    def test_rows_follow_the_configured_mix(self, refs):
+        """Test zero-weight options never appear and periods stay valid"""
+        from app.policy_management.infrastructure.synthetic_data import (
+            GeneratorConfig,
+            generate_block,
+            parse_mix,
+        )
+
+        config = GeneratorConfig(
+            count=2000,
+            status_mix=parse_mix("active=3,cancelled=1", PolicyStatus),
+            currency_mix={"USD": 1.0, "EUR": 0.0},
+        )
+        rows = generate_block(config, refs, 0)
+        assert {row["status_id"] for row in rows} == {
+            refs.status_id("active"),
+            refs.status_id("cancelled"),
+        }
+        assert {row["premium_currency"] for row in rows} == {"USD"}
+        assert all(row["period_end_date"] > row["period_start_date"] for row in rows)
+        assert all(row["premium_amount"] > 0 for row in rows)
+
+        with pytest.raises(ValueError):
+            GeneratorConfig(count=1, currency_mix={"GBP": 0.0})
+
+
+class TestMetrics:
+    """Unit tests for the Prometheus registry and metrics middleware"""
+
+    def test_histogram_rendering(self):
+        """Test histograms render cumulative buckets, sum and count with escaped labels"""
+        from app.policy_management.api.metrics import Histogram, MetricsRegistry
+
+        registry = MetricsRegistry()
+        histogram = registry.register(
+            Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        )
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(('/say "hi"',), value)
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == [
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+        ]
+        assert lines[2:] == [
+            'latency_seconds_bucket{route="/say \\"hi\\"",le="0.1"} 1',
+            'latency_seconds_bucket{route="/say \\"hi\\"",le="1.0"} 2',
+            'latency_seconds_bucket{route="/say \\"hi\\"",le="+Inf"} 3',
+            'latency_seconds_sum{route="/say \\"hi\\""} 5.55',
+            'latency_seconds_count{route="/say \\"hi\\""} 3',
+        ]
+
+    def test_middleware_overhead_within_budget(self):
+        """Test the middleware adds less than its stated per-request budget"""
+        import asyncio
+        import time
+        from app.policy_management.api.metrics import (
+            REQUEST_OVERHEAD_BUDGET_SECONDS,
+            HttpMetrics,
+            MetricsMiddleware,
+        )
+
+        async def endpoint(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            pass
+
+        async def per_request(app, requests=5000):
+            started = time.perf_counter()
+            for _ in range(requests):
+                await app({"type": "http", "method": "GET"}, receive, send)
+            return (time.perf_counter() - started) / requests
+
+        metrics = HttpMetrics()
+        instrumented = MetricsMiddleware(endpoint, metrics)
+        overhead = min(
+            asyncio.run(per_request(instrumented)) - asyncio.run(per_request(endpoint))
+            for _ in range(3)
+        )
+        assert overhead < REQUEST_OVERHEAD_BUDGET_SECONDS
+        assert metrics.requests.value(("GET", "<unmatched>", "200")) == 15000
+
+
+class TestStatementShapes:
+    """Unit tests for SQL statement normalization used by the N+1 detector"""
+
+    def test_literals_and_in_lists_share_a_shape(self):
+        """Test statements differing only in literals or IN list length match"""
+        from app.policy_management.infrastructure.query_profiler import (
+            is_transaction_statement,
+            statement_shape,
+        )
+
+        first = statement_shape(
+            "SELECT * FROM policies\n WHERE id IN (?, ?, ?) AND x = 'a'"
+        )
+        second = statement_shape(
+            "SELECT * FROM policies WHERE id IN (?) AND x = 'it''s'"
+        )
+        assert first == second == "SELECT * FROM policies WHERE id IN (...) AND x = ?"
+        assert (
+            statement_shape("SELECT 1 FROM t2 LIMIT 10") == "SELECT ? FROM t2 LIMIT ?"
+        )
+        assert is_transaction_statement("SAVEPOINT sa_savepoint_1")
+        assert not is_transaction_statement("SELECT 1")
+
+
+class TestStaticAssets:
+    """Unit tests for static asset fingerprinting and encoding negotiation"""
+
+    def test_manifest_fingerprints_and_compresses(self, tmp_path):
+        """Test names carry a content hash and only worthwhile variants are kept"""
+        from app.policy_management.api.static_assets import AssetManifest
+
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "site.css").write_text("body { color: red; }\n" * 200)
+        (tmp_path / "tiny.js").write_text("x")
+
+        manifest = AssetManifest.build(tmp_path)
+        url = manifest.url("css/site.css")
+        assert url.startswith("/static/css/site.") and url.endswith(".css")
+        assert manifest.lookup(url[len("/static/") :])[1].endswith("immutable")
+        assert manifest.lookup("css/site.css")[1] == "no-cache"
+        assert "gzip" in manifest.assets["css/site.css"].variants
+        assert manifest.assets["tiny.js"].variants == {}
+
+        (tmp_path / "tiny.js").write_text("y")
+        assert AssetManifest.build(tmp_path).url("tiny.js") != manifest.url("tiny.js")
+
+    def test_accept_encoding_negotiation(self, tmp_path):
+        """Test q=0 refuses a coding and identity is served when nothing matches"""
+        from app.policy_management.api.static_assets import ENCODINGS, AssetManifest
+
+        (tmp_path / "app.js").write_text("console.log('policy');\n" * 100)
+        asset = AssetManifest.build(tmp_path).assets["app.js"]
+
+        assert asset.select("br;q=0, gzip")[0] == "gzip"
+        assert asset.select("") == (None, asset.content)
+        assert asset.select("*")[0] == ENCODINGS[0]
+
+
+class TestContentNegotiation:
+    """Unit tests for Accept negotiation and the columnar policy form"""
+
+    def test_quality_values(self):
+        """Test q-values parse as numbers, so any spelling of zero refuses a token"""
+        from app.policy_management.api.negotiation import (
+            accepts_encoding,
+            quality_values,
+        )
+
+        assert quality_values("gzip;q=0.5, BR;q=0, deflate, x;q=oops") == {
+            "gzip": 0.5,
+            "br": 0.0,
+            "deflate": 1.0,
+            "x": 0.0,
+        }
+        assert not accepts_encoding("gzip;q=0.00", "gzip")
+        assert not accepts_encoding("gzip ; q=0, *", "gzip")
+        assert accepts_encoding("identity;q=0.5, *;q=0.1", "gzip")
+        assert not accepts_encoding("identity", "gzip")
+        assert not accepts_encoding("", "gzip")
+
+    def test_negotiate_accept_header(self):
+        """Test quality values, wildcards and unacceptable headers"""
+        from app.policy_management.api.representations import (
+            COLUMNAR,
+            JSON,
+            negotiate,
+        )
+
+        assert negotiate(None) == JSON
+        assert negotiate("*/*") == JSON
+        assert negotiate(f"{JSON};q=0.5, {COLUMNAR}") == COLUMNAR
+        assert negotiate(f"{COLUMNAR}, {JSON}") == JSON
+        assert negotiate("text/csv") is None
+        assert negotiate(f"application/*, {JSON};q=0") == COLUMNAR
+
+    def test_columns_match_dicts(self):
+        """Test the columnar form carries exactly the fields and values of the JSON form"""
+        from app.policy_management.application.serializers import (
+            POLICY_FIELDS,
+            policies_to_columns,
+            policies_to_dicts,
+        )
+
+        policies = [
+            Policy(
+                policy_number=PolicyNumber(f"COLUMN{i:03d}"),
+                insured_name=f"Columnar Insured {i}",
+                premium=Money(1000.5 * (i + 1), "EUR"),
+                period=Period(date(2024, 1, 1), date(2025, 1, 1)),
+                status=PolicyStatus.ACTIVE,
+                policy_type=PolicyType.CASUALTY,
+                id=i + 1,
+            )
+            for i in range(3)
+        ]
+        dicts = policies_to_dicts(policies)
+        columns = policies_to_columns(policies)
+        assert tuple(dicts[0]) == POLICY_FIELDS
+        assert [dict(zip(columns["fields"], row)) for row in columns["rows"]] == dicts
@@ -5,6 +5,13 @@ for TMHCC Policy Management System
 
 This script performs end-to-end testing of all major system components
 and provides a detailed report of system health.
+
+With --async the checks for each --url run concurrently over one pooled
+httpx.AsyncClient (the CRUD steps stay in order), every URL is checked in the
+same run, and the whole run is bounded by --deadline seconds:
+
+    python scripts/automated_health_check.py --async --deadline 20 \
+        --url http://app-1:8000 --url http://app-2:8000 --report gate.json
 """
 
 import sys
@@ -12,11 +19,72 @@ import os
 
 # Add the app directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
 
+import asyncio
+import httpx
 import requests
 import time
 import json
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+
+import load_generator
+
+
+def test_period():
+    """A one-year period starting today, so the test policy is never already expired"""
+    start = date.today()
+    return start.isoformat(), (start + timedelta(days=365)).isoformat()
+
+
+class ListingSearch:
+    """Pages through the policy listing until the test policy turns up
+
+    The listing is paginated oldest first, so on a real-sized book the new
+    policy is on a later page. Both checkers request self.params and pass
+    each response to feed() until it returns True, then log outcome().
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, policy_data):
+        self.policy_number = policy_data["policy_number"]
+        # Narrow the listing to policies like the test one, so few pages are read
+        self.params = {
+            "status": policy_data["status"],
+            "policy_type": policy_data["policy_type"],
+            "currency": policy_data["premium_currency"],
+            "limit": self.PAGE_SIZE,
+        }
+        self.seen = 0
+        self.found = False
+        self.error = None
+
+    def feed(self, response):
+        """Take one page; True once the search is over"""
+        if response.status_code != 200:
+            self.error = f"Listing failed: HTTP {response.status_code}"
+            return True
+        policy_numbers = [p["policy_number"] for p in response.json()]
+        self.seen += len(policy_numbers)
+        if self.policy_number in policy_numbers:
+            self.found = True
+            return True
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return True
+        self.params = {**self.params, "cursor": cursor}
+        return False
+
+    def outcome(self):
+        """(status, message) for the Policy Listing result"""
+        if self.error:
+            return "FAIL", self.error
+        if not self.found:
+            return "FAIL", "New policy not in list"
+        return "PASS", f"Found new policy among {self.seen} policies"
+
 
 class SystemHealthChecker:
     def __init__(self, base_url="http://localhost:8000"):
@@ -28,7 +96,7 @@ class SystemHealthChecker:
             "overall_status": "UNKNOWN"
         }
     
-    def log_result(self, service, status, message, details=None):
+    def log_result(self, service, status, message, details=None, seconds=None):
         """Log test results with consistent formatting"""
         self.results["services"][service] = {
             "status": status,
@@ -36,6 +104,8 @@ class SystemHealthChecker:
             "details": details,
             "timestamp": datetime.now().isoformat()
         }
+        if seconds is not None:
+            self.results["services"][service]["duration_ms"] = round(seconds * 1000, 1)
         icon = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
         print(f"{icon} {service}: {message}")
         if details:
@@ -73,17 +143,18 @@ class SystemHealthChecker:
     
     def test_policy_crud_operations(self):
         """Test complete CRUD operations for policies"""
-        test_policy_number = f"AUTO_TEST_{int(time.time())}"
+        test_policy_number = f"AUTOTEST{int(time.time())}"
         
         # Test Policy Creation
         try:
+            start_date, end_date = test_period()
             policy_data = {
                 "policy_number": test_policy_number,
                 "insured_name": "Automated Test User",
                 "premium_amount": 999.99,
                 "premium_currency": "GBP",
-                "period_start_date": "2024-01-01",
-                "period_end_date": "2026-12-31",
+                "period_start_date": start_date,
+                "period_end_date": end_date,
                 "status": "pending",
                 "policy_type": "Property"
             }
@@ -121,17 +192,14 @@ class SystemHealthChecker:
         
         # Test Policy Listing
         try:
-            response = requests.get(f"{self.api_url}/policies/", timeout=10)
-            if response.status_code == 200:
-                policies = response.json()
-                policy_numbers = [p["policy_number"] for p in policies]
-                if test_policy_number in policy_numbers:
-                    self.log_result("Policy Listing", "PASS", f"Found {len(policies)} policies")
-                else:
-                    self.log_result("Policy Listing", "FAIL", "New policy not in list")
-                    return False
-            else:
-                self.log_result("Policy Listing", "FAIL", f"Listing failed: HTTP {response.status_code}")
+            search = ListingSearch(policy_data)
+            while not search.feed(
+                requests.get(f"{self.api_url}/policies/", params=search.params, timeout=10)
+            ):
+                pass
+            status, message = search.outcome()
+            self.log_result("Policy Listing", status, message)
+            if status != "PASS":
                 return False
         except Exception as e:
             self.log_result("Policy Listing", "FAIL", f"Listing error: {str(e)}")
@@ -201,6 +269,25 @@ class SystemHealthChecker:
             except Exception as e:
                 self.log_result(f"Performance {endpoint}", "FAIL", f"Performance test failed: {str(e)}")
     
+    def run_load_test(self, config, app=None, max_error_rate=0.01, max_p95_ms=500):
+        """Run the concurrent load generator and judge its error rate and p95 latency"""
+        try:
+            report = asyncio.run(load_generator.run_load_test(config, base_url=self.base_url, app=app))
+        except Exception as e:
+            self.log_result("Load Test", "FAIL", f"Load test failed: {str(e)}")
+            return None
+
+        self.results["load_test"] = report
+        summary = (f"{report['throughput_rps']} req/s, p95 {report['latency']['p95_ms']}ms, "
+                   f"error rate {report['error_rate']:.2%}")
+        if report["error_rate"] > max_error_rate:
+            self.log_result("Load Test", "FAIL", summary)
+        elif report["latency"]["p95_ms"] > max_p95_ms:
+            self.log_result("Load Test", "WARN", summary)
+        else:
+            self.log_result("Load Test", "PASS", summary)
+        return report
+    
     def generate_report(self):
         """Generate comprehensive health report"""
         passed = sum(1 for service in self.results["services"].values() if service["status"] == "PASS")
@@ -253,19 +340,309 @@ class SystemHealthChecker:
         
         return report["overall_status"] == "HEALTHY"
 
+def describe(error):
+    """Exception text, falling back to its type (httpx timeouts have no message)"""
+    return str(error) or type(error).__name__
+
+
+class AsyncSystemHealthChecker(SystemHealthChecker):
+    """The same checks run concurrently over a shared httpx.AsyncClient
+
+    Independent checks run at once; the CRUD steps run in order because each
+    depends on the policy created by the first. Every result records how long
+    its requests took.
+    """
+
+    def __init__(self, client, base_url="http://localhost:8000", prefix=""):
+        super().__init__(base_url=base_url.rstrip("/"))
+        self.client = client
+        self.prefix = prefix
+
+    def log_result(self, service, status, message, details=None, seconds=None):
+        super().log_result(service, status, f"{self.prefix}{message}", details, seconds)
+        self.results["services"][service]["message"] = message
+
+    async def _get(self, url, **kwargs):
+        started = time.perf_counter()
+        response = await self.client.get(url, **kwargs)
+        return response, time.perf_counter() - started
+
+    async def _post(self, url, **kwargs):
+        started = time.perf_counter()
+        response = await self.client.post(url, **kwargs)
+        return response, time.perf_counter() - started
+
+    async def check_api_health(self):
+        """Test basic API health endpoint"""
+        try:
+            response, seconds = await self._get(f"{self.base_url}/health")
+            if response.status_code == 200:
+                self.log_result("API Health", "PASS", "API is healthy", response.json(), seconds)
+                return True
+            self.log_result("API Health", "FAIL", f"HTTP {response.status_code}", seconds=seconds)
+        except Exception as e:
+            self.log_result("API Health", "FAIL", f"Connection failed: {describe(e)}")
+        return False
+
+    async def check_database_connection(self):
+        """Test database connectivity through API"""
+        try:
+            response, seconds = await self._get(f"{self.api_url}/policies/")
+            if response.status_code == 200:
+                self.log_result("Database", "PASS", "Database connection successful",
+                                seconds=seconds)
+                return True
+            self.log_result("Database", "FAIL", f"Database error: HTTP {response.status_code}",
+                            seconds=seconds)
+        except Exception as e:
+            self.log_result("Database", "FAIL", f"Database connection failed: {describe(e)}")
+        return False
+
+    async def test_policy_crud_operations(self):
+        """Test create, retrieve, list and activate, in that order"""
+        test_policy_number = f"AUTOTEST{time.time_ns()}"
+        start_date, end_date = test_period()
+        policy_data = {
+            "policy_number": test_policy_number,
+            "insured_name": "Automated Test User",
+            "premium_amount": 999.99,
+            "premium_currency": "GBP",
+            "period_start_date": start_date,
+            "period_end_date": end_date,
+            "status": "pending",
+            "policy_type": "Property"
+        }
+
+        try:
+            response, seconds = await self._post(f"{self.api_url}/policies/", json=policy_data)
+            if response.status_code not in [200, 201]:
+                self.log_result("Policy Creation", "FAIL",
+                                f"Creation failed: HTTP {response.status_code}", seconds=seconds)
+                return False
+            self.log_result("Policy Creation", "PASS", "Policy created successfully",
+                            {"policy_number": test_policy_number}, seconds)
+        except Exception as e:
+            self.log_result("Policy Creation", "FAIL", f"Creation error: {describe(e)}")
+            return False
+
+        try:
+            response, seconds = await self._get(f"{self.api_url}/policies/{test_policy_number}")
+            if response.status_code != 200:
+                self.log_result("Policy Retrieval", "FAIL",
+                                f"Retrieval failed: HTTP {response.status_code}", seconds=seconds)
+                return False
+            if response.json()["policy_number"] != test_policy_number:
+                self.log_result("Policy Retrieval", "FAIL", "Policy data mismatch", seconds=seconds)
+                return False
+            self.log_result("Policy Retrieval", "PASS", "Policy retrieved successfully",
+                            seconds=seconds)
+        except Exception as e:
+            self.log_result("Policy Retrieval", "FAIL", f"Retrieval error: {describe(e)}")
+            return False
+
+        try:
+            search = ListingSearch(policy_data)
+            seconds = 0.0
+            done = False
+            while not done:
+                response, elapsed = await self._get(
+                    f"{self.api_url}/policies/", params=search.params
+                )
+                seconds += elapsed
+                done = search.feed(response)
+            status, message = search.outcome()
+            self.log_result("Policy Listing", status, message, seconds=seconds)
+            if status != "PASS":
+                return False
+        except Exception as e:
+            self.log_result("Policy Listing", "FAIL", f"Listing error: {describe(e)}")
+            return False
+
+        try:
+            response, seconds = await self._post(
+                f"{self.api_url}/policies/{test_policy_number}/activate"
+            )
+            # This might fail if period is not active, which is OK for this test
+            if response.status_code in [200, 400]:
+                self.log_result("Policy Activation", "PASS", "Activation endpoint responsive",
+                                seconds=seconds)
+            else:
+                self.log_result("Policy Activation", "FAIL",
+                                f"Activation failed: HTTP {response.status_code}", seconds=seconds)
+        except Exception as e:
+            self.log_result("Policy Activation", "FAIL", f"Activation error: {describe(e)}")
+
+        return True
+
+    async def test_frontend_endpoints(self):
+        """Test frontend routes are accessible"""
+        try:
+            response, seconds = await self._get(f"{self.base_url}/")
+            if response.status_code == 200:
+                self.log_result("Frontend Policies List", "PASS", "Page loaded successfully",
+                                seconds=seconds)
+            else:
+                self.log_result("Frontend Policies List", "FAIL",
+                                f"HTTP {response.status_code}", seconds=seconds)
+        except Exception as e:
+            self.log_result("Frontend Policies List", "FAIL", f"Load failed: {describe(e)}")
+
+    async def test_error_handling(self):
+        """Test that error cases are handled properly"""
+        try:
+            response, seconds = await self._get(f"{self.api_url}/policies/NON_EXISTENT_12345")
+            if response.status_code == 404:
+                self.log_result("Error Handling", "PASS", "404 handled correctly", seconds=seconds)
+            else:
+                self.log_result("Error Handling", "FAIL",
+                                f"Expected 404, got {response.status_code}", seconds=seconds)
+        except Exception as e:
+            self.log_result("Error Handling", "FAIL", f"Error test failed: {describe(e)}")
+
+    async def check_performance(self, endpoint):
+        """Time one GET against the 2 second threshold"""
+        try:
+            response, seconds = await self._get(endpoint)
+            if seconds < 2.0:
+                self.log_result(f"Performance {endpoint}", "PASS",
+                                f"Response time: {seconds:.2f}s", seconds=seconds)
+            else:
+                self.log_result(f"Performance {endpoint}", "WARN",
+                                f"Slow response: {seconds:.2f}s", seconds=seconds)
+        except Exception as e:
+            self.log_result(f"Performance {endpoint}", "FAIL",
+                            f"Performance test failed: {describe(e)}")
+
+    def checks(self):
+        """Coroutines for the independent checks, keyed by the services they report"""
+        return {
+            ("API Health",): self.check_api_health(),
+            ("Database",): self.check_database_connection(),
+            ("Policy Creation", "Policy Retrieval", "Policy Listing", "Policy Activation"):
+                self.test_policy_crud_operations(),
+            ("Frontend Policies List",): self.test_frontend_endpoints(),
+            ("Error Handling",): self.test_error_handling(),
+            **{
+                (f"Performance {endpoint}",): self.check_performance(endpoint)
+                for endpoint in (f"{self.api_url}/policies/", f"{self.base_url}/health")
+            },
+        }
+
+    async def run_checks(self, deadline):
+        """Run every check concurrently until the monotonic deadline
+
+        Checks still running at the deadline are cancelled and their services
+        that have not reported yet are marked FAIL. check_timings_ms records
+        when each check finished, keyed by its first service.
+        """
+        started = time.perf_counter()
+        timings = self.results["check_timings_ms"] = {}
+
+        async def timed(name, coroutine):
+            try:
+                return await coroutine
+            finally:
+                timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+        tasks = {asyncio.ensure_future(timed(services[0], coroutine)): services
+                 for services, coroutine in self.checks().items()}
+        _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+        for task in pending:
+            task.cancel()
+            for service in tasks[task]:
+                if service not in self.results["services"]:
+                    self.log_result(service, "FAIL", "Deadline exceeded")
+        if pending:
+            await asyncio.wait(pending)
+        self.results["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return self.generate_report()
+
+
+async def run_async_checks(base_urls, deadline_seconds=30.0, timeout=10.0, client=None):
+    """Check every base URL concurrently within one global deadline
+
+    Returns a report with each target's results and an overall status that is
+    HEALTHY only when every target is.
+    """
+    started = time.perf_counter()
+    deadline = time.monotonic() + deadline_seconds
+    base_urls = [url.rstrip("/") for url in base_urls]
+    owns_client = client is None
+    if owns_client:
+        limits = httpx.Limits(max_connections=20 * len(base_urls), max_keepalive_connections=20)
+        client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    try:
+        checkers = [
+            AsyncSystemHealthChecker(client, base_url=url,
+                                     prefix=f"[{url}] " if len(base_urls) > 1 else "")
+            for url in base_urls
+        ]
+        reports = await asyncio.gather(*(checker.run_checks(deadline) for checker in checkers))
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    statuses = [report["overall_status"] for report in reports]
+    if all(status == "HEALTHY" for status in statuses):
+        overall = "HEALTHY"
+    elif "UNHEALTHY" in statuses:
+        overall = "UNHEALTHY"
+    else:
+        overall = "DEGRADED"
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "deadline_seconds": deadline_seconds,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "overall_status": overall,
+        "targets": dict(zip(base_urls, reports)),
+    }
+
+
 def main():
     """Main execution function"""
     import argparse
     
     parser = argparse.ArgumentParser(description='TMHCC Policy Management Health Check')
-    parser.add_argument('--url', default='http://localhost:8000', 
-                       help='Base URL of the application')
+    parser.add_argument('--url', action='append',
+                       help='Base URL of the application (repeatable with --async)')
     parser.add_argument('--timeout', type=int, default=10,
                        help='Request timeout in seconds')
+    parser.add_argument('--async', dest='run_async', action='store_true',
+                       help='Run the checks concurrently, for every --url')
+    parser.add_argument('--deadline', type=float, default=30.0,
+                       help='Overall time limit in seconds for --async')
+    parser.add_argument('--report',
+                       help='Where --async writes its JSON report ("-" for stdout)')
+    parser.add_argument('--load', action='store_true',
+                       help='Run the concurrent load test instead of the checks')
+    load_generator.add_arguments(parser)
     
     args = parser.parse_args()
+    urls = args.url or ['http://localhost:8000']
+    if len(urls) > 1 and not args.run_async:
+        parser.error('several --url targets are only checked with --async')
+    
+    if args.run_async:
+        report = asyncio.run(run_async_checks(urls, args.deadline, args.timeout))
+        print(f"\nOverall Status: {report['overall_status']} "
+              f"({len(urls)} target(s) in {report['elapsed_seconds']:.2f}s)")
+        report_file = args.report or (
+            f"scripts/reports/health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        if report_file == '-':
+            print(json.dumps(report, indent=2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"📄 Detailed report saved to: {report_file}")
+        sys.exit(0 if report["overall_status"] == "HEALTHY" else 1)
     
-    checker = SystemHealthChecker(base_url=args.url)
+    checker = SystemHealthChecker(base_url=urls[0])
+    if args.load:
+        with load_generator.in_process_app() if args.in_process else nullcontext() as app:
+            report = checker.run_load_test(load_generator.config_from_args(args), app=app)
+        if report is not None:
+            print(json.dumps(report, indent=2))
+        sys.exit(0 if checker.results["services"]["Load Test"]["status"] == "PASS" else 1)
     success = checker.run_complete_check()
     
     # Exit with appropriate code
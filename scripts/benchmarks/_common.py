@@ -0,0 +1,111 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Builds throwaway SQLite policy books of a given size so each benchmark can
+run without touching the application database.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.policy_management.infrastructure.db import Base
+from app.policy_management.infrastructure.models import (
+    PolicyModel,
+    PolicyStatusModel,
+    PolicyTypeModel,
+)
+from app.policy_management.infrastructure.seed_data import seed_statuses_and_types
+from app.policy_management.infrastructure.synthetic_data import (
+    NAME_PREFIXES,
+    NAME_SUFFIXES,
+    NAME_TRADES,
+)
+
+
+def insured_name(i):
+    """Deterministic, varied company name for synthetic policy i"""
+    return (
+        f"{NAME_PREFIXES[i % len(NAME_PREFIXES)]} "
+        f"{NAME_TRADES[(i // 7) % len(NAME_TRADES)]} "
+        f"{NAME_SUFFIXES[(i // 11) % len(NAME_SUFFIXES)]} {i % 997}"
+    )
+
+
+def create_book(count, path=None):
+    """Create a SQLite database holding `count` synthetic policies
+
+    Returns (engine, SessionFactory). When no path is given a temporary file
+    is used so the server-side cursor behaves like a real deployment.
+    """
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix=".db", prefix="bench_")
+        os.close(fd)
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with Session() as session:
+        seed_statuses_and_types(session)
+        status_ids = [row.id for row in session.query(PolicyStatusModel).all()]
+        type_ids = [row.id for row in session.query(PolicyTypeModel).all()]
+
+    start = date(2024, 1, 1)
+    chunk = []
+    with engine.begin() as connection:
+        for i in range(count):
+            period_start = start + timedelta(days=i % 365)
+            chunk.append(
+                {
+                    "policy_number": f"BENCH{i:09d}",
+                    "insured_name": insured_name(i),
+                    "premium_amount": 500.0 + (i % 997) * 25.5,
+                    "premium_currency": ("GBP", "USD", "EUR")[i % 3],
+                    "period_start_date": period_start,
+                    "period_end_date": period_start + timedelta(days=365),
+                    "status_id": status_ids[i % len(status_ids)],
+                    "type_id": type_ids[i % len(type_ids)],
+                }
+            )
+            if len(chunk) == 10_000:
+                connection.execute(insert(PolicyModel), chunk)
+                chunk = []
+        if chunk:
+            connection.execute(insert(PolicyModel), chunk)
+
+    return engine, Session
+
+
+def drop_book(engine):
+    """Dispose of a book created by create_book and delete its file"""
+    path = engine.url.database
+    engine.dispose()
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def make_client(Session):
+    """TestClient for the app with its DB dependency bound to Session"""
+    from starlette.testclient import TestClient
+    from app.policy_management.api.app_factory import create_app
+    from app.policy_management.infrastructure.db import get_db
+
+    app = create_app(testing=True)
+
+    def override_get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark: sync (threadpool) vs async (AsyncSession) policy routes.
+
+Seeds a temporary book, then fires GET /api/v1/policies/{policy_number} and
+GET /api/v1/policies/?limit=50 requests from N concurrent clients against the
+app in each DB mode and reports throughput and p50/p95 latency.
+
+    python scripts/benchmarks/bench_async.py --count 20000 --requests 2000 --concurrency 1 50 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from _common import create_book, drop_book
+
+from app.policy_management.api.app_factory import create_app
+from app.policy_management.api.dependencies import (
+    get_async_policy_service,
+    get_policy_service,
+)
+from app.policy_management.infrastructure.db import get_async_db, get_db
+
+
+def build_app(mode, Session, AsyncSession):
+    app = create_app(testing=True)
+    if mode == "async":
+
+        async def override_get_async_db():
+            async with AsyncSession() as session:
+                yield session
+
+        app.dependency_overrides[get_policy_service] = get_async_policy_service
+        app.dependency_overrides[get_async_db] = override_get_async_db
+    else:
+
+        def override_get_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+async def run(app, count, total_requests, concurrency):
+    latencies = []
+    queue = asyncio.Queue()
+    for i in range(total_requests):
+        if i % 2:
+            queue.put_nowait("/api/v1/policies/?limit=50")
+        else:
+            queue.put_nowait(f"/api/v1/policies/BENCH{random.randrange(count):09d}")
+
+    async def worker(client):
+        while not queue.empty():
+            url = queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_sec": round(total_requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async route benchmark")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 50, 500])
+    args = parser.parse_args()
+
+    engine, Session = create_book(args.count)
+    results = {"policies": args.count, "requests": args.requests, "runs": []}
+
+    async def run_all():
+        # One event loop for every run, since the async pool is bound to it
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{engine.url.database}")
+        AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+        for concurrency in args.concurrency:
+            for mode in ("sync", "async"):
+                app = build_app(mode, Session, AsyncSession)
+                stats = await run(app, args.count, args.requests, concurrency)
+                results["runs"].append(
+                    {"mode": mode, "concurrency": concurrency, **stats}
+                )
+        await async_engine.dispose()
+
+    asyncio.run(run_all())
+    drop_book(engine)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
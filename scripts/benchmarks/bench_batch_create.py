@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: batch policy creation vs one POST per policy.
+
+Creates the same number of policies through POST /api/v1/policies/ (one
+request each) and through POST /api/v1/policies/batch, and reports
+policies/sec for both paths.
+
+    python scripts/benchmarks/bench_batch_create.py --count 2000 --batch-size 1000
+"""
+
+import argparse
+import json
+import time
+
+from _common import create_book, drop_book, make_client
+
+
+def policy_payload(prefix, i):
+    return {
+        "policy_number": f"{prefix}{i:08d}",
+        "insured_name": f"Bordereau Insured {i}",
+        "premium_amount": 1000.0 + i,
+        "premium_currency": "GBP",
+        "period_start_date": "2025-01-01",
+        "period_end_date": "2025-12-31",
+        "status": "pending",
+        "policy_type": "Property",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch create throughput benchmark")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine, Session = create_book(0)
+    client = make_client(Session)
+
+    started = time.perf_counter()
+    for i in range(args.count):
+        response = client.post("/api/v1/policies/", json=policy_payload("SINGLE", i))
+        response.raise_for_status()
+    single_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for offset in range(0, args.count, args.batch_size):
+        batch = [
+            policy_payload("BATCH", i)
+            for i in range(offset, min(offset + args.batch_size, args.count))
+        ]
+        response = client.post("/api/v1/policies/batch", json={"policies": batch})
+        response.raise_for_status()
+        assert response.json()["failed"] == 0
+    batch_seconds = time.perf_counter() - started
+
+    drop_book(engine)
+    print(
+        json.dumps(
+            {
+                "policies": args.count,
+                "batch_size": args.batch_size,
+                "single": {
+                    "seconds": round(single_seconds, 3),
+                    "policies_per_sec": round(args.count / single_seconds, 1),
+                },
+                "batch": {
+                    "seconds": round(batch_seconds, 3),
+                    "policies_per_sec": round(args.count / batch_seconds, 1),
+                },
+                "speedup": round(single_seconds / batch_seconds, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
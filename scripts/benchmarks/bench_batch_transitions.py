@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: batch activate/cancel vs one request per policy.
+
+Builds a book of pending policies whose periods cover today, then activates
+a sample through POST /api/v1/policies/{policy_number}/activate (one request
+each) and the rest through POST /api/v1/policies/activate-batch, and finally
+cancels the whole book through /cancel-batch. Reports policies/sec per path.
+
+    python scripts/benchmarks/bench_batch_transitions.py --count 10000 --single 500
+"""
+
+import argparse
+import json
+import time
+from datetime import date
+
+from sqlalchemy import update
+
+from _common import create_book, drop_book, make_client
+
+from app.policy_management.infrastructure.models import PolicyModel, PolicyStatusModel
+
+
+def make_pending(engine, Session):
+    """Put every policy in the pending status with a period covering today"""
+    with Session() as session:
+        pending_id = (
+            session.query(PolicyStatusModel.id)
+            .filter(PolicyStatusModel.name == "pending")
+            .scalar()
+        )
+    with engine.begin() as connection:
+        connection.execute(
+            update(PolicyModel).values(
+                status_id=pending_id,
+                period_start_date=date(2024, 1, 1),
+                period_end_date=date(2099, 12, 31),
+            )
+        )
+
+
+def post_batches(client, path, policy_numbers, batch_size, **extra):
+    for offset in range(0, len(policy_numbers), batch_size):
+        batch = policy_numbers[offset : offset + batch_size]
+        response = client.post(path, json={"policy_numbers": batch, **extra})
+        response.raise_for_status()
+        assert response.json()["failed"] == 0, response.json()["results"][:3]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch state transition benchmark")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument(
+        "--single", type=int, default=500, help="policies activated one by one"
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine, Session = create_book(args.count)
+    make_pending(engine, Session)
+    client = make_client(Session)
+    policy_numbers = [f"BENCH{i:09d}" for i in range(args.count)]
+    single, batched = policy_numbers[: args.single], policy_numbers[args.single :]
+
+    started = time.perf_counter()
+    for policy_number in single:
+        client.post(f"/api/v1/policies/{policy_number}/activate").raise_for_status()
+    single_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    post_batches(client, "/api/v1/policies/activate-batch", batched, args.batch_size)
+    activate_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    post_batches(
+        client,
+        "/api/v1/policies/cancel-batch",
+        policy_numbers,
+        args.batch_size,
+        reason="Benchmark",
+    )
+    cancel_seconds = time.perf_counter() - started
+
+    drop_book(engine)
+    print(
+        json.dumps(
+            {
+                "policies": args.count,
+                "single_activate_per_sec": round(len(single) / single_seconds, 1),
+                "batch_activate_per_sec": round(len(batched) / activate_seconds, 1),
+                "batch_cancel_per_sec": round(len(policy_numbers) / cancel_seconds, 1),
+                "batch_cancel_seconds": round(cancel_seconds, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Concurrent write benchmark: default engine vs the Settings-driven engine factory.
+
+Runs writer threads creating policies alongside reader threads paging through
+the book, first against a plain create_engine() (rollback journal, default
+pool) and then against create_db_engine() (WAL, synchronous=NORMAL,
+busy_timeout, sized pool). Reports writes/sec, reads/sec and lock errors.
+
+    python scripts/benchmarks/bench_concurrent_writes.py --writers 8 --readers 8 --seconds 5
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from _common import create_book, drop_book
+
+from app.policy_management.api.config import Settings
+from app.policy_management.api.schemas import CreatePolicyDTO, PolicyFilterDTO
+from app.policy_management.application.policy_services import PolicyService
+from app.policy_management.infrastructure.db import create_db_engine
+from app.policy_management.infrastructure.policy_repository import SQLPolicyRepository
+
+
+def run(Session, writers, readers, seconds):
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def record(key):
+        with lock:
+            counts[key] += 1
+
+    def writer(worker):
+        i = 0
+        while time.perf_counter() < deadline:
+            with Session() as session:
+                service = PolicyService(SQLPolicyRepository(session))
+                try:
+                    service.create_policy(
+                        CreatePolicyDTO(
+                            policy_number=f"W{worker:03d}{i:09d}",
+                            insured_name="Concurrent Writer",
+                            premium_amount=1500.0,
+                            premium_currency="GBP",
+                            period_start_date="2025-01-01",
+                            period_end_date="2025-12-31",
+                            status="pending",
+                            policy_type="Property",
+                        )
+                    )
+                    record("writes")
+                except OperationalError:
+                    record("errors")
+            i += 1
+
+    def reader():
+        while time.perf_counter() < deadline:
+            with Session() as session:
+                service = PolicyService(SQLPolicyRepository(session))
+                try:
+                    service.list_policies_page(PolicyFilterDTO(), limit=50)
+                    record("reads")
+                except OperationalError:
+                    record("errors")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "writes_per_sec": round(counts["writes"] / seconds, 1),
+        "reads_per_sec": round(counts["reads"] / seconds, 1),
+        "lock_errors": counts["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Concurrent write throughput benchmark"
+    )
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    results = {"writers": args.writers, "readers": args.readers}
+    engines = {
+        "default": lambda url: create_engine(
+            url, connect_args={"check_same_thread": False}
+        ),
+        "tuned": lambda url: create_db_engine(Settings(), url=url),
+    }
+    for name, build in engines.items():
+        book, _ = create_book(args.count)
+        engine = build(str(book.url))
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        results[name] = run(Session, args.writers, args.readers, args.seconds)
+        engine.dispose()
+        drop_book(book)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
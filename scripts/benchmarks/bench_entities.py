@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Memory and hydration throughput of policy entities (1M by default).
+
+Hydrates the same synthetic rows three ways and reports policies/sec and
+retained bytes per policy for each:
+
+* legacy: __dict__-backed entity and unslotted, always-validating value
+  objects, as the domain model was before slots were introduced
+* validated: the current slotted classes through their validating constructors
+* trusted: PolicyDbMapper.to_domain, which hydrates stored rows without
+  re-validating them
+
+    python scripts/benchmarks/bench_entities.py --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from _common import insured_name
+
+from app.policy_management.domain.entities import Policy, PolicyStatus, PolicyType
+from app.policy_management.domain.value_objects import Money, Period, PolicyNumber
+from app.policy_management.infrastructure.mappers import PolicyDbMapper
+
+Row = namedtuple(
+    "Row",
+    "id policy_number insured_name premium_amount premium_currency "
+    "period_start_date period_end_date updated_at",
+)
+
+
+@dataclass(frozen=True)
+class LegacyMoney:
+    amount: float
+    currency: str = "GBP"
+
+    def __post_init__(self):
+        if self.amount < 0:
+            raise ValueError("Amount cannot be negative")
+        if not self.currency.isalpha() or len(self.currency) != 3:
+            raise ValueError("Currency must be a 3-letter ISO code")
+
+
+@dataclass(frozen=True)
+class LegacyPolicyNumber:
+    value: str
+
+    def __post_init__(self):
+        if not self.value or len(self.value.strip()) < 5:
+            raise ValueError("Policy number must be at least 5 characters long")
+        if not self.value.isalnum():
+            raise ValueError("Policy number must be alphanumeric")
+
+
+@dataclass(frozen=True)
+class LegacyPeriod:
+    start_date: date
+    end_date: date
+
+    def __post_init__(self):
+        if not isinstance(self.start_date, date) or not isinstance(self.end_date, date):
+            raise TypeError("start_date and end_date must be datetime instances")
+        if self.end_date <= self.start_date:
+            raise ValueError("End date must be after start date")
+
+
+class LegacyPolicy:
+    def __init__(
+        self,
+        policy_number,
+        insured_name,
+        premium,
+        period,
+        status,
+        policy_type,
+        id,
+        updated_at,
+    ):
+        self.id = id
+        self.policy_number = policy_number
+        self.insured_name = insured_name
+        self.premium = premium
+        self.status = status
+        self.policy_type = policy_type
+        self.period = period
+        self.updated_at = updated_at
+
+
+def legacy(row):
+    return LegacyPolicy(
+        LegacyPolicyNumber(row.policy_number),
+        row.insured_name,
+        LegacyMoney(row.premium_amount, row.premium_currency),
+        LegacyPeriod(row.period_start_date, row.period_end_date),
+        PolicyStatus("active"),
+        PolicyType("Marine"),
+        row.id,
+        row.updated_at,
+    )
+
+
+def validated(row):
+    return Policy(
+        policy_number=PolicyNumber(row.policy_number),
+        insured_name=row.insured_name,
+        premium=Money(row.premium_amount, row.premium_currency),
+        period=Period(row.period_start_date, row.period_end_date),
+        status=PolicyStatus("active"),
+        policy_type=PolicyType("Marine"),
+        id=row.id,
+        updated_at=row.updated_at,
+    )
+
+
+def trusted(row):
+    return PolicyDbMapper.to_domain(row, "active", "Marine")
+
+
+def make_rows(count):
+    start = date(2024, 1, 1)
+    written = datetime(2024, 6, 1)
+    rows = []
+    for i in range(count):
+        period_start = start + timedelta(days=i % 365)
+        rows.append(
+            Row(
+                i + 1,
+                f"BENCH{i:09d}",
+                insured_name(i),
+                500.0 + (i % 997) * 25.5,
+                ("GBP", "USD", "EUR")[i % 3],
+                period_start,
+                period_start + timedelta(days=365),
+                written,
+            )
+        )
+    return rows
+
+
+def measure(hydrate, rows):
+    gc.collect()
+    started = time.perf_counter()
+    policies = [hydrate(row) for row in rows]
+    seconds = time.perf_counter() - started
+    del policies
+    gc.collect()
+
+    # Row fields are shared with the entities, so only the wrappers are counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    policies = [hydrate(row) for row in rows]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del policies
+    return {
+        "policies_per_sec": round(len(rows) / seconds),
+        "bytes_per_policy": round(retained / len(rows)),
+        "retained_mib": round(retained / 2**20, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Entity memory and hydration benchmark"
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.count)
+    results = {"policies": args.count}
+    for name, hydrate in (
+        ("legacy", legacy),
+        ("validated", validated),
+        ("trusted", trusted),
+    ):
+        results[name] = measure(hydrate, rows)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
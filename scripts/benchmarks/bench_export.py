@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: streaming export vs building the full policy list.
+
+Measures the peak Python heap (tracemalloc) while serializing the whole book
+through the streaming NDJSON exporter and through the old list_all_policies +
+to_dict path, for several book sizes. The streaming peak should stay flat.
+
+    python scripts/benchmarks/bench_export.py --sizes 10000 50000 100000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from _common import create_book, drop_book
+
+from app.policy_management.api.schemas import PolicyFilterDTO
+from app.policy_management.application.exporters import ExportFormat, iter_export
+from app.policy_management.application.mappers import PolicyDtoMapper
+from app.policy_management.application.policy_services import PolicyService
+from app.policy_management.infrastructure.policy_repository import SQLPolicyRepository
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 3),
+        "peak_mb": round(peak / 2**20, 2),
+        "bytes": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming export memory benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        engine, Session = create_book(size)
+
+        def streamed():
+            with Session() as session:
+                service = PolicyService(SQLPolicyRepository(session))
+                policies = service.export_policies(PolicyFilterDTO())
+                return sum(
+                    len(chunk) for chunk in iter_export(policies, ExportFormat.NDJSON)
+                )
+
+        def materialized():
+            with Session() as session:
+                service = PolicyService(SQLPolicyRepository(session))
+                rows = [PolicyDtoMapper.to_dict(p) for p in service.list_policies()]
+                return len(json.dumps(rows))
+
+        results.append(
+            {
+                "rows": size,
+                "streamed": measure(streamed),
+                "materialized": measure(materialized),
+            }
+        )
+        drop_book(engine)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Policy listing payload formats: size and encode time per representation.
+
+Builds policies in memory (100k by default) and, for every representation the
+list API can negotiate (JSON, columnar JSON and MessagePack when installed),
+reports best of --repeat:
+
+* encode: Policy entities to response bytes (mapping included)
+* decode: bytes back to Python objects, as a consumer would
+* raw and gzipped payload size, and the time CompressionMiddleware would
+  spend gzipping the body at --level
+
+    python scripts/benchmarks/bench_formats.py --count 100000 --repeat 5
+"""
+
+import argparse
+import gzip
+import json
+
+import orjson
+
+from bench_serialization import best_of, make_policies
+
+from app.policy_management.api.representations import (
+    COLUMNAR,
+    JSON,
+    MSGPACK,
+    OFFERED,
+    encode_policies,
+)
+
+DECODERS = {JSON: orjson.loads, COLUMNAR: orjson.loads}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Policy listing format benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--level", type=int, default=6, help="gzip compression level")
+    args = parser.parse_args()
+
+    if MSGPACK in OFFERED:
+        import msgpack
+
+        DECODERS[MSGPACK] = msgpack.unpackb
+
+    policies = make_policies(args.count)
+    results = {"policies": args.count, "gzip_level": args.level, "formats": {}}
+    json_size = None
+    for media_type in OFFERED:
+        encode, body = best_of(args.repeat, encode_policies, policies, media_type)
+        decode, _ = best_of(args.repeat, DECODERS[media_type], body)
+        compress, compressed = best_of(
+            args.repeat, lambda: gzip.compress(body, compresslevel=args.level, mtime=0)
+        )
+        json_size = json_size or len(body)
+        results["formats"][media_type] = {
+            "encode_ms": round(encode * 1000, 1),
+            "decode_ms": round(decode * 1000, 1),
+            "bytes": len(body),
+            "relative_size": round(len(body) / json_size, 3),
+            "gzip_bytes": len(compressed),
+            "gzip_ms": round(compress * 1000, 1),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
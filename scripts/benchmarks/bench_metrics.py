@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Instrumentation overhead benchmark for the /metrics middleware.
+
+Measures, best of --repeat:
+
+* the time MetricsMiddleware adds to a request around a trivial ASGI app,
+  compared with REQUEST_OVERHEAD_BUDGET_SECONDS
+* the time the SQL listeners add to each statement (SELECT 1 on SQLite)
+* end-to-end GET /api/v1/policies/ latency through TestClient with metrics
+  enabled and disabled, on a book of --count policies
+
+    python scripts/benchmarks/bench_metrics.py --requests 20000 --count 10000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from unittest import mock
+
+from sqlalchemy import create_engine
+
+from _common import create_book, drop_book, make_client
+
+from app.policy_management.api.config import Settings
+from app.policy_management.api.metrics import (
+    REQUEST_OVERHEAD_BUDGET_SECONDS,
+    HttpMetrics,
+    MetricsMiddleware,
+)
+from app.policy_management.infrastructure.query_metrics import (
+    engines_instrumented,
+    instrument_engines,
+)
+
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def receive():
+    return {"type": "http.request"}
+
+
+async def send(message):
+    pass
+
+
+def asgi_per_request(app, requests):
+    async def run():
+        started = time.perf_counter()
+        for _ in range(requests):
+            await app({"type": "http", "method": "GET"}, receive, send)
+        return (time.perf_counter() - started) / requests
+
+    return asyncio.run(run())
+
+
+def statement_time(engine, statements):
+    with engine.connect() as connection:
+        started = time.perf_counter()
+        for _ in range(statements):
+            connection.exec_driver_sql("SELECT 1").scalar()
+        return (time.perf_counter() - started) / statements
+
+
+def client_per_request(client, requests):
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get("/api/v1/policies/?limit=20")
+    return (time.perf_counter() - started) / requests
+
+
+def client_with_metrics(Session, enabled):
+    """TestClient built with METRICS_ENABLED overridden
+
+    Settings reads the environment once at import, so the flag is patched on
+    the class rather than set in os.environ.
+    """
+    with mock.patch.object(Settings, "metrics_enabled", enabled):
+        client = make_client(Session)
+    assert (client.app.state.metrics is not None) == enabled
+    return client
+
+
+def microseconds(seconds):
+    return round(seconds * 1e6, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Metrics instrumentation overhead benchmark"
+    )
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bare = min(asgi_per_request(endpoint, args.requests) for _ in range(args.repeat))
+    wrapped = MetricsMiddleware(endpoint, HttpMetrics())
+    instrumented = min(
+        asgi_per_request(wrapped, args.requests) for _ in range(args.repeat)
+    )
+
+    # Listeners are attached to the Engine class and cannot be removed, so
+    # everything measured without them has to run first
+    engine = create_engine("sqlite://")
+    engine_book, Session = create_book(args.count)
+    # Each client is entered once so all its requests share one event loop;
+    # a new loop per request leaks anyio state and slows every later request
+    with client_with_metrics(Session, False) as plain_client:
+        assert not engines_instrumented(), "SQL listeners attached before the baseline"
+        assert plain_client.get("/metrics").status_code == 404
+        statement_plain = min(
+            statement_time(engine, args.requests) for _ in range(args.repeat)
+        )
+        client_plain = min(
+            client_per_request(plain_client, 500) for _ in range(args.repeat)
+        )
+
+    instrument_engines()
+    with client_with_metrics(Session, True) as metrics_client:
+        assert metrics_client.get("/metrics").status_code == 200
+        statement_counted = min(
+            statement_time(engine, args.requests) for _ in range(args.repeat)
+        )
+        client_counted = min(
+            client_per_request(metrics_client, 500) for _ in range(args.repeat)
+        )
+
+    overhead = instrumented - bare
+    results = {
+        "middleware_overhead_us": microseconds(overhead),
+        "budget_us": microseconds(REQUEST_OVERHEAD_BUDGET_SECONDS),
+        "within_budget": overhead < REQUEST_OVERHEAD_BUDGET_SECONDS,
+        "statement_overhead_us": microseconds(statement_counted - statement_plain),
+        "list_request_us": {
+            "metrics_disabled": microseconds(client_plain),
+            "metrics_enabled": microseconds(client_counted),
+        },
+    }
+
+    drop_book(engine_book)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Search latency benchmark: FTS5 trigram index vs unindexed LIKE scans.
+
+Builds a synthetic book (1M policies by default) and times first-page
+searches for a few query shapes through the repository, once with the
+dialect's search backend and once with the plain LIKE fallback. Reports
+p50/p95 latency per query in milliseconds.
+
+    python scripts/benchmarks/bench_search.py --count 1000000 --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from _common import create_book, drop_book
+
+from app.policy_management.infrastructure import policy_statements as statements
+from app.policy_management.infrastructure.search import SearchBackend, search_backend
+
+QUERIES = {
+    "prefix": ("harb", False),
+    "two_terms": ("harbour shipping", False),
+    "selective": ("meridian aviation partners 42", False),
+    "fuzzy": ("harbur shiping", True),
+}
+
+
+def time_query(Session, backend, query, fuzzy, limit, repeat):
+    timings = []
+    with Session() as session:
+        for _ in range(repeat):
+            statement = backend.apply(statements.select_policies(), query, fuzzy)
+            started = time.perf_counter()
+            rows = session.scalars(statement.limit(limit + 1)).all()
+            timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "matches_on_page": min(len(rows), limit),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[max(int(len(timings) * 0.95) - 1, 0)] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Insured-name search latency benchmark"
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    engine, Session = create_book(args.count)
+    build_seconds = time.perf_counter() - started
+
+    backends = {"indexed": search_backend(engine.dialect), "like_scan": SearchBackend()}
+    results = {"policies": args.count, "build_seconds": round(build_seconds, 1)}
+    for name, (query, fuzzy) in QUERIES.items():
+        results[name] = {"query": query, "fuzzy": fuzzy}
+        for label, backend in backends.items():
+            # The LIKE fallback has no notion of fuzzy matching
+            if fuzzy and label == "like_scan":
+                continue
+            results[name][label] = time_query(
+                Session, backend, query, fuzzy, args.limit, args.repeat
+            )
+
+    drop_book(engine)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Serialization micro-benchmark: the original to_dict + FastAPI encoding path vs
+the fast serializer + orjson.
+
+Builds policies in memory (100k by default) and times, best of --repeat:
+
+* mapping only: the original PolicyDtoMapper.to_dict vs serializers.policy_to_dict
+* encoding only: response-model validation + jsonable_encoder + stdlib json
+  (what FastAPI does for a List[Dict[str, Any]] route) vs orjson
+* end to end: both steps together
+
+    python scripts/benchmarks/bench_serialization.py --count 100000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from _common import insured_name
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.policy_management.api.responses import dump_json
+from app.policy_management.application.serializers import policies_to_dicts
+from app.policy_management.domain.entities import Policy, PolicyStatus, PolicyType
+from app.policy_management.domain.value_objects import Money, Period, PolicyNumber
+
+RESPONSE_MODEL = TypeAdapter(List[Dict[str, Any]])
+
+
+def legacy_to_dict(policy):
+    """PolicyDtoMapper.to_dict as it was before the fast serializer"""
+    currency_map = {"USD": "$", "GBP": "£", "EUR": "€", "JPY": "¥"}
+
+    symbol = currency_map.get(policy.premium.currency, policy.premium.currency)
+    premium_amount = policy.premium.amount
+
+    if isinstance(premium_amount, float) or (
+        isinstance(premium_amount, Decimal) and premium_amount == int(premium_amount)
+    ):
+        formatted_amount = f"{int(premium_amount):,}"
+    else:
+        formatted_amount = f"{premium_amount:,.2f}"
+
+    def format_date(d):
+        return d.strftime("%d/%m/%Y")
+
+    return {
+        "id": policy.id,
+        "policy_number": policy.policy_number.value,
+        "insured_name": policy.insured_name,
+        "premium": f"{symbol}{formatted_amount}",
+        "status": policy.status.value.capitalize(),
+        "policy_type": policy.policy_type.value,
+        "start_date": format_date(policy.period.start_date),
+        "end_date": format_date(policy.period.end_date),
+    }
+
+
+def legacy_encode(rows):
+    return json.dumps(
+        jsonable_encoder(RESPONSE_MODEL.validate_python(rows)),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def make_policies(count):
+    statuses = list(PolicyStatus)
+    types = list(PolicyType)
+    start = date(2024, 1, 1)
+    policies = []
+    for i in range(count):
+        period_start = start + timedelta(days=i % 365)
+        policies.append(
+            Policy(
+                policy_number=PolicyNumber(f"BENCH{i:09d}"),
+                insured_name=insured_name(i),
+                premium=Money(500.0 + (i % 997) * 25.5, ("GBP", "USD", "EUR")[i % 3]),
+                period=Period(period_start, period_start + timedelta(days=365)),
+                status=statuses[i % len(statuses)],
+                policy_type=types[i % len(types)],
+                id=i + 1,
+            )
+        )
+    return policies
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Policy serialization micro-benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    policies = make_policies(args.count)
+
+    legacy_map, legacy_rows = best_of(
+        args.repeat, lambda: [legacy_to_dict(policy) for policy in policies]
+    )
+    fast_map, fast_rows = best_of(args.repeat, policies_to_dicts, policies)
+    assert legacy_rows == fast_rows
+
+    legacy_enc, legacy_body = best_of(args.repeat, legacy_encode, legacy_rows)
+    fast_enc, fast_body = best_of(args.repeat, dump_json, fast_rows)
+    assert json.loads(legacy_body) == json.loads(fast_body)
+
+    results = {"policies": args.count}
+    for stage, legacy, fast in (
+        ("map", legacy_map, fast_map),
+        ("encode", legacy_enc, fast_enc),
+        ("end_to_end", legacy_map + legacy_enc, fast_map + fast_enc),
+    ):
+        results[stage] = {
+            "legacy_ms": round(legacy * 1000, 1),
+            "fast_ms": round(fast * 1000, 1),
+            "speedup": round(legacy / fast, 1),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
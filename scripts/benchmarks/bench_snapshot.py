@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Analytics benchmark: columnar snapshot vs SQL aggregation vs Policy objects.
+
+Builds a synthetic book (1M policies by default), loads it into a
+PolicyBookSnapshot and times, best of --repeat:
+
+* counts/premium by type, status and currency: snapshot bincount vs SQL
+  GROUP BY vs a Python loop over hydrated Policy objects
+* a filtered premium histogram and a 12-bucket expiry ladder on the snapshot
+
+    python scripts/benchmarks/bench_snapshot.py --count 1000000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import func, select
+
+from _common import create_book, drop_book
+
+from app.policy_management.domain.entities import PolicyType
+from app.policy_management.domain.repository import PolicyFilter
+from app.policy_management.infrastructure.models import PolicyModel
+from app.policy_management.infrastructure.policy_repository import SQLPolicyRepository
+from app.policy_management.infrastructure.policy_snapshot import PolicyBookSnapshot
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return round(min(timings) * 1000, 1)
+
+
+def sql_group_by(Session):
+    with Session() as session:
+        return session.execute(
+            select(
+                PolicyModel.type_id,
+                PolicyModel.status_id,
+                PolicyModel.premium_currency,
+                func.count(),
+                func.sum(PolicyModel.premium_amount),
+            ).group_by(
+                PolicyModel.type_id, PolicyModel.status_id, PolicyModel.premium_currency
+            )
+        ).all()
+
+
+def object_group_by(policies):
+    totals = defaultdict(lambda: [0, 0.0])
+    for policy in policies:
+        group = totals[(policy.policy_type, policy.status, policy.premium.currency)]
+        group[0] += 1
+        group[1] += policy.premium.amount
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Columnar snapshot analytics benchmark"
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine, Session = create_book(args.count)
+
+    with Session() as session:
+        started = time.perf_counter()
+        snapshot = PolicyBookSnapshot.load(session)
+        load_ms = round((time.perf_counter() - started) * 1000, 1)
+        policies = SQLPolicyRepository(session).list_all_policies()
+
+    everything = snapshot.filter_mask(PolicyFilter())
+    marine = PolicyFilter(
+        policy_type=PolicyType.MARINE, currency="GBP", min_premium=1000
+    )
+    results = {
+        "policies": args.count,
+        "snapshot": {**snapshot.describe(), "load_ms": load_ms},
+        "group_by_ms": {
+            "snapshot": best_of(
+                args.repeat,
+                snapshot.group_totals,
+                ["policy_type", "status"],
+                everything,
+            ),
+            "sql": best_of(args.repeat, sql_group_by, Session),
+            "policy_objects": best_of(args.repeat, object_group_by, policies),
+        },
+        "filtered_histogram_ms": best_of(
+            args.repeat,
+            lambda: snapshot.premium_histogram(50, snapshot.filter_mask(marine)),
+        ),
+        "expiry_ladder_ms": best_of(
+            args.repeat, snapshot.expiry_ladder, date(2024, 6, 1), 30, 12, everything
+        ),
+    }
+    results["snapshot"].pop("loaded_at")
+
+    drop_book(engine)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Concurrent load generator for the policy API.
+
+Runs a weighted mix of list, get-by-number, create and activate requests over
+a pooled httpx.AsyncClient and prints latency percentiles, throughput and
+error rates as JSON.
+
+* closed loop (default): --concurrency workers each send their next request
+  as soon as the previous one completes
+* open loop: requests arrive at --rate per second (Poisson arrivals) whatever
+  the response times; latency is measured from the scheduled arrival, and
+  arrivals finding --concurrency requests already in flight are dropped
+
+    python scripts/load_generator.py --url http://localhost:8000 --duration 30 --concurrency 50
+    python scripts/load_generator.py --in-process --mode open --rate 200 --profile mixed
+    python scripts/load_generator.py --in-process --mix list=1,get=3 --requests 5000
+
+--in-process serves requests from create_app() through httpx's ASGI transport,
+so no server or network is needed, on a temporary SQLite database that is
+deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+
+SCENARIOS = ("list", "get", "create", "activate")
+
+# Relative weights of each scenario
+PROFILES = {
+    "read-heavy": {"list": 20, "get": 70, "create": 7, "activate": 3},
+    "mixed": {"list": 25, "get": 45, "create": 20, "activate": 10},
+    "write-heavy": {"list": 10, "get": 20, "create": 45, "activate": 25},
+}
+
+API = "/api/v1/policies"
+
+
+@dataclass
+class LoadConfig:
+    """What to send and how fast
+
+    The run stops after `duration` seconds or `requests` requests, whichever
+    is set (both: whichever comes first).
+    """
+
+    profile: dict = field(default_factory=lambda: dict(PROFILES["read-heavy"]))
+    concurrency: int = 10
+    duration: float | None = 10.0
+    requests: int | None = None
+    mode: str = "closed"
+    rate: float = 100.0
+    timeout: float = 10.0
+    seed: int = 1
+    setup_policies: int = 100
+    page_size: int = 50
+
+    def __post_init__(self):
+        unknown = set(self.profile) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        if sum(self.profile.values()) <= 0 or min(self.profile.values()) < 0:
+            raise ValueError(
+                "Scenario weights must be non-negative with a positive sum"
+            )
+        if self.mode not in ("closed", "open"):
+            raise ValueError("mode must be 'closed' or 'open'")
+        if self.duration is None and self.requests is None:
+            raise ValueError("Set a duration, a request count or both")
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    ordered = sorted(latencies)
+    return {
+        f"{name}_ms": round(value * 1000, 2)
+        for name, value in (
+            ("p50", percentile(ordered, 50)),
+            ("p95", percentile(ordered, 95)),
+            ("p99", percentile(ordered, 99)),
+            ("max", ordered[-1] if ordered else 0.0),
+        )
+    }
+
+
+def make_client(
+    base_url=None, app=None, concurrency=10, timeout=10.0
+) -> httpx.AsyncClient:
+    """Pooled client for a server URL, or an in-process one for an ASGI app"""
+    if app is not None:
+        return httpx.AsyncClient(app=app, base_url="http://loadtest", timeout=timeout)
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout)
+
+
+class LoadGenerator:
+    """Drives one load test through a client and collects the results"""
+
+    def __init__(self, client: httpx.AsyncClient, config: LoadConfig):
+        self.client = client
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.scenarios = list(config.profile)
+        self.weights = [config.profile[name] for name in self.scenarios]
+        # Policy numbers created by this run are unique to it
+        self.prefix = f"LT{int(time.time() * 1000) % 10**9:09d}"
+        self.created = 0
+        self.known = []
+        self.pending = []
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.statuses = defaultdict(Counter)
+        self.skipped = Counter()
+        self.dropped = 0
+
+    def _policy(self) -> dict:
+        self.created += 1
+        today = date.today()
+        return {
+            "policy_number": f"{self.prefix}{self.created:07d}",
+            "insured_name": f"Load Test Insured {self.created}",
+            "premium_amount": round(self.rng.uniform(100, 50_000), 2),
+            "premium_currency": self.rng.choice(["GBP", "USD", "EUR"]),
+            "period_start_date": (today - timedelta(days=1)).isoformat(),
+            "period_end_date": (today + timedelta(days=365)).isoformat(),
+            "status": "pending",
+            "policy_type": self.rng.choice(
+                ["Property", "Casualty", "Marine", "Construction"]
+            ),
+        }
+
+    async def setup(self) -> None:
+        """Collect existing policy numbers and create pending policies to activate"""
+        response = await self.client.get(f"{API}/", params={"limit": 500})
+        response.raise_for_status()
+        self.known = [policy["policy_number"] for policy in response.json()]
+        remaining = self.config.setup_policies
+        while remaining > 0:
+            policies = [self._policy() for _ in range(min(remaining, 500))]
+            response = await self.client.post(
+                f"{API}/batch", json={"policies": policies}
+            )
+            response.raise_for_status()
+            numbers = [policy["policy_number"] for policy in policies]
+            self.pending.extend(numbers)
+            self.known.extend(numbers)
+            remaining -= len(policies)
+
+    def _request(self, scenario: str):
+        """(method, url, json body, query params), or None when it cannot run yet"""
+        if scenario == "list":
+            return "GET", f"{API}/", None, {"limit": self.config.page_size}
+        if scenario == "get":
+            if not self.known:
+                return None
+            return "GET", f"{API}/{self.rng.choice(self.known)}", None, None
+        if scenario == "create":
+            return "POST", f"{API}/", self._policy(), None
+        if not self.pending:
+            return None
+        return "POST", f"{API}/{self.pending.pop()}/activate", None, None
+
+    async def issue(self, scenario: str, started: float | None = None) -> None:
+        """Send one request of the scenario and record its outcome"""
+        request = self._request(scenario)
+        if request is None:
+            self.skipped[scenario] += 1
+            return
+        method, url, body, params = request
+        started = time.perf_counter() if started is None else started
+        try:
+            response = await self.client.request(method, url, json=body, params=params)
+            status = str(response.status_code)
+            failed = response.status_code >= 400
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+            failed = True
+        self.latencies[scenario].append(time.perf_counter() - started)
+        self.statuses[scenario][status] += 1
+        if failed:
+            self.errors[scenario] += 1
+        elif scenario == "create":
+            self.known.append(body["policy_number"])
+            self.pending.append(body["policy_number"])
+
+    def _pick(self) -> str:
+        return self.rng.choices(self.scenarios, self.weights)[0]
+
+    async def _closed_loop(self, deadline: float, budget: list) -> None:
+        async def worker():
+            while time.perf_counter() < deadline and budget[0] > 0:
+                budget[0] -= 1
+                await self.issue(self._pick())
+
+        await asyncio.gather(*(worker() for _ in range(self.config.concurrency)))
+
+    async def _open_loop(self, deadline: float, budget: list) -> None:
+        in_flight = set()
+        next_arrival = time.perf_counter()
+        while next_arrival < deadline and budget[0] > 0:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            budget[0] -= 1
+            if len(in_flight) >= self.config.concurrency:
+                self.dropped += 1
+            else:
+                task = asyncio.create_task(
+                    self.issue(self._pick(), started=next_arrival)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_arrival += self.rng.expovariate(self.config.rate)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def run(self) -> dict:
+        """Run the load test and return the report"""
+        config = self.config
+        started = time.perf_counter()
+        deadline = (
+            started + config.duration if config.duration is not None else math.inf
+        )
+        budget = [config.requests if config.requests is not None else math.inf]
+        if config.mode == "open":
+            await self._open_loop(deadline, budget)
+        else:
+            await self._closed_loop(deadline, budget)
+        return self.report(time.perf_counter() - started)
+
+    def report(self, elapsed: float) -> dict:
+        completed = sum(len(latencies) for latencies in self.latencies.values())
+        errors = sum(self.errors.values())
+        all_latencies = [
+            value for values in self.latencies.values() for value in values
+        ]
+        return {
+            "mode": self.config.mode,
+            "concurrency": self.config.concurrency,
+            "target_rate": self.config.rate if self.config.mode == "open" else None,
+            "profile": self.config.profile,
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": completed,
+            "errors": errors,
+            "error_rate": round(errors / completed, 4) if completed else 0.0,
+            "dropped": self.dropped,
+            "throughput_rps": round(completed / elapsed, 1) if elapsed else 0.0,
+            "latency": latency_summary(all_latencies),
+            "scenarios": {
+                scenario: {
+                    "requests": len(self.latencies[scenario]),
+                    "errors": self.errors[scenario],
+                    "skipped": self.skipped[scenario],
+                    "statuses": dict(self.statuses[scenario]),
+                    "latency": latency_summary(self.latencies[scenario]),
+                }
+                for scenario in self.scenarios
+            },
+        }
+
+
+async def run_load_test(config: LoadConfig, base_url=None, app=None) -> dict:
+    """Set up and run one load test against a server URL or an ASGI app"""
+    async with make_client(base_url, app, config.concurrency, config.timeout) as client:
+        generator = LoadGenerator(client, config)
+        await generator.setup()
+        return await generator.run()
+
+
+def parse_profile(profile: str, mix: str | None) -> dict:
+    if not mix:
+        return dict(PROFILES[profile])
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Load test options, shared with automated_health_check.py --load"""
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="read-heavy")
+    parser.add_argument(
+        "--mix", help="explicit weights, e.g. list=1,get=6,create=2,activate=1"
+    )
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--rate", type=float, default=100.0, help="arrivals/sec in open mode"
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--requests", type=int, help="stop after this many requests")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--setup-policies", type=int, default=100)
+    parser.add_argument(
+        "--in-process", action="store_true", help="serve from create_app()"
+    )
+
+
+def config_from_args(args) -> LoadConfig:
+    return LoadConfig(
+        profile=parse_profile(args.profile, args.mix),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        requests=args.requests,
+        mode=args.mode,
+        rate=args.rate,
+        timeout=args.timeout,
+        seed=args.seed,
+        setup_policies=args.setup_policies,
+    )
+
+
+@contextmanager
+def in_process_app():
+    """create_app() on a throwaway SQLite database, removed afterwards
+
+    The generated policies never reach the configured database. Requests
+    always use sync sessions, whatever ASYNC_DB says.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.policy_management.api.app_factory import create_app
+    from app.policy_management.api.dependencies import get_policy_service
+    from app.policy_management.infrastructure.db import Base, get_db
+    from app.policy_management.infrastructure.seed_data import seed_statuses_and_types
+
+    with tempfile.TemporaryDirectory(prefix="load-test-") as directory:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(directory, 'policies.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with Session() as db:
+            seed_statuses_and_types(db)
+
+        def get_load_test_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = create_app(testing=True)
+        app.dependency_overrides.pop(get_policy_service, None)
+        app.dependency_overrides[get_db] = get_load_test_db
+        try:
+            yield app
+        finally:
+            engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Policy API load generator")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        config = config_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    with in_process_app() if args.in_process else nullcontext() as app:
+        report = asyncio.run(run_load_test(config, base_url=args.url, app=app))
+    print(json.dumps(report, indent=2))
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Maintenance commands for the portfolio summary table.
+
+    python scripts/portfolio_summary.py check     # report drifted groups, exit 1 if any
+    python scripts/portfolio_summary.py rebuild   # recompute every group from the policies
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.policy_management.infrastructure.db import create_tables, engine
+from app.policy_management.infrastructure.summary import summary_backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Portfolio summary maintenance")
+    parser.add_argument("command", choices=["check", "rebuild"])
+    args = parser.parse_args()
+
+    # Creates the summary table and its triggers on databases that predate them
+    create_tables()
+    backend = summary_backend(engine.dialect)
+    with engine.begin() as connection:
+        if args.command == "rebuild":
+            groups = backend.rebuild(connection)
+            print(f"Rebuilt policy_summary: {groups} groups")
+            return 0
+
+        discrepancies = backend.check(connection)
+    for discrepancy in discrepancies:
+        print(
+            f"type_id={discrepancy.type_id} status_id={discrepancy.status_id} "
+            f"currency={discrepancy.currency}: expected (count, minor units) "
+            f"{discrepancy.expected}, found {discrepancy.actual}"
+        )
+    print(f"{len(discrepancies)} inconsistent groups")
+    return 1 if discrepancies else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
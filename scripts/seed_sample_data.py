@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Seed the configured database with the sample policy book.
+
+    python scripts/seed_sample_data.py           # add any missing sample policies
+    python scripts/seed_sample_data.py --reset   # delete ALL data, then reseed
+
+Application startup never seeds or deletes data; it only brings the schema and
+lookup tables up to date, so this command is the explicit way to get sample data.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.policy_management.infrastructure.db import (
+    SessionLocal,
+    initialize_database,
+    seed_initial_data,
+)
+from app.policy_management.infrastructure.seed_data import (
+    get_seeding_summary,
+    seed_database,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample policy seeding")
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="delete every policy, status and type before seeding",
+    )
+    args = parser.parse_args()
+
+    if args.reset:
+        initialize_database()
+        with SessionLocal() as session:
+            seed_database(session)
+    else:
+        seed_initial_data()
+
+    with SessionLocal() as session:
+        get_seeding_summary(session)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())